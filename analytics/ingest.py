@@ -0,0 +1,274 @@
+"""
+Buffered ingestion of tracking beacons.
+
+The click/navigation endpoints only validate a beacon and append it to a
+bounded in-process buffer; a background thread bulk-inserts the buffered
+events into ``TrackingEvent`` (and bumps their ``ClickRollup`` counters)
+every ``ANALYTICS_FLUSH_BATCH_SIZE`` events or every
+``ANALYTICS_FLUSH_INTERVAL_MS`` milliseconds, whichever comes first.
+
+When the buffer is full new events are dropped and counted rather than
+blocking the web worker.  Set ``ANALYTICS_INGEST_SYNC = True`` to write each
+event immediately (useful in tests and management commands).
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.utils.dateparse import parse_datetime
+
+from . import rollups
+from .models import TrackingEvent
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidEvent(ValueError):
+    """
+    Raised when a tracking beacon fails validation
+    """
+
+
+def _text(data, key, max_length, required=False):
+    value = data.get(key, '')
+    if value is None:
+        value = ''
+    if not isinstance(value, str):
+        raise InvalidEvent(f"'{key}' must be a string")
+    value = value.strip()
+    if required and not value:
+        raise InvalidEvent(f"'{key}' is required")
+    return value[:max_length]
+
+
+def _timestamp(data):
+    value = data.get('timestamp')
+    if not isinstance(value, str):
+        return None
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return None
+
+
+def _blog_click(data):
+    return _text(data, 'post_url', 500, required=True), _text(data, 'post_title', 255), {}
+
+
+def _quick_link_click(data):
+    metadata = {
+        'user_agent': _text(data, 'userAgent', 500),
+        'referrer': _text(data, 'referrer', 500),
+    }
+    return _text(data, 'url', 500, required=True), _text(data, 'title', 255), metadata
+
+
+def _hero_navigation(data):
+    return _text(data, 'destination', 500, required=True), '', {}
+
+
+def _welcome_navigation(data):
+    return _text(data, 'target', 500, required=True), '', {}
+
+
+def _highlight_interaction(data):
+    index = data.get('highlightIndex')
+    if isinstance(index, bool) or not isinstance(index, int) or index < 0:
+        raise InvalidEvent("'highlightIndex' must be a non-negative integer")
+    return f"highlight:{index}", '', {}
+
+
+EVENT_PARSERS = {
+    TrackingEvent.BLOG_CLICK: _blog_click,
+    TrackingEvent.QUICK_LINK_CLICK: _quick_link_click,
+    TrackingEvent.HERO_NAVIGATION: _hero_navigation,
+    TrackingEvent.WELCOME_NAVIGATION: _welcome_navigation,
+    TrackingEvent.HIGHLIGHT_INTERACTION: _highlight_interaction,
+}
+
+
+def build_event(kind, data):
+    """
+    Validate a beacon payload and return an unsaved ``TrackingEvent``
+    """
+    parser = EVENT_PARSERS.get(kind)
+    if parser is None:
+        raise InvalidEvent(f"Unknown event type '{kind}'")
+    if not isinstance(data, dict):
+        raise InvalidEvent("Event payload must be an object")
+
+    target, label, metadata = parser(data)
+    return TrackingEvent(
+        kind=kind,
+        target=target,
+        label=label,
+        occurred_at=_timestamp(data),
+        metadata=metadata,
+    )
+
+
+class EventBuffer:
+    """
+    Bounded FIFO of unsaved events drained by a background flusher thread
+    """
+
+    def __init__(self, capacity, batch_size, flush_interval):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._events = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+        self.accepted = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.failed = 0
+
+    def offer(self, event):
+        """
+        Queue an event without blocking; return False if it was dropped
+        """
+        with self._lock:
+            if len(self._events) >= self.capacity:
+                self.dropped += 1
+                return False
+            self._events.append(event)
+            self.accepted += 1
+            batch_ready = len(self._events) >= self.batch_size
+
+        self._ensure_flusher()
+        if batch_ready:
+            self._wakeup.set()
+        return True
+
+    def drain(self, limit):
+        with self._lock:
+            count = min(limit, len(self._events))
+            return [self._events.popleft() for _ in range(count)]
+
+    def write(self, events):
+        """
+        Bulk-insert a batch of events and bump their rollup counters,
+        counting rather than raising failures
+        """
+        if not events:
+            return 0
+        try:
+            with transaction.atomic():
+                TrackingEvent.objects.bulk_create(events, batch_size=self.batch_size)
+                rollups.increment(events)
+        except DatabaseError:
+            logger.exception("Failed to write %d tracking events", len(events))
+            with self._lock:
+                self.failed += len(events)
+            return 0
+        with self._lock:
+            self.flushed += len(events)
+        return len(events)
+
+    def flush(self):
+        """
+        Write everything currently buffered; return the number of rows written
+        """
+        written = 0
+        while True:
+            batch = self.drain(self.batch_size)
+            if not batch:
+                return written
+            written += self.write(batch)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'buffered': len(self._events),
+                'capacity': self.capacity,
+                'accepted': self.accepted,
+                'dropped': self.dropped,
+                'flushed': self.flushed,
+                'failed': self.failed,
+            }
+
+    def _ensure_flusher(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='analytics-flusher', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    """
+    Return the process-wide event buffer, creating it on first use
+    """
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = EventBuffer(
+                    capacity=getattr(settings, 'ANALYTICS_BUFFER_CAPACITY', 10_000),
+                    batch_size=getattr(settings, 'ANALYTICS_FLUSH_BATCH_SIZE', 500),
+                    flush_interval=getattr(settings, 'ANALYTICS_FLUSH_INTERVAL_MS', 2000) / 1000,
+                )
+                atexit.register(_buffer.flush)
+    return _buffer
+
+
+def _reset_after_fork():
+    # Pre-fork servers (gunicorn) must not inherit the parent's buffer,
+    # lock state or dead flusher thread.
+    global _buffer, _buffer_lock
+    _buffer = None
+    _buffer_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def record_event(kind, data):
+    """
+    Validate a beacon and hand it to the ingestion buffer.
+
+    Raises ``InvalidEvent`` for malformed payloads.  Returns False when the
+    event was dropped because the buffer is full.
+    """
+    event = build_event(kind, data)
+    if getattr(settings, 'ANALYTICS_INGEST_SYNC', False):
+        return get_buffer().write([event]) == 1
+    return get_buffer().offer(event)
+
+
+async def arecord_event(kind, data):
+    """
+    Async variant of ``record_event`` for async views
+    """
+    event = build_event(kind, data)
+    if getattr(settings, 'ANALYTICS_INGEST_SYNC', False):
+        return await sync_to_async(get_buffer().write)([event]) == 1
+    return get_buffer().offer(event)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from analytics import rollups
+
+
+class Command(BaseCommand):
+    help = "Fold aged minute click rollups into hour buckets and aged hour rollups into day buckets."
+
+    def handle(self, *args, **options):
+        folded = rollups.compact()
+        self.stdout.write(self.style.SUCCESS(f"Folded {folded} rollup rows"))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:34
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrackingEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('blog_click', 'Blog click'), ('quick_link_click', 'Quick link click'), ('hero_navigation', 'Hero navigation'), ('welcome_navigation', 'Welcome section navigation'), ('highlight_interaction', 'Highlight interaction')], max_length=32)),
+                ('target', models.CharField(help_text='URL or key that was clicked', max_length=500)),
+                ('label', models.CharField(blank=True, max_length=255)),
+                ('occurred_at', models.DateTimeField(blank=True, help_text='Client-side timestamp', null=True)),
+                ('received_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'received_at'], name='analytics_t_kind_c4717e_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClickRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('blog_click', 'Blog click'), ('quick_link_click', 'Quick link click'), ('hero_navigation', 'Hero navigation'), ('welcome_navigation', 'Welcome section navigation'), ('highlight_interaction', 'Highlight interaction')], max_length=32)),
+                ('bucket', models.DateTimeField(help_text='Start of the time bucket')),
+                ('granularity', models.CharField(choices=[('minute', 'Minute'), ('hour', 'Hour'), ('day', 'Day')], max_length=8)),
+                ('target', models.CharField(max_length=500)),
+                ('count', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'bucket', 'granularity', 'target'), name='analytics_rollup_unique_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+from django.db import models
+from django.utils import timezone
+
+
+class TrackingEvent(models.Model):
+    """
+    A single click/navigation beacon sent by the front-end.
+
+    Rows are written in bulk by the ingestion buffer in ``analytics.ingest``,
+    never one at a time on the request thread.
+    """
+
+    BLOG_CLICK = 'blog_click'
+    QUICK_LINK_CLICK = 'quick_link_click'
+    HERO_NAVIGATION = 'hero_navigation'
+    WELCOME_NAVIGATION = 'welcome_navigation'
+    HIGHLIGHT_INTERACTION = 'highlight_interaction'
+
+    KIND_CHOICES = [
+        (BLOG_CLICK, 'Blog click'),
+        (QUICK_LINK_CLICK, 'Quick link click'),
+        (HERO_NAVIGATION, 'Hero navigation'),
+        (WELCOME_NAVIGATION, 'Welcome section navigation'),
+        (HIGHLIGHT_INTERACTION, 'Highlight interaction'),
+    ]
+
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    target = models.CharField(max_length=500, help_text="URL or key that was clicked")
+    label = models.CharField(max_length=255, blank=True)
+    occurred_at = models.DateTimeField(null=True, blank=True, help_text="Client-side timestamp")
+    received_at = models.DateTimeField(default=timezone.now)
+    metadata = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['kind', 'received_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}: {self.target}"
+
+
+class ClickRollup(models.Model):
+    """
+    Pre-aggregated event counts per target and time bucket.
+
+    New events are upserted into minute buckets as they are flushed; the
+    ``compact_rollups`` management command later folds old minute buckets
+    into hour buckets and old hour buckets into day buckets, so each event
+    is counted in exactly one row.
+    """
+
+    MINUTE = 'minute'
+    HOUR = 'hour'
+    DAY = 'day'
+
+    GRANULARITY_CHOICES = [
+        (MINUTE, 'Minute'),
+        (HOUR, 'Hour'),
+        (DAY, 'Day'),
+    ]
+
+    kind = models.CharField(max_length=32, choices=TrackingEvent.KIND_CHOICES)
+    bucket = models.DateTimeField(help_text="Start of the time bucket")
+    granularity = models.CharField(max_length=8, choices=GRANULARITY_CHOICES)
+    target = models.CharField(max_length=500)
+    count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'bucket', 'granularity', 'target'],
+                name='analytics_rollup_unique_bucket',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.target} @ {self.bucket:%Y-%m-%d %H:%M} ({self.granularity}): {self.count}"
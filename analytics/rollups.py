@@ -0,0 +1,140 @@
+"""
+Time-bucketed click counters.
+
+``increment(events)`` upserts flushed events into minute buckets,
+``compact()`` folds aged minute buckets into hours and aged hour buckets into
+days, and ``top_targets()`` answers "top N targets in the last W" by summing
+the (few) bucket rows inside the window instead of scanning raw events.
+"""
+
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from .models import ClickRollup
+
+UPSERT_VENDORS = ('sqlite', 'postgresql')
+
+
+def truncate(value, granularity):
+    """
+    Return the start of the ``granularity`` bucket containing ``value``
+    """
+    value = value.replace(second=0, microsecond=0)
+    if granularity in (ClickRollup.HOUR, ClickRollup.DAY):
+        value = value.replace(minute=0)
+    if granularity == ClickRollup.DAY:
+        value = value.replace(hour=0)
+    return value
+
+
+def _upsert(granularity, counts):
+    """
+    Add ``counts`` ({(kind, target, bucket): n}) onto the matching rows
+    """
+    if not counts:
+        return
+
+    if connection.vendor in UPSERT_VENDORS:
+        table = connection.ops.quote_name(ClickRollup._meta.db_table)
+        sql = (
+            f"INSERT INTO {table} (kind, bucket, granularity, target, count) "
+            f"VALUES (%s, %s, %s, %s, %s) "
+            f"ON CONFLICT (kind, bucket, granularity, target) "
+            f"DO UPDATE SET count = {table}.count + excluded.count"
+        )
+        params = [
+            (kind, connection.ops.adapt_datetimefield_value(bucket), granularity, target, total)
+            for (kind, target, bucket), total in counts.items()
+        ]
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, params)
+        return
+
+    # Portable fallback for backends without INSERT ... ON CONFLICT
+    for (kind, target, bucket), total in counts.items():
+        updated = ClickRollup.objects.filter(
+            kind=kind, bucket=bucket, granularity=granularity, target=target
+        ).update(count=F('count') + total)
+        if not updated:
+            ClickRollup.objects.create(
+                kind=kind, bucket=bucket, granularity=granularity, target=target, count=total
+            )
+
+
+def increment(events):
+    """
+    Count a batch of ``TrackingEvent`` objects into their minute buckets
+    """
+    counts = Counter(
+        (event.kind, event.target, truncate(event.received_at, ClickRollup.MINUTE))
+        for event in events
+    )
+    _upsert(ClickRollup.MINUTE, counts)
+
+
+def _fold(source, destination, cutoff):
+    rows = (
+        ClickRollup.objects
+        .filter(granularity=source, bucket__lt=cutoff)
+        .annotate(folded_bucket=Trunc('bucket', destination))
+        .values('kind', 'target', 'folded_bucket')
+        .annotate(total=Sum('count'))
+    )
+    counts = {
+        (row['kind'], row['target'], row['folded_bucket']): row['total']
+        for row in rows
+    }
+    _upsert(destination, counts)
+    deleted, _ = ClickRollup.objects.filter(granularity=source, bucket__lt=cutoff).delete()
+    return deleted
+
+
+def compact(now=None):
+    """
+    Fold minute buckets older than ``ANALYTICS_ROLLUP_MINUTE_RETENTION_HOURS``
+    into hours and hour buckets older than
+    ``ANALYTICS_ROLLUP_HOUR_RETENTION_DAYS`` into days.
+
+    Only whole hours/days are folded, so buckets still receiving increments
+    are never touched.  Returns the number of rows folded away.
+    """
+    now = now or timezone.now()
+    minute_retention = timedelta(hours=getattr(settings, 'ANALYTICS_ROLLUP_MINUTE_RETENTION_HOURS', 2))
+    hour_retention = timedelta(days=getattr(settings, 'ANALYTICS_ROLLUP_HOUR_RETENTION_DAYS', 2))
+
+    with transaction.atomic():
+        folded = _fold(ClickRollup.MINUTE, ClickRollup.HOUR, truncate(now - minute_retention, ClickRollup.HOUR))
+        folded += _fold(ClickRollup.HOUR, ClickRollup.DAY, truncate(now - hour_retention, ClickRollup.DAY))
+    return folded
+
+
+def top_targets(window, kind=None, limit=10, now=None):
+    """
+    Return the most-clicked targets in the last ``window`` (a timedelta).
+
+    Buckets are counted whole: the window starts at the beginning of the
+    minute, hour or day bucket it begins in, so clicks shortly before the
+    window may be counted but none inside it are dropped.
+    """
+    now = now or timezone.now()
+    start = now - window
+    rollups = ClickRollup.objects.filter(reduce(or_, (
+        Q(granularity=granularity, bucket__gte=truncate(start, granularity))
+        for granularity in (ClickRollup.MINUTE, ClickRollup.HOUR, ClickRollup.DAY)
+    )))
+    if kind:
+        rollups = rollups.filter(kind=kind)
+    return list(
+        rollups
+        .values('kind', 'target')
+        .annotate(total=Sum('count'))
+        .order_by('-total', 'target')[:limit]
+    )
@@ -0,0 +1,153 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from . import rollups
+from .ingest import EventBuffer, InvalidEvent, build_event
+from .models import ClickRollup, TrackingEvent
+
+
+class EventBufferTestCase(TestCase):
+    def test_full_buffer_drops_instead_of_blocking(self):
+        """
+        Events offered while the buffer is at capacity are counted as dropped.
+        """
+        buffer = EventBuffer(capacity=2, batch_size=10, flush_interval=60)
+        buffer._ensure_flusher = lambda: None
+
+        for index in range(3):
+            buffer.offer(build_event(TrackingEvent.HIGHLIGHT_INTERACTION, {'highlightIndex': index}))
+
+        stats = buffer.stats()
+        self.assertEqual(stats['accepted'], 2)
+        self.assertEqual(stats['dropped'], 1)
+        self.assertEqual(stats['buffered'], 2)
+
+    def test_flush_bulk_inserts_in_batches(self):
+        """
+        Flushing drains the buffer into the events table.
+        """
+        buffer = EventBuffer(capacity=100, batch_size=2, flush_interval=60)
+        buffer._ensure_flusher = lambda: None
+
+        for index in range(5):
+            buffer.offer(build_event(TrackingEvent.BLOG_CLICK, {'post_url': f'/news/post-{index}/'}))
+
+        self.assertEqual(buffer.flush(), 5)
+        self.assertEqual(TrackingEvent.objects.count(), 5)
+        self.assertEqual(buffer.stats()['buffered'], 0)
+
+    def test_build_event_validates_payload(self):
+        with self.assertRaises(InvalidEvent):
+            build_event(TrackingEvent.QUICK_LINK_CLICK, {'title': 'Library'})
+        with self.assertRaises(InvalidEvent):
+            build_event('page_view', {'url': '/'})
+
+
+@override_settings(ANALYTICS_INGEST_SYNC=True)
+class TrackingEndpointTestCase(TestCase):
+    def test_quick_link_click_is_stored(self):
+        response = self.client.post(
+            '/api/quick-links-click/',
+            data=json.dumps({'title': 'Library', 'url': '/library', 'timestamp': '2025-11-13T10:00:00Z'}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        event = TrackingEvent.objects.get()
+        self.assertEqual(event.kind, TrackingEvent.QUICK_LINK_CLICK)
+        self.assertEqual(event.target, '/library')
+        self.assertEqual(event.label, 'Library')
+        self.assertIsNotNone(event.occurred_at)
+
+    def test_invalid_event_is_rejected(self):
+        response = self.client.post(
+            '/api/blog/click/',
+            data=json.dumps({'post_title': 'Missing URL'}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(TrackingEvent.objects.exists())
+
+    def test_batch_endpoint_returns_per_item_results(self):
+        events = [
+            {'type': 'blog_click', 'post_url': '/news/open-house/', 'post_title': 'Open House'},
+            {'type': 'hero_navigation', 'destination': '/academics'},
+            {'type': 'highlight_interaction', 'highlightIndex': 'first'},
+            {'type': 'unknown'},
+        ]
+        response = self.client.post(
+            '/api/track/batch/',
+            data=json.dumps({'events': events}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        statuses = [item['status'] for item in response.json()['data']]
+        self.assertEqual(statuses, ['accepted', 'accepted', 'error', 'error'])
+        self.assertEqual(TrackingEvent.objects.count(), 2)
+
+    @override_settings(ANALYTICS_BATCH_MAX_EVENTS=1)
+    def test_batch_endpoint_limits_batch_size(self):
+        events = [{'type': 'hero_navigation', 'destination': '/'}] * 2
+        response = self.client.post('/api/track/batch/', data=json.dumps(events), content_type='application/json')
+
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(TrackingEvent.objects.exists())
+
+
+class ClickRollupTestCase(TestCase):
+    now = datetime(2025, 11, 13, 12, 30, tzinfo=timezone.utc)
+
+    def make_event(self, url, received_at):
+        event = build_event(TrackingEvent.BLOG_CLICK, {'post_url': url})
+        event.received_at = received_at
+        return event
+
+    def test_increment_upserts_minute_buckets(self):
+        rollups.increment([self.make_event('/news/a/', self.now), self.make_event('/news/a/', self.now)])
+        rollups.increment([self.make_event('/news/a/', self.now + timedelta(seconds=20))])
+
+        rollup = ClickRollup.objects.get()
+        self.assertEqual(rollup.granularity, ClickRollup.MINUTE)
+        self.assertEqual(rollup.count, 3)
+
+    def test_compaction_preserves_totals(self):
+        events = [
+            self.make_event('/news/a/', self.now - timedelta(days=3, minutes=minute))
+            for minute in range(5)
+        ] + [
+            self.make_event('/news/b/', self.now - timedelta(hours=5, minutes=minute))
+            for minute in range(3)
+        ] + [self.make_event('/news/b/', self.now)]
+        rollups.increment(events)
+
+        rollups.compact(now=self.now)
+
+        self.assertEqual(
+            sorted(ClickRollup.objects.values_list('target', 'granularity', 'count')),
+            [('/news/a/', 'day', 5), ('/news/b/', 'hour', 3), ('/news/b/', 'minute', 1)],
+        )
+        top = rollups.top_targets(timedelta(days=7), now=self.now)
+        self.assertEqual([(row['target'], row['total']) for row in top], [('/news/a/', 5), ('/news/b/', 4)])
+
+    def test_top_targets_include_the_bucket_at_the_window_start(self):
+        rollups.increment([self.make_event('/news/a/', self.now - timedelta(hours=5, minutes=50))])
+        rollups.compact(now=self.now)
+
+        # The hour bucket starts at 6:00, before the window does
+        top = rollups.top_targets(timedelta(hours=6), now=self.now)
+        self.assertEqual([(row['target'], row['total']) for row in top], [('/news/a/', 1)])
+
+    def test_top_links_endpoint(self):
+        cache.clear()
+        rollups.increment([self.make_event('/news/a/', datetime.now(timezone.utc))])
+
+        response = self.client.get('/api/analytics/top/', {'window': '1h', 'kind': 'blog_click'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data'], [{'kind': 'blog_click', 'target': '/news/a/', 'total': 1}])
+        self.assertEqual(self.client.get('/api/analytics/top/', {'window': 'week'}).status_code, 400)
@@ -0,0 +1,135 @@
+import json
+import re
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from st_mark.cache import cached_api
+
+from . import rollups
+from .ingest import InvalidEvent, arecord_event, get_buffer
+from .models import TrackingEvent
+
+WINDOW_PATTERN = re.compile(r'^(\d+)([mhd])$')
+WINDOW_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+MAX_WINDOW = timedelta(days=366)
+MAX_LIMIT = 100
+
+
+class IngestStatsView(View):
+    """
+    API endpoint exposing this worker's ingestion buffer counters
+    """
+
+    async def get(self, request):
+        return JsonResponse({
+            'status': 'success',
+            'data': get_buffer().stats(),
+            'message': 'Ingestion statistics retrieved successfully'
+        })
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class TrackBatchView(View):
+    """
+    API endpoint accepting many tracking events in a single POST.
+
+    The body is either a list of events or ``{"events": [...]}``; each event
+    is an object with a ``type`` (see ``analytics.ingest.EVENT_PARSERS``) and
+    the same fields the per-interaction endpoints accept.  Sent by
+    ``navigator.sendBeacon`` from ``js/tracker.js``.
+    """
+
+    async def post(self, request):
+        try:
+            body = json.loads(request.body.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Invalid JSON data'
+            }, status=400)
+
+        events = body.get('events') if isinstance(body, dict) else body
+        if not isinstance(events, list):
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Expected a list of events'
+            }, status=400)
+
+        max_events = getattr(settings, 'ANALYTICS_BATCH_MAX_EVENTS', 100)
+        if len(events) > max_events:
+            return JsonResponse({
+                'status': 'error',
+                'message': f'A batch may contain at most {max_events} events'
+            }, status=413)
+
+        results = []
+        accepted = 0
+        for index, event in enumerate(events):
+            event_type = event.get('type') if isinstance(event, dict) else None
+            try:
+                if await arecord_event(event_type, event):
+                    accepted += 1
+                    results.append({'index': index, 'status': 'accepted'})
+                else:
+                    results.append({'index': index, 'status': 'dropped'})
+            except InvalidEvent as e:
+                results.append({'index': index, 'status': 'error', 'message': str(e)})
+
+        return JsonResponse({
+            'status': 'success',
+            'message': f'{accepted} of {len(events)} events accepted',
+            'data': results,
+            'count': len(events)
+        })
+
+
+class TopLinksView(View):
+    """
+    API endpoint returning the most-clicked targets in a time window.
+
+    Query parameters: ``window`` (e.g. ``30m``, ``24h``, ``7d``; default
+    ``24h``), ``kind`` (an event type; default all) and ``limit``
+    (default 10).  Served from ``ClickRollup`` buckets, not raw events;
+    the window is widened to the start of the bucket it begins in.
+    """
+
+    @cached_api('analytics', params=('window', 'kind', 'limit'))
+    async def get(self, request):
+        match = WINDOW_PATTERN.match(request.GET.get('window', '24h'))
+        if not match:
+            return JsonResponse({
+                'status': 'error',
+                'message': "'window' must look like 30m, 24h or 7d"
+            }, status=400)
+        window = timedelta(**{WINDOW_UNITS[match.group(2)]: int(match.group(1))})
+        if window > MAX_WINDOW:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Window is too large'
+            }, status=400)
+
+        kind = request.GET.get('kind') or None
+        if kind and kind not in dict(TrackingEvent.KIND_CHOICES):
+            return JsonResponse({
+                'status': 'error',
+                'message': f"Unknown event type '{kind}'"
+            }, status=400)
+
+        try:
+            limit = min(max(int(request.GET.get('limit', 10)), 1), MAX_LIMIT)
+        except ValueError:
+            limit = 10
+
+        top = await sync_to_async(rollups.top_targets)(window, kind=kind, limit=limit)
+        return JsonResponse({
+            'status': 'success',
+            'data': top,
+            'count': len(top),
+            'message': 'Top links retrieved successfully'
+        })
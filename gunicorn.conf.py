@@ -0,0 +1,42 @@
+"""
+Gunicorn worker profile for st_mark.
+
+The JSON API views are async, so production runs the ASGI application
+(st_mark/asgi.py) on uvicorn workers managed by gunicorn:
+
+    gunicorn -c gunicorn.conf.py st_mark.asgi:application
+
+Each uvicorn worker serves many concurrent requests on one event loop, so a
+homepage burst of ~10 AJAX calls per visitor no longer ties up one worker per
+call. Size WEB_CONCURRENCY to the number of CPU cores, not to the expected
+number of concurrent requests.
+
+Environment variables:
+    PORT                      Port to bind (default 8000)
+    WEB_CONCURRENCY           Worker processes (default: CPU count)
+    GUNICORN_WORKER_CLASS     Worker class (default uvicorn.workers.UvicornWorker;
+                              use "sync" together with st_mark.wsgi:application
+                              to fall back to the WSGI profile)
+    GUNICORN_TIMEOUT          Worker timeout in seconds (default 30)
+    GUNICORN_KEEPALIVE        Keep-alive seconds for idle connections (default 5)
+
+For local development the same application can be served by uvicorn alone:
+
+    uvicorn st_mark.asgi:application --reload
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "uvicorn.workers.UvicornWorker")
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+
+# Recycle workers periodically to cap memory growth from long-lived processes.
+max_requests = 5000
+max_requests_jitter = 500
+
+accesslog = "-"
+errorlog = "-"
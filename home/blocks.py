@@ -44,6 +44,7 @@ class WelcomeSectionBlock(StructBlock):
     class Meta:
         icon = "placeholder"
         label = "Welcome Section"
+        search_headings = ('heading',)
         template = "components/welcome_section.html"
 
 
@@ -59,7 +60,8 @@ class NewsItemBlock(StructBlock):
     date = CharBlock(
         required=True,
         max_length=100,
-        help_text="Publication date"
+        help_text="Publication date",
+        search_index=False
     )
     
     excerpt = TextBlock(
@@ -76,6 +78,7 @@ class NewsItemBlock(StructBlock):
     class Meta:
         icon = "doc-full"
         label = "News Item"
+        search_headings = ('title',)
 
 
 class NewsSectionBlock(StructBlock):
@@ -100,18 +103,20 @@ class NewsSectionBlock(StructBlock):
     class Meta:
         icon = "folder-open-inverse"
         label = "News Section"
+        search_headings = ('heading',)
         template = "components/news_section.html"
 
 class EventItemBlock(StructBlock):
     title = CharBlock(required=True, max_length=200, help_text="Event title")
-    date = CharBlock(required=True, max_length=100, help_text="Event date")
-    time = CharBlock(required=True, max_length=100, help_text="Event time")
+    date = CharBlock(required=True, max_length=100, help_text="Event date", search_index=False)
+    time = CharBlock(required=True, max_length=100, help_text="Event time", search_index=False)
     location = CharBlock(required=True, max_length=200, help_text="Event location")
     description = TextBlock(required=True, max_length=500, help_text="Event description")
     
     class Meta:
         icon = "date"
         label = "Event Item"
+        search_headings = ('title',)
 
 class GalleryImageBlock(StructBlock):
     """A block for individual gallery images."""
@@ -158,6 +163,7 @@ class GallerySectionBlock(StructBlock):
     class Meta:
         icon = "image"
         label = "Gallery Section"
+        search_headings = ('heading',)
         template = "components/gallery_section.html"
 
 class EventsSectionBlock(StructBlock):
@@ -168,6 +174,7 @@ class EventsSectionBlock(StructBlock):
     class Meta:
         icon = "calendar"
         label = "Events Section"
+        search_headings = ('heading',)
         template = "components/events_section.html"
 
 
@@ -224,4 +231,5 @@ class TestimonialsSectionBlock(StructBlock):
     class Meta:
         icon = "openquote"
         label = "Testimonials Section"
+        search_headings = ('heading',)
         template = "components/testimonials_section.html"
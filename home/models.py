@@ -4,6 +4,10 @@ from wagtail.models import Page
 from wagtail.fields import StreamField
 from wagtail import blocks  # We'll use this to define an inline block
 from wagtail.admin.panels import FieldPanel
+from wagtail.search import index
+
+from st_mark.page_cache import PageCacheMixin
+from st_mark.search_text import HEADING, TEXT, stream_text
 
 # Import your custom blocks
 from home.blocks import WelcomeSectionBlock, NewsSectionBlock, EventsSectionBlock, GallerySectionBlock, TestimonialsSectionBlock
@@ -19,7 +23,7 @@ class HighlightBlock(blocks.StructBlock):
         label = "Highlight"
 
 
-class HomePage(Page):
+class HomePage(PageCacheMixin, Page):
     # Standard Django model field
     subtitle = models.CharField(max_length=255, blank=True)
 
@@ -41,3 +45,24 @@ class HomePage(Page):
         FieldPanel('subtitle'),
         FieldPanel('body'),
     ]
+
+    search_fields = Page.search_fields + [
+        index.SearchField('subtitle'),
+        index.SearchField('body_headings', boost=2),
+        index.SearchField('body_text'),
+    ]
+
+    def body_headings(self):
+        return stream_text(self.body, HEADING)
+
+    def body_text(self):
+        return stream_text(self.body, TEXT)
+
+    def get_context(self, request, *args, **kwargs):
+        # Embed every section payload in the page so the section scripts
+        # can hydrate without fetching /api/home/bootstrap/ again
+        from .views import get_bootstrap, parse_bootstrap_sections
+
+        context = super().get_context(request, *args, **kwargs)
+        context['bootstrap_data'] = get_bootstrap(parse_bootstrap_sections(None))
+        return context
@@ -18,25 +18,21 @@ class EventsSection {
       // Show loading state
       this.showLoadingState();
       
-      // Load events data from API
-      $.ajax({
-        url: '/api/events/',
-        method: 'GET',
-        dataType: 'json',
-        success: (response) => {
+      // Load events data (bootstrapped with the other homepage sections)
+      window.siteData.get('events', '/api/events/')
+        .then((response) => {
           if (response.status === 'success' && Array.isArray(response.data) && response.data.length > 0) {
             this.renderEvents(response.data);
           } else {
             // If no data from API, show a message
             this.showNoEventsMessage();
           }
-        },
-        error: (xhr, status, error) => {
+        })
+        .catch((error) => {
           console.error('Error loading events:', error);
           // If API fails, show a message
           this.showErrorMessage();
-        }
-      });
+        });
     }
   }
 
@@ -18,25 +18,21 @@ class GallerySection {
     // Show loading state
     this.showLoadingState();
 
-    // Load gallery data from API
-    $.ajax({
-      url: '/api/gallery/',
-      method: 'GET',
-      dataType: 'json',
-      success: (response) => {
+    // Load gallery data (bootstrapped with the other homepage sections)
+    window.siteData.get('gallery', '/api/gallery/')
+      .then((response) => {
         if (response.status === 'success' && Array.isArray(response.data) && response.data.length > 0) {
           this.renderGallery(response.data);
         } else {
           // If no data from API, show a message
           this.showNoGalleryMessage();
         }
-      },
-      error: (xhr, status, error) => {
+      })
+      .catch((error) => {
         console.error('Error loading gallery:', error);
         // If API fails, show a message
         this.showErrorMessage();
-      }
-    });
+      });
   }
 
   showLoadingState() {
@@ -22,58 +22,35 @@ class HeroSection {
     const button = $(event.currentTarget);
     const url = button.attr('href');
     
-    // Send AJAX request with JSON response
-    this.sendNavigationRequest(url)
-      .done((response) => {
-        if (response.status === 'success') {
-          window.location.href = url;
-        } else {
-          this.handleError(response.message || 'Navigation failed');
-        }
-      })
-      .fail((xhr, status, error) => {
-        // Even if the request fails, we still navigate to maintain user experience
-        console.warn('Navigation tracking failed, but proceeding with navigation:', error);
-        window.location.href = url;
-      });
+    // Queue the navigation event; it is sent with sendBeacon on unload
+    this.trackNavigation(url);
+    window.location.href = url;
   }
 
-  sendNavigationRequest(url) {
-    // Send AJAX request with JSON response
-    return $.ajax({
-      url: '/api/hero-navigation/',
-      method: 'POST',
-      dataType: 'json',
-      contentType: 'application/json',
-      data: JSON.stringify({
-        destination: url,
-        timestamp: new Date().toISOString()
-      })
+  trackNavigation(url) {
+    window.stMarkTracker.track('hero_navigation', {
+      destination: url
     });
   }
 
   loadDynamicContent() {
     // Load dynamic hero content via AJAX
     this.fetchHeroData()
-      .done((response) => {
+      .then((response) => {
         if (response.status === 'success') {
           this.updateHeroContent(response.data);
         } else {
           console.warn('Failed to load dynamic hero content:', response.message);
         }
       })
-      .fail((xhr, status, error) => {
+      .catch((error) => {
         console.error('Hero content loading failed:', error);
       });
   }
 
   fetchHeroData() {
-    // Fetch hero data with JSON response
-    return $.ajax({
-      url: '/api/hero-content/',
-      method: 'GET',
-      dataType: 'json'
-    });
+    // Fetch hero data (bootstrapped with the other homepage sections)
+    return window.siteData.get('hero', '/api/hero-content/');
   }
 
   updateHeroContent(data) {
@@ -11,19 +11,15 @@ class HomeAPI {
   }
 
   loadSiteInfo() {
-    $.ajax({
-      url: '/api/site-info/',
-      method: 'GET',
-      dataType: 'json'
-    })
-    .done((response) => {
+    window.siteData.get('site_info', '/api/site-info/')
+    .then((response) => {
       if (response.status === 'success') {
         this.displaySiteInfo(response.data);
       } else {
         console.warn('Failed to load site information:', response.message);
       }
     })
-    .fail((xhr, status, error) => {
+    .catch((error) => {
       console.error('Site info loading failed:', error);
     });
   }
@@ -34,19 +30,15 @@ class HomeAPI {
   }
 
   loadStatistics() {
-    $.ajax({
-      url: '/api/statistics/',
-      method: 'GET',
-      dataType: 'json'
-    })
-    .done((response) => {
+    window.siteData.get('statistics', '/api/statistics/')
+    .then((response) => {
       if (response.status === 'success') {
         this.displayStatistics(response.data);
       } else {
         console.warn('Failed to load statistics:', response.message);
       }
     })
-    .fail((xhr, status, error) => {
+    .catch((error) => {
       console.error('Statistics loading failed:', error);
     });
   }
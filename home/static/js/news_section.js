@@ -18,12 +18,9 @@ class NewsSection {
   }
 
   loadNews() {
-    // Fetch news data from API
-    $.ajax({
-      url: '/api/news/',
-      method: 'GET',
-      dataType: 'json',
-      success: (response) => {
+    // Fetch news data (bootstrapped with the other homepage sections)
+    window.siteData.get('news', '/api/news/')
+      .then((response) => {
         if (response.status === 'success' && Array.isArray(response.data) && response.data.length > 0) {
           this.renderNews(response.data);
           // Show the "View All News" button since we have data
@@ -34,15 +31,14 @@ class NewsSection {
             this.loadMoreBtn.hide();
           }
         }
-      },
-      error: (xhr, status, error) => {
+      })
+      .catch((error) => {
         console.error('Error loading news:', error);
         // If API fails, keep the static content and hide the "View All News" button if there are no news items
         if (this.newsContainer.find('.col-md-6').length === 0) {
           this.loadMoreBtn.hide();
         }
-      }
-    });
+      });
   }
 
   renderNews(items) {
@@ -18,25 +18,21 @@ class TestimonialsSection {
     // Show loading state
     this.showLoadingState();
 
-    // Load testimonials data from API
-    $.ajax({
-      url: '/api/testimonials/',
-      method: 'GET',
-      dataType: 'json',
-      success: (response) => {
+    // Load testimonials data (bootstrapped with the other homepage sections)
+    window.siteData.get('testimonials', '/api/testimonials/')
+      .then((response) => {
         if (response.status === 'success' && Array.isArray(response.data) && response.data.length > 0) {
           this.renderTestimonials(response.data);
         } else {
           // If no data from API, show a message
           this.showNoTestimonialsMessage();
         }
-      },
-      error: (xhr, status, error) => {
+      })
+      .catch((error) => {
         console.error('Error loading testimonials:', error);
         // If API fails, show a message
         this.showErrorMessage();
-      }
-    });
+      });
   }
 
   showLoadingState() {
@@ -8,6 +8,10 @@ class WelcomeSection {
     this.description = $('#description');
     this.learnMoreBtn = $('#learn-more-btn');
     this.admissionBtn = $('#admission-btn');
+    this.links = {
+      about: '/about',
+      admissions: '/admissions'
+    };
     
     this.init();
   }
@@ -33,12 +37,8 @@ class WelcomeSection {
   }
 
   fetchWelcomeData() {
-    // Actual AJAX call to our API
-    return $.ajax({
-      url: '/api/welcome-section/',
-      method: 'GET',
-      dataType: 'json'
-    });
+    // Bootstrapped with the other homepage sections
+    return window.siteData.get('welcome', '/api/welcome-section/');
   }
 
   updateContent(response) {
@@ -76,6 +76,12 @@ class WelcomeSection {
     if (data.highlights && data.highlights.length > 0) {
       this.renderHighlights(data.highlights);
     }
+    
+    // Update navigation targets
+    if (data.links) {
+      this.links.about = data.links.learnMore || this.links.about;
+      this.links.admissions = data.links.admission || this.links.admissions;
+    }
   }
 
   renderHighlights(highlights) {
@@ -126,113 +132,33 @@ class WelcomeSection {
   }
 
   handleLearnMoreClick() {
-    // API call for navigation
-    $.ajax({
-      url: '/api/welcome-section/',
-      method: 'POST',
-      data: JSON.stringify({ 
-        action: 'navigate',
-        target: 'about',
-        timestamp: new Date().toISOString()
-      }),
-      contentType: 'application/json',
-      success: (response) => {
-        window.location.href = response.data.url;
-      },
-      error: (xhr, status, error) => {
-        console.error('Navigation error:', error);
-        // Fallback navigation
-        window.location.href = '/about';
-      }
-    });
+    this.navigate('about');
   }
 
   handleAdmissionClick() {
-    // API call for navigation
-    $.ajax({
-      url: '/api/welcome-section/',
-      method: 'POST',
-      data: JSON.stringify({ 
-        action: 'navigate',
-        target: 'admissions',
-        timestamp: new Date().toISOString()
-      }),
-      contentType: 'application/json',
-      success: (response) => {
-        window.location.href = response.data.url;
-      },
-      error: (xhr, status, error) => {
-        console.error('Navigation error:', error);
-        // Fallback navigation
-        window.location.href = '/admissions';
-      }
+    this.navigate('admissions');
+  }
+
+  navigate(target) {
+    // Queue the navigation event (sent with sendBeacon on unload) and go
+    window.stMarkTracker.track('welcome_navigation', {
+      target: target
     });
+    window.location.href = this.links[target] || '/';
   }
 
   handleHighlightClick(index) {
-    // API call for highlight interaction
-    $.ajax({
-      url: '/api/welcome-section/',
-      method: 'POST',
-      data: JSON.stringify({ 
-        action: 'highlight_interaction',
-        highlightIndex: index,
-        timestamp: new Date().toISOString()
-      }),
-      contentType: 'application/json',
-      success: (response) => {
-        console.log('Highlight interaction recorded:', response);
-        // Visual feedback
-        $(`.highlight-item[data-index="${index}"]`).addClass('highlighted');
-        setTimeout(() => {
-          $(`.highlight-item[data-index="${index}"]`).removeClass('highlighted');
-        }, 1000);
-      },
-      error: (xhr, status, error) => {
-        console.error('Highlight interaction error:', error);
-
-        // Visual feedback for error
-        const $highlightItem = $(`.highlight-item[data-index="${index}"]`);
-        $highlightItem.addClass('error');
-        
-        // Log the full error details including status
-        console.error('Highlight interaction failed:', {
-          status: xhr.status,
-          statusText: xhr.statusText,
-          responseText: xhr.responseText
-        });
-
-        // Check if the request was successful based on status
-        if (xhr.status === 200) {
-          console.log('Highlight interaction recorded:', response);
-          // Visual feedback
-          $(`.highlight-item[data-index="${index}"]`).addClass('highlighted');
-          setTimeout(() => {
-            $(`.highlight-item[data-index="${index}"]`).removeClass('highlighted');
-          }, 1000);
-        } else {
-          // Handle non-200 status codes
-          $highlightItem.addClass('error');
-          
-          // Log the full error details including status
-          console.error('Highlight interaction failed:', {
-            status: xhr.status,
-            statusText: xhr.statusText,
-            responseText: xhr.responseText
-          });
-        }
-
-        // Remove error class after animation
-        setTimeout(() => {
-          $highlightItem.removeClass('error');
-        }, 1000);
-        $(`.highlight-item[data-index="${index}"]`).addClass('error');
-        setTimeout(() => {
-          $(`.highlight-item[data-index="${index}"]`).removeClass('error');
-        }, 1000);
-        console.error('Highlight interaction error:', error);
-      }
+    // Queue the highlight interaction for batched tracking
+    window.stMarkTracker.track('highlight_interaction', {
+      highlightIndex: index
     });
+
+    // Visual feedback
+    const $highlightItem = $(`.highlight-item[data-index="${index}"]`);
+    $highlightItem.addClass('highlighted');
+    setTimeout(() => {
+      $highlightItem.removeClass('highlighted');
+    }, 1000);
   }
 }
 
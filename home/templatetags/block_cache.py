@@ -0,0 +1,52 @@
+"""
+``{% include_block_cached block %}``: ``{% include_block %}`` for the blocks
+of a live page's StreamField, with the rendered HTML cached.
+
+Entries are keyed by the page's live revision, the block id and the block
+template, so a block re-renders only after the page is republished.
+Previews, unpublished pages and blocks without an id are rendered
+without caching.
+
+Since the HTML is shared by every visitor, blocks are rendered with only
+``page`` and ``site`` in the context (plus ``self`` and ``value``), not the
+page template's context: block templates must not depend on the request,
+the user, the CSRF token or the query string.
+"""
+
+from django import template
+from django.utils.safestring import mark_safe
+from wagtail.models import Site
+
+from st_mark.cache import get_cache
+
+register = template.Library()
+
+
+def block_cache_key(page, block):
+    if getattr(page, 'live_revision_id', None) is None or not getattr(block, 'id', None):
+        return None
+    template_name = block.block.get_template(block.value) or block.block_type
+    return f"block:{page.live_revision_id}:{block.id}:{template_name}"
+
+
+def block_context(context):
+    request = context.get('request')
+    return {
+        'page': context.get('page'),
+        'site': Site.find_for_request(request) if request is not None else None,
+    }
+
+
+@register.simple_tag(takes_context=True)
+def include_block_cached(context, block):
+    request = context.get('request')
+    key = None
+    if not getattr(request, 'is_preview', False):
+        key = block_cache_key(context.get('page'), block)
+
+    if key is None:
+        return block.render_as_block(context=block_context(context))
+
+    return mark_safe(get_cache('blocks').get_or_set(
+        key, lambda: block.render_as_block(context=block_context(context))
+    ))
@@ -1,6 +1,10 @@
-from django.test import TestCase
+import json
 import os
 
+from django.test import TestCase
+
+from .models import HomePage
+
 
 class WelcomeSectionTestCase(TestCase):
     def test_welcome_section_template_content(self):
@@ -23,4 +27,100 @@ class WelcomeSectionTestCase(TestCase):
         self.assertIn('aria-hidden="true"', content)
         
         # Check that highlights section has fallback content
-        self.assertIn('{% else %}', content)
\ No newline at end of file
+        self.assertIn('{% else %}', content)
+
+class StaticAPIResponseTestCase(TestCase):
+    def test_repeat_request_with_etag_is_not_modified(self):
+        """
+        Static JSON endpoints answer a matching If-None-Match with a 304.
+        """
+        response = self.client.get('/api/hero-content/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['buttonText'], 'Explore Programs')
+        self.assertIn('max-age=', response['Cache-Control'])
+        etag = response['ETag']
+
+        response = self.client.get('/api/hero-content/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_variants_have_distinct_etags(self):
+        full = self.client.get('/api/social/stats/')
+        simple = self.client.get('/api/social/stats/', {'format': 'simple'})
+
+        self.assertNotEqual(full['ETag'], simple['ETag'])
+        self.assertEqual(simple.json()['data'], {'total_followers': '38K'})
+
+    def test_bootstrap_combines_sections(self):
+        response = self.client.get('/api/home/bootstrap/')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual(data['hero'], self.client.get('/api/hero-content/').json()['data'])
+        self.assertEqual(data['navigation'], self.client.get('/api/navigation/').json()['data'])
+
+        response = self.client.get('/api/home/bootstrap/', {'sections': 'news,events'})
+        self.assertEqual(sorted(response.json()['data']), ['events', 'news'])
+        response = self.client.get('/api/home/bootstrap/', {'sections': 'events,news'}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_bootstrap_rejects_unknown_sections(self):
+        response = self.client.get('/api/home/bootstrap/', {'sections': 'news,weather'})
+        self.assertEqual(response.status_code, 400)
+
+
+class HomePageHydrationTestCase(TestCase):
+    def test_homepage_embeds_section_data(self):
+        """
+        The homepage renders every section payload inline for js/site_data.js.
+        """
+        response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+
+        content = response.content.decode()
+        start = content.index('<script id="bootstrap-data" type="application/json">')
+        blob = content[content.index('>', start) + 1:content.index('</script>', start)]
+        self.assertNotIn('<br>', blob)
+
+        data = json.loads(blob)['data']
+        self.assertEqual(data['hero']['buttonText'], 'Explore Programs')
+        self.assertIn('testimonials', data)
+
+
+class HomePageSearchTextTestCase(TestCase):
+    def test_sections_searchable_text(self):
+        page = HomePage(title="Home", body=[
+            ('welcome_section', {
+                'welcome_text': "Welcome",
+                'heading': "Shaping Leaders",
+                'description': "A   community of scholars",
+                'highlights': ["Research facilities"],
+            }),
+            ('testimonials_section', {
+                'heading': "What Our Community Says",
+                'description': "",
+                'testimonials': [{'name': "Ana", 'role': "Graduate", 'quote': "Great years"}],
+            }),
+        ])
+
+        self.assertEqual(page.body_headings(), "Shaping Leaders\nWhat Our Community Says")
+        self.assertEqual(
+            page.body_text(),
+            "Welcome\nA community of scholars\nResearch facilities\nAna\nGraduate\nGreat years"
+        )
+
+    def test_searchable_text_follows_block_definitions(self):
+        page = HomePage(title="Home", body=[
+            ('events_section', {
+                'heading': "Upcoming Events",
+                'description': "",
+                'events': [{
+                    'title': "Open Day", 'date': "May 4", 'time': "10:00",
+                    'location': "Main Hall", 'description': "Tours",
+                }],
+            }),
+        ])
+
+        # Item titles are headings; dates and times are not indexed
+        self.assertEqual(page.body_headings(), "Upcoming Events\nOpen Day")
+        self.assertEqual(page.body_text(), "Main Hall\nTours")
@@ -1,3 +1,4 @@
+import functools
 import json
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -5,29 +6,36 @@ from django.views.decorators.http import require_http_methods
 from django.utils.decorators import method_decorator
 from django.views import View
 
+from analytics.ingest import InvalidEvent, arecord_event
+from analytics.models import TrackingEvent
+from st_mark.api import PreparedJSON
+from st_mark.views import NAVIGATION, SOCIAL_STATS_FULL
+
+
+HERO_CONTENT = PreparedJSON({
+    'status': 'success',
+    'data': {
+        'title': 'Empowering Minds,<br>Building the Future',
+        'subtitle': 'Join a community of scholars and innovators at St. Mark University, where excellence meets opportunity.',
+        'buttonText': 'Explore Programs'
+    },
+    'message': 'Hero content retrieved successfully'
+})
+
+
+@method_decorator(csrf_exempt, name='dispatch')
 class HeroAPIView(View):
     """
     API endpoint for hero section interactions
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return dynamic hero content
         """
-        data = {
-            'title': 'Empowering Minds,<br>Building the Future',
-            'subtitle': 'Join a community of scholars and innovators at St. Mark University, where excellence meets opportunity.',
-            'buttonText': 'Explore Programs'
-        }
-        
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'Hero content retrieved successfully'
-        })
+        return HERO_CONTENT.response(request)
     
-    @method_decorator(csrf_exempt)
-    def post(self, request):
+    async def post(self, request):
         """
         Handle navigation requests from hero buttons
         """
@@ -37,8 +45,7 @@ class HeroAPIView(View):
             destination = data.get('destination', '')
             timestamp = data.get('timestamp', '')
             
-            # Log the navigation (in a real app, you might save this to a database)
-            print(f"Hero navigation to {destination} at {timestamp}")
+            await arecord_event(TrackingEvent.HERO_NAVIGATION, data)
             
             # Return success response
             return JsonResponse({
@@ -54,6 +61,11 @@ class HeroAPIView(View):
                 'status': 'error',
                 'message': 'Invalid JSON data'
             }, status=400)
+        except InvalidEvent as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=400)
         except Exception as e:
             return JsonResponse({
                 'status': 'error',
@@ -61,32 +73,47 @@ class HeroAPIView(View):
             }, status=500)
 
 
+SITE_INFO = PreparedJSON({
+    'status': 'success',
+    'data': {
+        'name': 'St. Mark University',
+        'description': 'Empowering minds and building the future through excellence in education, research, and community service.',
+        'founded': 1985,
+        'motto': 'Excellence in Education',
+        'contact': {
+            'address': '123 University Avenue, Education City, EC 12345',
+            'phone': '+1 (234) 567-890',
+            'email': 'info@stmark.edu'
+        }
+    },
+    'message': 'Site information retrieved successfully'
+})
+
+
 class SiteInfoAPIView(View):
     """
     API endpoint for general site information
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return general site information
         """
-        data = {
-            'name': 'St. Mark University',
-            'description': 'Empowering minds and building the future through excellence in education, research, and community service.',
-            'founded': 1985,
-            'motto': 'Excellence in Education',
-            'contact': {
-                'address': '123 University Avenue, Education City, EC 12345',
-                'phone': '+1 (234) 567-890',
-                'email': 'info@stmark.edu'
-            }
-        }
-        
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'Site information retrieved successfully'
-        })
+        return SITE_INFO.response(request)
+
+
+STATISTICS = PreparedJSON({
+    'status': 'success',
+    'data': {
+        'students': 5420,
+        'faculty': 320,
+        'programs': 45,
+        'research_projects': 128,
+        'alumni': 15600,
+        'last_updated': '2025-11-13'
+    },
+    'message': 'Statistics retrieved successfully'
+})
 
 
 class StatisticsAPIView(View):
@@ -94,33 +121,20 @@ class StatisticsAPIView(View):
     API endpoint for site statistics
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return site statistics
         """
-        data = {
-            'students': 5420,
-            'faculty': 320,
-            'programs': 45,
-            'research_projects': 128,
-            'alumni': 15600,
-            'last_updated': '2025-11-13'
-        }
-        
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'Statistics retrieved successfully'
-        })
+        return STATISTICS.response(request)
 
 
+@method_decorator(csrf_exempt, name='dispatch')
 class QuickLinksClickAPIView(View):
     """
     API endpoint for tracking quick link clicks
     """
     
-    @method_decorator(csrf_exempt)
-    def post(self, request):
+    async def post(self, request):
         """
         Handle quick link click tracking
         """
@@ -130,13 +144,8 @@ class QuickLinksClickAPIView(View):
             title = data.get('title', '')
             url = data.get('url', '')
             timestamp = data.get('timestamp', '')
-            user_agent = data.get('userAgent', '')
-            referrer = data.get('referrer', '')
             
-            # Log the click (in a real app, you might save this to a database)
-            print(f"Quick link '{title}' clicked, navigating to {url} at {timestamp}")
-            print(f"User agent: {user_agent}")
-            print(f"Referrer: {referrer}")
+            await arecord_event(TrackingEvent.QUICK_LINK_CLICK, data)
             
             # Return success response
             return JsonResponse({
@@ -153,6 +162,11 @@ class QuickLinksClickAPIView(View):
                 'status': 'error',
                 'message': 'Invalid JSON data'
             }, status=400)
+        except InvalidEvent as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=400)
         except Exception as e:
             return JsonResponse({
                 'status': 'error',
@@ -160,82 +174,84 @@ class QuickLinksClickAPIView(View):
             }, status=500)
 
 
+NEWS_ITEMS = PreparedJSON({
+    'status': 'success',
+    'data': [
+        {
+            'id': 1,
+            'title': "St. Mark University Ranks Among Top 100 Universities Globally",
+            'date': "November 8, 2025",
+            'excerpt': "Our commitment to academic excellence and innovative research has earned us recognition in the latest QS World University Rankings.",
+            'image': "/static/images/campus-building.jpg"
+        },
+        {
+            'id': 2,
+            'title': "New Research Center for Artificial Intelligence Inaugurated",
+            'date': "November 5, 2025",
+            'excerpt': "State-of-the-art facilities will advance AI research and provide students with cutting-edge learning opportunities.",
+            'image': "/static/images/students-studying.jpg"
+        },
+        {
+            'id': 3,
+            'title': "2024 Graduation Ceremony Celebrates 2,500 Graduates",
+            'date': "October 28, 2025",
+            'excerpt': "Our latest graduating class is ready to make their mark on the world with the knowledge and skills gained at St. Mark University.",
+            'image': "/static/images/graduation.jpg"
+        }
+    ],
+    'message': 'News items retrieved successfully'
+})
+
+
 class NewsAPIView(View):
     """
     API endpoint for news section content
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return news items
         """
-        data = [
-            {
-                'id': 1,
-                'title': "St. Mark University Ranks Among Top 100 Universities Globally",
-                'date': "November 8, 2025",
-                'excerpt': "Our commitment to academic excellence and innovative research has earned us recognition in the latest QS World University Rankings.",
-                'image': "/static/images/campus-building.jpg"
-            },
-            {
-                'id': 2,
-                'title': "New Research Center for Artificial Intelligence Inaugurated",
-                'date': "November 5, 2025",
-                'excerpt': "State-of-the-art facilities will advance AI research and provide students with cutting-edge learning opportunities.",
-                'image': "/static/images/students-studying.jpg"
-            },
-            {
-                'id': 3,
-                'title': "2024 Graduation Ceremony Celebrates 2,500 Graduates",
-                'date': "October 28, 2025",
-                'excerpt': "Our latest graduating class is ready to make their mark on the world with the knowledge and skills gained at St. Mark University.",
-                'image': "/static/images/graduation.jpg"
-            }
-        ]
-        
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'News items retrieved successfully'
-        })
+        return NEWS_ITEMS.response(request)
 
 
+WELCOME_SECTION = PreparedJSON({
+    'status': 'success',
+    'data': {
+        'imageSrc': '/static/images/students-studying.jpg',
+        'yearsOfExcellence': '40+',
+        'welcomeText': 'Welcome to St. Mark University',
+        'heading': 'Shaping Leaders, Advancing Knowledge',
+        'description': 'At St. Mark University, we are committed to providing world-class education that prepares students for success in an ever-changing global landscape. Our diverse community of scholars, researchers, and innovators work together to push the boundaries of knowledge and create positive impact in society.',
+        'highlights': [
+            'Over 40 years of academic excellence',
+            'Distinguished faculty with industry expertise',
+            'State-of-the-art research facilities',
+            'Global partnerships and exchange programs',
+            '95% graduate employment rate'
+        ],
+        'links': {
+            'learnMore': '/about',
+            'admission': '/admissions'
+        }
+    },
+    'message': 'Welcome section content retrieved successfully'
+})
+
+
+@method_decorator(csrf_exempt, name='dispatch')
 class WelcomeSectionAPIView(View):
     """
     API endpoint for welcome section content and interactions
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return dynamic welcome section content
         """
-        data = {
-            'imageSrc': '/static/images/students-studying.jpg',
-            'yearsOfExcellence': '40+',
-            'welcomeText': 'Welcome to St. Mark University',
-            'heading': 'Shaping Leaders, Advancing Knowledge',
-            'description': 'At St. Mark University, we are committed to providing world-class education that prepares students for success in an ever-changing global landscape. Our diverse community of scholars, researchers, and innovators work together to push the boundaries of knowledge and create positive impact in society.',
-            'highlights': [
-                'Over 40 years of academic excellence',
-                'Distinguished faculty with industry expertise',
-                'State-of-the-art research facilities',
-                'Global partnerships and exchange programs',
-                '95% graduate employment rate'
-            ],
-            'links': {
-                'learnMore': '/about',
-                'admission': '/admissions'
-            }
-        }
-        
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'Welcome section content retrieved successfully'
-        })
+        return WELCOME_SECTION.response(request)
     
-    @method_decorator(csrf_exempt)
-    def post(self, request):
+    async def post(self, request):
         """
         Handle navigation requests and highlight interactions
         """
@@ -248,8 +264,7 @@ class WelcomeSectionAPIView(View):
             # Handle different actions
             if action == 'navigate':
                 target = data.get('target', '')
-                # Log the navigation (in a real app, you might save this to a database)
-                print(f"Welcome section navigation to {target} at {timestamp}")
+                await arecord_event(TrackingEvent.WELCOME_NAVIGATION, data)
                 
                 # Determine URL based on target
                 urls = {
@@ -270,8 +285,7 @@ class WelcomeSectionAPIView(View):
                 
             elif action == 'highlight_interaction':
                 highlightIndex = data.get('highlightIndex', -1)
-                # Log the interaction (in a real app, you might save this to a database)
-                print(f"Highlight {highlightIndex} interacted with at {timestamp}")
+                await arecord_event(TrackingEvent.HIGHLIGHT_INTERACTION, data)
                 
                 return JsonResponse({
                     'status': 'success',
@@ -293,6 +307,11 @@ class WelcomeSectionAPIView(View):
                 'status': 'error',
                 'message': 'Invalid JSON data'
             }, status=400)
+        except InvalidEvent as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=400)
         except Exception as e:
             return JsonResponse({
                 'status': 'error',
@@ -300,47 +319,72 @@ class WelcomeSectionAPIView(View):
             }, status=500)
 
 
+EVENTS = PreparedJSON({
+    'status': 'success',
+    'data': [
+        {
+            'id': 1,
+            'title': "Open House for Prospective Students",
+            'date': "November 20, 2025",
+            'time': "9:00 AM - 4:00 PM",
+            'location': "Main Campus",
+            'description': "Explore our campus, meet faculty, and learn about our programs."
+        },
+        {
+            'id': 2,
+            'title': "Annual Research Symposium",
+            'date': "December 5, 2025",
+            'time': "10:00 AM - 5:00 PM",
+            'location': "Science Building Auditorium",
+            'description': "Showcase of groundbreaking research from students and faculty."
+        },
+        {
+            'id': 3,
+            'title': "Career Fair 2025",
+            'date': "December 12, 2025",
+            'time': "11:00 AM - 6:00 PM",
+            'location': "University Center",
+            'description': "Connect with top employers and explore career opportunities."
+        }
+    ],
+    'message': 'Events retrieved successfully'
+})
+
+
 class EventsAPIView(View):
     """
     API endpoint for events section content
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return upcoming events
         """
-        data = [
-            {
-                'id': 1,
-                'title': "Open House for Prospective Students",
-                'date': "November 20, 2025",
-                'time': "9:00 AM - 4:00 PM",
-                'location': "Main Campus",
-                'description': "Explore our campus, meet faculty, and learn about our programs."
-            },
-            {
-                'id': 2,
-                'title': "Annual Research Symposium",
-                'date': "December 5, 2025",
-                'time': "10:00 AM - 5:00 PM",
-                'location': "Science Building Auditorium",
-                'description': "Showcase of groundbreaking research from students and faculty."
-            },
-            {
-                'id': 3,
-                'title': "Career Fair 2025",
-                'date': "December 12, 2025",
-                'time': "11:00 AM - 6:00 PM",
-                'location': "University Center",
-                'description': "Connect with top employers and explore career opportunities."
-            }
-        ]
-        
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'Events retrieved successfully'
-        })
+        return EVENTS.response(request)
+
+
+GALLERY_IMAGES = PreparedJSON({
+    'status': 'success',
+    'data': [
+        {
+            'src': '/static/images/campus-hero.jpg',
+            'alt': 'Beautiful campus grounds'
+        },
+        {
+            'src': '/static/images/students-studying.jpg',
+            'alt': 'Students collaborating'
+        },
+        {
+            'src': '/static/images/campus-building.jpg',
+            'alt': 'Modern facilities'
+        },
+        {
+            'src': '/static/images/graduation.jpg',
+            'alt': 'Graduation ceremony'
+        }
+    ],
+    'message': 'Gallery images retrieved successfully'
+})
 
 
 class GalleryAPIView(View):
@@ -348,34 +392,37 @@ class GalleryAPIView(View):
     API endpoint for gallery section content
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return gallery images
         """
-        data = [
-            {
-                'src': '/static/images/campus-hero.jpg',
-                'alt': 'Beautiful campus grounds'
-            },
-            {
-                'src': '/static/images/students-studying.jpg',
-                'alt': 'Students collaborating'
-            },
-            {
-                'src': '/static/images/campus-building.jpg',
-                'alt': 'Modern facilities'
-            },
-            {
-                'src': '/static/images/graduation.jpg',
-                'alt': 'Graduation ceremony'
-            }
-        ]
-        
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'Gallery images retrieved successfully'
-        })
+        return GALLERY_IMAGES.response(request)
+
+
+TESTIMONIALS = PreparedJSON({
+    'status': 'success',
+    'data': [
+        {
+            'id': 1,
+            'name': 'Sarah Johnson',
+            'role': 'Computer Science Graduate, Class of 2024',
+            'quote': 'St. Mark University provided me with not just education, but a transformative experience. The hands-on projects and mentorship from world-class faculty prepared me for my dream career in tech.'
+        },
+        {
+            'id': 2,
+            'name': 'Dr. Michael Chen',
+            'role': 'Professor of Engineering',
+            'quote': 'Teaching at St. Mark University has been incredibly rewarding. The university\'s commitment to innovation and research excellence creates an environment where both faculty and students thrive.'
+        },
+        {
+            'id': 3,
+            'name': 'Emily Rodriguez',
+            'role': 'Business Administration Student',
+            'quote': 'The diverse community and global perspective I\'ve gained here are invaluable. St. Mark University truly prepares you to be a leader in today\'s interconnected world.'
+        }
+    ],
+    'message': 'Testimonials retrieved successfully'
+})
 
 
 class TestimonialsAPIView(View):
@@ -383,33 +430,70 @@ class TestimonialsAPIView(View):
     API endpoint for testimonials section content
     """
     
-    def get(self, request):
+    async def get(self, request):
         """
         Return testimonials
         """
-        data = [
-            {
-                'id': 1,
-                'name': 'Sarah Johnson',
-                'role': 'Computer Science Graduate, Class of 2024',
-                'quote': 'St. Mark University provided me with not just education, but a transformative experience. The hands-on projects and mentorship from world-class faculty prepared me for my dream career in tech.'
-            },
-            {
-                'id': 2,
-                'name': 'Dr. Michael Chen',
-                'role': 'Professor of Engineering',
-                'quote': 'Teaching at St. Mark University has been incredibly rewarding. The university\'s commitment to innovation and research excellence creates an environment where both faculty and students thrive.'
-            },
-            {
-                'id': 3,
-                'name': 'Emily Rodriguez',
-                'role': 'Business Administration Student',
-                'quote': 'The diverse community and global perspective I\'ve gained here are invaluable. St. Mark University truly prepares you to be a leader in today\'s interconnected world.'
-            }
-        ]
+        return TESTIMONIALS.response(request)
+
+
+# Sections served by the homepage bootstrap endpoint, keyed by the name
+# used in ``?sections=``. Each maps to the endpoint payload it replaces.
+BOOTSTRAP_SECTIONS = {
+    'site_info': SITE_INFO,
+    'statistics': STATISTICS,
+    'hero': HERO_CONTENT,
+    'welcome': WELCOME_SECTION,
+    'news': NEWS_ITEMS,
+    'events': EVENTS,
+    'gallery': GALLERY_IMAGES,
+    'testimonials': TESTIMONIALS,
+    'navigation': NAVIGATION,
+    'social': SOCIAL_STATS_FULL,
+}
+
+
+def parse_bootstrap_sections(value):
+    """
+    Turn a comma-separated ``?sections=`` value into a sorted tuple of names.
+
+    An empty value selects every section; unknown names raise ``ValueError``.
+    """
+    names = {name.strip() for name in (value or '').split(',') if name.strip()}
+    unknown = names - BOOTSTRAP_SECTIONS.keys()
+    if unknown:
+        raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}")
+    return tuple(sorted(names or BOOTSTRAP_SECTIONS))
+
+
+@functools.lru_cache(maxsize=64)
+def get_bootstrap(sections):
+    """
+    Return the combined payload for a tuple of section names, built once
+    """
+    return PreparedJSON({
+        'status': 'success',
+        'data': {name: BOOTSTRAP_SECTIONS[name].data for name in sections},
+        'count': len(sections),
+        'message': 'Homepage data retrieved successfully'
+    })
+
+
+class HomeBootstrapAPIView(View):
+    """
+    API endpoint returning every homepage section in one response
+    """
+    
+    async def get(self, request):
+        """
+        Return the requested sections (all by default) with a single ETag
+        """
+        try:
+            sections = parse_bootstrap_sections(request.GET.get('sections'))
+        except ValueError as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=400)
         
-        return JsonResponse({
-            'status': 'success',
-            'data': data,
-            'message': 'Testimonials retrieved successfully'
-        })
+        return get_bootstrap(sections).response(request)
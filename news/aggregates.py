@@ -0,0 +1,199 @@
+"""
+Materialized aggregates over blog posts.
+
+``TagPostCount`` holds the number of live posts per tag, ``SiteCounter``
+the number of live posts and indexes, and ``BlogMonthCount`` the number of
+live posts per post-date month.  Tag counts of the affected tags are
+recomputed whenever a post's tags change or it is published or
+unpublished.  Site and month counters are incremented and decremented in
+the database (``adjust_counter``, ``adjust_month_counts``) as pages go
+live, stop being live, change date or are deleted, inside the saving
+transaction (receivers in news.signals).  ``rebuild_all`` recomputes
+everything to correct any drift (``manage.py reconcile_blog_counters``).
+"""
+
+import datetime
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+from .models import BlogIndexPage, BlogMonthCount, BlogPage, BlogPageTag, SiteCounter, TagPostCount
+
+
+def count_live_posts(tag_ids=None):
+    tagged = BlogPageTag.objects.filter(content_object__live=True)
+    if tag_ids is not None:
+        tagged = tagged.filter(tag_id__in=tag_ids)
+    return dict(
+        tagged.values_list('tag_id')
+        .annotate(count=Count('content_object', distinct=True))
+    )
+
+
+@transaction.atomic
+def refresh_tag_counts(tag_ids):
+    """
+    Recompute the live post count of each tag; tags without live posts
+    are dropped from the table
+    """
+    tag_ids = set(tag_ids)
+    if not tag_ids:
+        return
+    counts = count_live_posts(tag_ids)
+    TagPostCount.objects.filter(tag_id__in=tag_ids - set(counts)).delete()
+    for tag_id, count in counts.items():
+        TagPostCount.objects.update_or_create(tag_id=tag_id, defaults={'count': count})
+
+
+def refresh_post_tags(post):
+    refresh_tag_counts(BlogPageTag.objects.filter(content_object=post).values_list('tag_id', flat=True))
+
+
+def rebuild_tag_counts():
+    """
+    Recompute the whole table
+    """
+    with transaction.atomic():
+        TagPostCount.objects.all().delete()
+        counts = count_live_posts()
+        TagPostCount.objects.bulk_create(
+            TagPostCount(tag_id=tag_id, count=count) for tag_id, count in counts.items()
+        )
+
+
+def tag_cloud(limit=None):
+    """
+    Tags with live posts, most used first
+    """
+    counts = TagPostCount.objects.select_related('tag').order_by('-count', 'tag__name')
+    if limit:
+        counts = counts[:limit]
+    return [
+        {'name': row.tag.name, 'slug': row.tag.slug, 'count': row.count}
+        for row in counts
+    ]
+
+
+COUNTER_QUERIES = {
+    SiteCounter.LIVE_POSTS: lambda: BlogPage.objects.live(),
+    SiteCounter.LIVE_INDEXES: lambda: BlogIndexPage.objects.live(),
+}
+
+
+def refresh_counter(name, exclude=None):
+    """
+    Recount a counter, leaving out the page ``exclude`` (one being deleted)
+    """
+    value = COUNTER_QUERIES[name]().exclude(pk=exclude).count()
+    SiteCounter.objects.update_or_create(name=name, defaults={'value': value})
+    return value
+
+
+def adjust_counter(name, delta, exclude=None):
+    """
+    Add ``delta`` to a counter, computing it in full the first time; the
+    recount leaves out ``exclude``, a page still in the database but being
+    deleted
+    """
+    if not delta:
+        return
+    if not SiteCounter.objects.filter(name=name).update(value=F('value') + delta):
+        refresh_counter(name, exclude)
+
+
+def get_counters():
+    """
+    All counters as a dict, 0 for any not computed yet
+    """
+    values = dict.fromkeys(COUNTER_QUERIES, 0)
+    values.update(SiteCounter.objects.values_list('name', 'value'))
+    return values
+
+
+@transaction.atomic
+def refresh_month_counts(dates, exclude=None):
+    """
+    Recompute the live post count of the months of the given dates, leaving
+    out the post ``exclude``
+    """
+    for year, month in {(date.year, date.month) for date in dates if date}:
+        count = BlogPage.objects.live().filter(date__year=year, date__month=month).exclude(pk=exclude).count()
+        if count:
+            BlogMonthCount.objects.update_or_create(year=year, month=month, defaults={'count': count})
+        else:
+            BlogMonthCount.objects.filter(year=year, month=month).delete()
+
+
+@transaction.atomic
+def adjust_month_counts(deltas, exclude=None):
+    """
+    Add each delta of a {(year, month): delta} dict to that month's count;
+    months not counted yet are computed in full (without ``exclude``, as in
+    ``adjust_counter``), months left empty dropped
+    """
+    for (year, month), delta in deltas.items():
+        if not delta:
+            continue
+        months = BlogMonthCount.objects.filter(year=year, month=month)
+        if not months.update(count=F('count') + delta):
+            refresh_month_counts([datetime.date(year, month, 1)], exclude)
+        elif delta < 0:
+            months.filter(count__lte=0).delete()
+
+
+def month_counts():
+    return [
+        {'year': row.year, 'month': row.month, 'count': row.count}
+        for row in BlogMonthCount.objects.all()
+    ]
+
+
+def blog_stats():
+    counters = get_counters()
+    return {
+        'total_posts': counters[SiteCounter.LIVE_POSTS],
+        'total_indexes': counters[SiteCounter.LIVE_INDEXES],
+        'tags': tag_cloud(),
+        'months': month_counts(),
+    }
+
+
+def archive_years():
+    """
+    Month counts grouped by year, newest first, for the archive sidebar
+    """
+    years = []
+    for row in BlogMonthCount.objects.all():
+        if not years or years[-1]['year'] != row.year:
+            years.append({'year': row.year, 'count': 0, 'months': []})
+        years[-1]['count'] += row.count
+        years[-1]['months'].append({
+            'month': row.month,
+            'date': datetime.date(row.year, row.month, 1),
+            'count': row.count,
+        })
+    return years
+
+
+def rebuild_all():
+    """
+    Recompute every counter, month and tag count in bulk
+    """
+    with transaction.atomic():
+        for name in COUNTER_QUERIES:
+            refresh_counter(name)
+
+        BlogMonthCount.objects.all().delete()
+        months = (
+            BlogPage.objects.live()
+            .annotate(year=ExtractYear('date'), month=ExtractMonth('date'))
+            .values_list('year', 'month')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        BlogMonthCount.objects.bulk_create(
+            BlogMonthCount(year=year, month=month, count=count) for year, month, count in months
+        )
+
+        rebuild_tag_counts()
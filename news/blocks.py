@@ -19,6 +19,7 @@ class BlogContentBlock(blocks.StructBlock):
     class Meta:
         icon = "doc-full"
         label = "Blog Content"
+        search_headings = ('title',)
 
 
 class BlogImageBlock(blocks.StructBlock):
@@ -0,0 +1,260 @@
+"""
+Streaming RSS and Atom feeds of published blog posts: for all posts, for
+the children of one BlogIndexPage and for one tag.
+
+Feeds are written item by item with ``SimplerXMLGenerator`` and streamed.
+While a feed streams, its bytes are also collected for the ``news`` cache,
+so up to ``CACHE_MAX_BYTES`` (2 MB) of it is held in memory; a larger feed
+drops the copy at that point and is streamed, never held whole, and not
+cached.  Later requests are answered from the cached copy.
+
+Each feed's cached output has its own generation (``feed_generation``):
+news.signals bumps those of the all-posts feed, the post's index and its
+tags (before and after the change) when a post is published, unpublished,
+moved or deleted, and the global ``feeds`` generation when an index page
+changes.
+
+Each feed carries an ETag and Last-Modified computed once per generation,
+so conditional polls from feed readers get a 304 without touching the
+database.
+"""
+
+import hashlib
+import io
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Max
+from django.shortcuts import get_object_or_404
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.utils.html import escape
+from django.utils.xmlutils import SimplerXMLGenerator
+from taggit.models import Tag
+from wagtail.rich_text import expand_db_html
+
+from st_mark.cache import get_cache
+
+from .models import BlogIndexPage, BlogPage
+
+GENERATION = 'feeds'
+MAX_ITEMS = 100
+CACHE_MAX_BYTES = 2 * 1024 * 1024
+
+
+class StreamingFeedMixin:
+    """
+    Write a feed as a sequence of byte chunks: the head, one chunk per
+    item, then the closing tags
+    """
+
+    item_element = None
+
+    def __init__(self, *args, last_modified=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_modified = last_modified
+
+    def latest_post_date(self):
+        # The base class scans self.items, which stays empty here
+        return self.last_modified or super().latest_post_date()
+
+    def make_item(self, **kwargs):
+        self.add_item(**kwargs)
+        return self.items.pop()
+
+    def stream(self, items, encoding='utf-8'):
+        buffer = io.StringIO()
+        handler = SimplerXMLGenerator(buffer, encoding, short_empty_elements=True)
+
+        def drain():
+            chunk = buffer.getvalue().encode(encoding)
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
+
+        handler.startDocument()
+        self.start_feed(handler)
+        yield drain()
+        for item in items:
+            handler.startElement(self.item_element, self.item_attributes(item))
+            self.add_item_elements(handler, item)
+            handler.endElement(self.item_element)
+            yield drain()
+        self.end_feed(handler)
+        yield drain()
+
+
+class StreamingRssFeed(StreamingFeedMixin, Rss201rev2Feed):
+    item_element = 'item'
+
+    def start_feed(self, handler):
+        self.add_stylesheets(handler)
+        handler.startElement('rss', self.rss_attributes())
+        handler.startElement('channel', self.root_attributes())
+        self.add_root_elements(handler)
+
+    def end_feed(self, handler):
+        self.endChannelElement(handler)
+        handler.endElement('rss')
+
+
+class StreamingAtomFeed(StreamingFeedMixin, Atom1Feed):
+    item_element = 'entry'
+
+    def start_feed(self, handler):
+        handler.startElement('feed', self.root_attributes())
+        self.add_root_elements(handler)
+
+    def end_feed(self, handler):
+        handler.endElement('feed')
+
+
+FEED_FORMATS = {
+    'rss': StreamingRssFeed,
+    'atom': StreamingAtomFeed,
+}
+
+
+@dataclass
+class FeedSource:
+    title: str
+    link: str
+    description: str
+    posts: object
+
+
+def feed_name(index_id=None, tag_slug=None):
+    return f"index-{index_id}" if index_id is not None else f"tag-{tag_slug}" if tag_slug else "all"
+
+
+def feed_scope(request, index_id=None, tag_slug=None):
+    """
+    What a cached feed is keyed on: the feed selection plus the scheme and
+    host, since the feed holds absolute URLs built from them
+    """
+    origin = hashlib.md5(f"{request.scheme}://{request.get_host()}".encode('utf-8')).hexdigest()
+    return f"{feed_name(index_id, tag_slug)}:{origin}"
+
+
+def feed_generation(cache, index_id=None, tag_slug=None):
+    """
+    Generation of one feed's cached output: the global one, bumped when an
+    index page changes, and the feed's own
+    """
+    own = cache.generation(f"{GENERATION}:{feed_name(index_id, tag_slug)}")
+    return f"{cache.generation(GENERATION)}.{own}"
+
+
+def invalidate_post_feeds(index_ids, tag_ids):
+    """
+    Expire the feeds a post appears in: all posts, its indexes and its tags
+    """
+    names = {feed_name()}
+    names.update(feed_name(index_id=index_id) for index_id in index_ids if index_id is not None)
+    tag_slugs = Tag.objects.filter(id__in=tag_ids).values_list('slug', flat=True)
+    names.update(feed_name(tag_slug=slug) for slug in tag_slugs)
+    cache = get_cache('news')
+    for name in names:
+        cache.bump(f"{GENERATION}:{name}")
+
+
+def get_source(request, index_id=None, tag_slug=None):
+    posts = BlogPage.listing_queryset().only(
+        *BlogPage.listing_fields, 'last_published_at', 'live_revision'
+    )
+    if index_id is not None:
+        index = get_object_or_404(BlogIndexPage.objects.live(), id=index_id)
+        return FeedSource(index.title, index.get_full_url(request), f"Latest posts from {index.title}",
+                          posts.child_of(index))
+    if tag_slug is not None:
+        tag = get_object_or_404(Tag, slug=tag_slug)
+        return FeedSource(f'News tagged "{tag.name}"', request.build_absolute_uri(f'/news/tag/{tag.slug}/'),
+                          f'Latest posts tagged "{tag.name}"', posts.filter(tagged_items__tag=tag))
+    return FeedSource("News", request.build_absolute_uri('/news/'), "Latest news", posts)
+
+
+def post_summary(post):
+    """
+    The post intro followed by its first content section, rendered once per
+    live revision and shared by every feed
+    """
+
+    def render():
+        summary = f"<p>{escape(post.intro)}</p>"
+        for block in post.body.raw_data:
+            if block['type'] == 'content':
+                return summary + expand_db_html(block['value'].get('content', ''))
+        return summary
+
+    if post.live_revision_id is None:
+        return render()
+    return get_cache('news').get_or_set(f"feed-summary:{post.live_revision_id}", render)
+
+
+def feed_items(feed, request, posts):
+    for post in posts[:MAX_ITEMS].iterator(chunk_size=50):
+        link = post.get_full_url(request)
+        yield feed.make_item(
+            title=post.title,
+            link=link,
+            description=post_summary(post),
+            unique_id=link,
+            pubdate=post.first_published_at,
+            updateddate=post.last_published_at,
+            categories=[tag.name for tag in post.tag_list],
+        )
+
+
+def build_feed(request, fmt, source, last_modified):
+    feed = FEED_FORMATS[fmt](
+        title=source.title,
+        link=source.link,
+        description=source.description,
+        feed_url=request.build_absolute_uri(request.path),
+        last_modified=last_modified,
+    )
+    return feed.stream(feed_items(feed, request, source.posts))
+
+
+def feed_metadata(fmt, scope, generation, source):
+    """
+    (etag, last_modified) of a feed; last_modified is None for an empty feed
+    """
+    last_modified = source.posts.aggregate(latest=Max('last_published_at'))['latest']
+    stamp = last_modified.isoformat() if last_modified else ''
+    digest = hashlib.sha256(f"{fmt}:{scope}:{generation}:{stamp}".encode('utf-8')).hexdigest()[:32]
+    return f'"{digest}"', last_modified
+
+
+def cache_chunks(chunks, key):
+    """
+    Pass chunks through, storing the whole feed once fully sent unless it
+    is larger than CACHE_MAX_BYTES.  Up to that many bytes are held in
+    memory meanwhile; past it the copy is dropped and chunks only stream.
+    """
+    parts, size = [], 0
+    for chunk in chunks:
+        if parts is not None:
+            parts.append(chunk)
+            size += len(chunk)
+            if size > CACHE_MAX_BYTES:
+                parts = None
+        yield chunk
+    if parts is not None:
+        get_cache('news').set(key, b''.join(parts))
+
+
+async def _async_chunks(chunks):
+    # The generator runs queries, so advance it in the sync thread
+    next_chunk = sync_to_async(next)
+    done = object()
+    while (chunk := await next_chunk(chunks, done)) is not done:
+        yield chunk
+
+
+def streaming_content(request, chunks):
+    """
+    ASGI servers can only stream async iterators; anything else is
+    buffered whole
+    """
+    return _async_chunks(chunks) if isinstance(request, ASGIRequest) else chunks
@@ -0,0 +1,157 @@
+"""
+Keyset-paginated listing of published blog posts for /api/blog/posts/.
+
+Posts are ordered newest first on ``(first_published_at, id)``.  Each page
+ends with an opaque ``next`` cursor encoding the last post's sort key; the
+next page is fetched with ``WHERE (first_published_at, id) < cursor``
+instead of an OFFSET, so deep pages cost the same as the first one.
+
+Query parameters:
+    cursor      ``next`` value from the previous page
+    limit       page size (default 20, max 100)
+    tag         tag slug
+    date_from   first post date to include (YYYY-MM-DD)
+    date_to     last post date to include (YYYY-MM-DD)
+    index       id of the parent BlogIndexPage
+    fields      comma-separated subset of ``POST_FIELDS``
+"""
+
+import base64
+import binascii
+import datetime
+import json
+
+from django.db.models import Prefetch, Q
+from django.utils.dateparse import parse_datetime
+
+from .models import BlogIndexPage, BlogPage, BlogPageTag
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class InvalidQuery(ValueError):
+    pass
+
+
+def _url(post, request):
+    return post.get_url(request)
+
+
+def _image(post, request):
+    if post.first_image is None:
+        return None
+    return post.first_image.get_rendition(BlogPage.listing_image_filter).url
+
+
+# name -> (model columns needed, value getter)
+POST_FIELDS = {
+    'id': ((), lambda post, request: post.id),
+    'title': (('title',), lambda post, request: post.title),
+    'slug': (('slug',), lambda post, request: post.slug),
+    'url': (('url_path', 'path', 'depth'), _url),
+    'date': (('date',), lambda post, request: post.date),
+    'first_published_at': ((), lambda post, request: post.first_published_at),
+    'intro': (('intro',), lambda post, request: post.intro),
+    'tags': ((), lambda post, request: [tag.slug for tag in post.tag_list]),
+    'image': (('body',), _image),
+}
+
+
+def encode_cursor(post):
+    key = json.dumps([post.first_published_at.isoformat(), post.id])
+    return base64.urlsafe_b64encode(key.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        published_at, post_id = json.loads(base64.urlsafe_b64decode(padded))
+        published_at = parse_datetime(published_at)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidQuery("Invalid cursor")
+    if published_at is None or not isinstance(post_id, int):
+        raise InvalidQuery("Invalid cursor")
+    return published_at, post_id
+
+
+def _parse_int(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise InvalidQuery(f"{name} must be an integer")
+
+
+def _parse_date(value, name):
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise InvalidQuery(f"{name} must be a date (YYYY-MM-DD)")
+
+
+def parse_fields(value):
+    if not value:
+        return list(POST_FIELDS)
+    fields = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in POST_FIELDS]
+    if unknown:
+        raise InvalidQuery(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def list_posts(params, request=None):
+    """
+    Build one page of the listing from a QueryDict of request parameters.
+    Raises ``InvalidQuery`` for malformed parameters.
+    """
+    limit = min(max(_parse_int(params.get('limit', DEFAULT_LIMIT), 'limit'), 1), MAX_LIMIT)
+    fields = parse_fields(params.get('fields'))
+
+    columns = {'id', 'first_published_at'}
+    for name in fields:
+        columns.update(POST_FIELDS[name][0])
+
+    posts = (
+        BlogPage.objects.live()
+        .filter(first_published_at__isnull=False)
+        .order_by('-first_published_at', '-id')
+        .only(*columns)
+    )
+
+    if params.get('index'):
+        index = BlogIndexPage.objects.filter(id=_parse_int(params['index'], 'index')).first()
+        if index is None:
+            return {'results': [], 'next': None}
+        posts = posts.child_of(index)
+    if params.get('tag'):
+        posts = posts.filter(tagged_items__tag__slug=params['tag'])
+    if params.get('date_from'):
+        posts = posts.filter(date__gte=_parse_date(params['date_from'], 'date_from'))
+    if params.get('date_to'):
+        posts = posts.filter(date__lte=_parse_date(params['date_to'], 'date_to'))
+    if params.get('cursor'):
+        published_at, post_id = decode_cursor(params['cursor'])
+        posts = posts.filter(
+            Q(first_published_at__lt=published_at)
+            | Q(first_published_at=published_at, id__lt=post_id)
+        )
+    if 'tags' in fields:
+        posts = posts.prefetch_related(
+            Prefetch('tagged_items', queryset=BlogPageTag.objects.select_related('tag'))
+        )
+
+    # One extra row tells whether there is a next page without a COUNT
+    page = list(posts[:limit + 1])
+    has_next = len(page) > limit
+    page = page[:limit]
+
+    if 'image' in fields:
+        BlogPage.attach_listing_images(page)
+
+    return {
+        'results': [
+            {name: POST_FIELDS[name][1](post, request) for name in fields}
+            for post in page
+        ],
+        'next': encode_cursor(page[-1]) if has_next else None,
+    }
@@ -0,0 +1,64 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+from news.models import BlogIndexPage, BlogPage
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the query plan and average run time of the hot blog listing queries. "
+        "Run before and after migrating to compare index changes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help="Runs per query for the timing")
+        parser.add_argument('--analyze', action='store_true', help="EXPLAIN ANALYZE (PostgreSQL only)")
+        parser.add_argument('--year', type=int, help="Year of the month archive query (default: latest post)")
+        parser.add_argument('--month', type=int, help="Month of the month archive query (default: latest post)")
+
+    def get_queries(self, year=None, month=None):
+        posts = BlogPage.objects.live().order_by('-first_published_at')
+        if year is None or month is None:
+            latest = posts.values_list('date', flat=True).first() or datetime.date.today()
+            year = latest.year if year is None else year
+            month = latest.month if month is None else month
+        queries = {
+            'latest posts': posts.only(*BlogPage.listing_fields)[:10],
+            'posts in month': posts.filter(date__year=year, date__month=month),
+        }
+        # Second page of /api/blog/posts/, after the 20th newest post
+        cursor = (
+            BlogPage.objects.live().filter(first_published_at__isnull=False)
+            .order_by('-first_published_at', '-id').values_list('first_published_at', 'id')[19:20].first()
+        )
+        if cursor is not None:
+            queries['posts after cursor'] = (
+                BlogPage.objects.live().order_by('-first_published_at', '-id')
+                .filter(Q(first_published_at__lt=cursor[0]) | Q(first_published_at=cursor[0], id__lt=cursor[1]))
+                .only('id', 'first_published_at')[:21]
+            )
+        index = BlogIndexPage.objects.live().first()
+        if index is not None:
+            queries['posts of index'] = BlogPage.listing_queryset().child_of(index)[:10]
+        tagged = BlogPage.tags.through.objects.select_related('tag').first()
+        if tagged is not None:
+            queries['posts with tag'] = posts.filter(tagged_items__tag=tagged.tag)[:10]
+        return queries
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Database: {connection.vendor}")
+        explain_options = {'analyze': True} if options['analyze'] and connection.vendor == 'postgresql' else {}
+
+        for name, queryset in self.get_queries(options['year'], options['month']).items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{name}"))
+            self.stdout.write(queryset.explain(**explain_options))
+
+            started = time.perf_counter()
+            for _ in range(options['repeat']):
+                list(queryset.all())
+            elapsed = (time.perf_counter() - started) / options['repeat'] * 1000
+            self.stdout.write(self.style.SUCCESS(f"{elapsed:.2f} ms per run"))
@@ -0,0 +1,23 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from news import related
+
+
+class Command(BaseCommand):
+    help = "Recompute the related posts of every live blog post."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help="Processes used for scoring (default: one per CPU)"
+        )
+        parser.add_argument('--chunk-size', type=int, default=200, help="Posts per work unit")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = related.rebuild(workers=options['workers'], chunk_size=options['chunk_size'])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt related posts for {count} posts in {elapsed:.1f}s"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from news import aggregates
+
+
+class Command(BaseCommand):
+    help = "Recompute the blog post, index, month and tag counters from the page tree."
+
+    def handle(self, *args, **options):
+        aggregates.rebuild_all()
+        counters = aggregates.get_counters()
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled {counters['live_posts']} live posts and {counters['live_indexes']} live indexes"
+        ))
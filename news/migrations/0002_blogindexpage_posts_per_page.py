@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:53
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogindexpage',
+            name='posts_per_page',
+            field=models.PositiveSmallIntegerField(default=10, help_text='Number of posts listed per page', validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+    ]
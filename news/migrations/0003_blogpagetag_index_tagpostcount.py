@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_blogindexpage_posts_per_page'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TagPostCount',
+            fields=[
+                ('tag', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='post_count', serialize=False, to='taggit.tag')),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='blogpagetag',
+            index=models.Index(fields=['tag', 'content_object'], name='news_blogpagetag_tag_post_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tagpostcount',
+            index=models.Index(fields=['-count'], name='news_tagpostcount_count_idx'),
+        ),
+    ]
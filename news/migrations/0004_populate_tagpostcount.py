@@ -0,0 +1,28 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def populate_tag_counts(apps, schema_editor):
+    BlogPageTag = apps.get_model('news', 'BlogPageTag')
+    TagPostCount = apps.get_model('news', 'TagPostCount')
+
+    counts = (
+        BlogPageTag.objects
+        .filter(content_object__live=True)
+        .values_list('tag_id')
+        .annotate(count=Count('content_object', distinct=True))
+    )
+    TagPostCount.objects.bulk_create(
+        TagPostCount(tag_id=tag_id, count=count) for tag_id, count in counts
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_blogpagetag_index_tagpostcount'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_tag_counts, migrations.RunPython.noop),
+    ]
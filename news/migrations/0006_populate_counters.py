@@ -0,0 +1,42 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def populate_counters(apps, schema_editor):
+    BlogPage = apps.get_model('news', 'BlogPage')
+    BlogIndexPage = apps.get_model('news', 'BlogIndexPage')
+    SiteCounter = apps.get_model('news', 'SiteCounter')
+    BlogMonthCount = apps.get_model('news', 'BlogMonthCount')
+
+    SiteCounter.objects.bulk_create([
+        SiteCounter(name='live_posts', value=BlogPage.objects.filter(live=True).count()),
+        SiteCounter(name='live_indexes', value=BlogIndexPage.objects.filter(live=True).count()),
+    ])
+
+    months = (
+        BlogPage.objects.filter(live=True)
+        .annotate(year=ExtractYear('date'), month=ExtractMonth('date'))
+        .values_list('year', 'month')
+        .annotate(count=Count('pk'))
+        .order_by()
+    )
+    BlogMonthCount.objects.bulk_create(
+        BlogMonthCount(year=year, month=month, count=count) for year, month, count in months
+    )
+
+
+def remove_counters(apps, schema_editor):
+    apps.get_model('news', 'SiteCounter').objects.all().delete()
+    apps.get_model('news', 'BlogMonthCount').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_sitecounter_blogmonthcount'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_counters, remove_counters),
+    ]
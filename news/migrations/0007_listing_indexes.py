@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_populate_counters'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        ('wagtailcore', '0095_groupsitepermission'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpage',
+            index=models.Index(fields=['date'], name='news_blogpage_date_idx'),
+        ),
+        # Listings filter on live and order by first_published_at; the page
+        # table belongs to wagtailcore, so the index is created directly.
+        # Same syntax on SQLite and PostgreSQL.
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS news_page_live_published_idx '
+            'ON wagtailcore_page (live, first_published_at)',
+            'DROP INDEX IF EXISTS news_page_live_published_idx',
+        ),
+    ]
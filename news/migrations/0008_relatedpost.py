@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_links', to='news.blogpage')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news.blogpage')),
+            ],
+            options={
+                'ordering': ['post', 'rank'],
+                'indexes': [models.Index(fields=['post', 'rank'], name='news_relatedpost_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'related'), name='news_relatedpost_unique_pair')],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0008_relatedpost'),
+    ]
+
+    operations = [
+        # The keyset listing (news.listing) orders by (first_published_at, id);
+        # with id in the index the tie-breaker is resolved from the index too.
+        migrations.RunSQL(
+            [
+                'DROP INDEX IF EXISTS news_page_live_published_idx',
+                'CREATE INDEX IF NOT EXISTS news_page_live_published_id_idx '
+                'ON wagtailcore_page (live, first_published_at, id)',
+            ],
+            [
+                'DROP INDEX IF EXISTS news_page_live_published_id_idx',
+                'CREATE INDEX IF NOT EXISTS news_page_live_published_idx '
+                'ON wagtailcore_page (live, first_published_at)',
+            ],
+        ),
+    ]
@@ -1,28 +1,85 @@
+from django.core.paginator import EmptyPage, Paginator
+from django.core.validators import MinValueValidator
 from django.db import models
-from wagtail.models import Page
+from django.db.models import Prefetch
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from wagtail.images import get_image_model
+from wagtail.models import Page, Site
 from wagtail.fields import RichTextField, StreamField
 from wagtail.admin.panels import FieldPanel
 from wagtail.search import index
 from modelcluster.fields import ParentalKey
 from modelcluster.contrib.taggit import ClusterTaggableManager
-from taggit.models import TaggedItemBase
+from taggit.models import Tag, TaggedItemBase
+from st_mark.cache import get_cache
+from st_mark.page_cache import PageCacheMixin
+from st_mark.search_text import HEADING, TEXT, stream_text
 from .blocks import BlogContentBlock, BlogImageBlock, BlogQuoteBlock
 
 
-class BlogIndexPage(Page):
+class BlogIndexPage(PageCacheMixin, Page):
     intro = RichTextField(blank=True)
+    posts_per_page = models.PositiveSmallIntegerField(
+        default=10,
+        validators=[MinValueValidator(1)],
+        help_text="Number of posts listed per page"
+    )
+
+    page_cache_query_params = ('page',)
 
     content_panels = Page.content_panels + [
-        FieldPanel('intro')
+        FieldPanel('intro'),
+        FieldPanel('posts_per_page'),
     ]
 
+    def get_posts(self):
+        """
+        Published child posts, newest first
+        """
+        return BlogPage.listing_queryset().child_of(self)
+
     def get_context(self, request):
-        # Update context to include only published posts, ordered by reverse-chron
         context = super().get_context(request)
-        blogpages = self.get_children().live().order_by('-first_published_at')
-        context['blogpages'] = blogpages
+        context['post_list'] = self.render_post_list(request)
         return context
 
+    @property
+    def post_list_generation(self):
+        # Bumped by news.signals whenever a child post changes
+        return f"blog-index:{self.path}"
+
+    def render_post_list(self, request):
+        """
+        HTML for the requested ``?page=`` of posts, cached until a child post
+        is published, unpublished, moved or deleted
+        """
+        try:
+            page_number = int(request.GET.get('page', 1))
+        except ValueError:
+            page_number = 1
+        site = Site.find_for_request(request)
+        cache = get_cache('news')
+        key = ':'.join(str(part) for part in (
+            'post-list', self.id, cache.generation(self.post_list_generation),
+            site.id if site else None, self.posts_per_page, page_number,
+        ))
+        return mark_safe(cache.get_or_set(key, lambda: self._render_post_list(request, page_number)))
+
+    def _render_post_list(self, request, page_number):
+        paginator = Paginator(self.get_posts(), self.posts_per_page)
+        try:
+            posts = paginator.page(page_number)
+        except EmptyPage:
+            posts = paginator.page(paginator.num_pages)
+
+        blogpages = BlogPage.attach_listing_images(list(posts.object_list))
+        return render_to_string(
+            'components/blog_post_list.html',
+            {'blogpages': blogpages, 'posts': posts, 'page': self},
+            request=request,
+        )
+
 
 class BlogPageTag(TaggedItemBase):
     content_object = ParentalKey(
@@ -31,8 +88,99 @@ class BlogPageTag(TaggedItemBase):
         on_delete=models.CASCADE
     )
 
+    class Meta:
+        # Tag -> posts lookups are answered from the index alone
+        indexes = [
+            models.Index(fields=['tag', 'content_object'], name='news_blogpagetag_tag_post_idx'),
+        ]
+
+
+class TagPostCount(models.Model):
+    """
+    Number of live blog posts per tag, maintained by news.signals
+    (see news.aggregates) so the tag cloud is a single indexed read
+    """
+    tag = models.OneToOneField(
+        Tag,
+        primary_key=True,
+        related_name='post_count',
+        on_delete=models.CASCADE
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-count'], name='news_tagpostcount_count_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.tag.name} ({self.count})"
+
+
+class SiteCounter(models.Model):
+    """
+    A named blog-wide count maintained by news.signals (see news.aggregates)
+    """
+    LIVE_POSTS = 'live_posts'
+    LIVE_INDEXES = 'live_indexes'
+
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} = {self.value}"
+
+
+class BlogMonthCount(models.Model):
+    """
+    Number of live blog posts per post-date month, maintained by news.signals
+    """
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['year', 'month'], name='news_blogmonthcount_unique_month'),
+        ]
+        ordering = ['-year', '-month']
+
+    def __str__(self):
+        return f"{self.year}-{self.month:02d} ({self.count})"
+
+
+class RelatedPost(models.Model):
+    """
+    One of the top-K most similar posts of a post, maintained by
+    news.related
+    """
+    post = models.ForeignKey(
+        'BlogPage',
+        related_name='related_links',
+        on_delete=models.CASCADE
+    )
+    related = models.ForeignKey(
+        'BlogPage',
+        related_name='+',
+        on_delete=models.CASCADE
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'related'], name='news_relatedpost_unique_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['post', 'rank'], name='news_relatedpost_rank_idx'),
+        ]
+        ordering = ['post', 'rank']
+
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.score:.3f})"
+
 
-class BlogPage(Page):
+class BlogPage(PageCacheMixin, Page):
     date = models.DateField("Post date")
     intro = models.CharField(max_length=250)
     body = StreamField([
@@ -44,12 +192,91 @@ class BlogPage(Page):
 
     search_fields = Page.search_fields + [
         index.SearchField('intro'),
-        index.SearchField('body'),
+        index.SearchField('body_headings', boost=2),
+        index.SearchField('body_text'),
     ]
 
+    # Fields used to render a post in a listing
+    listing_fields = (
+        'id', 'title', 'slug', 'url_path', 'path', 'depth',
+        'first_published_at', 'date', 'intro', 'body',
+    )
+    listing_image_filter = 'fill-400x225'
+    # Fields used to render a related post link
+    related_fields = ('title', 'url_path', 'path', 'depth', 'first_published_at', 'intro')
+
     content_panels = Page.content_panels + [
         FieldPanel('date'),
         FieldPanel('tags'),
         FieldPanel('intro'),
         FieldPanel('body'),
-    ]
\ No newline at end of file
+    ]
+
+    class Meta:
+        indexes = [
+            # Month/year archives
+            models.Index(fields=['date'], name='news_blogpage_date_idx'),
+        ]
+
+    @classmethod
+    def listing_queryset(cls):
+        """
+        Published posts, newest first, loading only what the listing shows
+        and their tags in one extra query
+        """
+        return (
+            cls.objects.live()
+            .order_by('-first_published_at')
+            .only(*cls.listing_fields)
+            .prefetch_related(
+                Prefetch('tagged_items', queryset=BlogPageTag.objects.select_related('tag'))
+            )
+        )
+
+    @property
+    def tag_list(self):
+        # Uses the tagged_items prefetched by listing_queryset()
+        return [item.tag for item in self.tagged_items.all()]
+
+    def get_related_posts(self):
+        """
+        Precomputed most similar live posts, best first
+        """
+        links = (
+            self.related_links.filter(related__live=True)
+            .select_related('related')
+            .only('post', 'rank', 'related', *(f'related__{name}' for name in self.related_fields))
+        )
+        return [link.related for link in links]
+
+    def body_headings(self):
+        return stream_text(self.body, HEADING)
+
+    def body_text(self):
+        return stream_text(self.body, TEXT)
+
+    @property
+    def first_image_id(self):
+        # Read the raw JSON so the StreamField is never deserialized
+        for block in self.body.raw_data:
+            if block['type'] == 'image' and block['value'].get('image'):
+                return block['value']['image']
+        return None
+
+    @classmethod
+    def attach_listing_images(cls, posts):
+        """
+        Set ``first_image`` on each post, fetching all images and their
+        listing renditions in two queries
+        """
+        image_ids = {post.first_image_id for post in posts} - {None}
+        images = {}
+        if image_ids:
+            images = (
+                get_image_model().objects
+                .prefetch_renditions(cls.listing_image_filter)
+                .in_bulk(image_ids)
+            )
+        for post in posts:
+            post.first_image = images.get(post.first_image_id)
+        return posts
@@ -0,0 +1,301 @@
+"""
+Related posts: a precomputed table of each live post's ``TOP_K`` most
+similar live posts (``RelatedPost``).
+
+Similarity of a candidate to a post is a weighted sum of
+
+* tag overlap: Jaccard over shared tags, each tag weighted by its inverse
+  document frequency (from ``TagPostCount``), so rare tags count more
+* term overlap: Jaccard over significant words of the title, intro and
+  content sections
+* recency: how close the two posts were published (half-life
+  ``RECENCY_HALF_LIFE_DAYS``)
+
+Only posts sharing at least one tag are candidates.  Once the publishing
+transaction commits, still on the editor's publishing request
+(news.signals):
+
+* a post published for the first time or with different tags is scored
+  against its candidates, and spliced into the list of each candidate it
+  now beats (``splice_after_commit``); publishing with unchanged tags does
+  nothing
+* a post unpublished or deleted is dropped (``remove_after_commit``)
+
+Posts already listing the changed post are recomputed in full, since it
+may have fallen out of their lists.  Stored scores of other posts are not
+refreshed when tag frequencies shift; ``manage.py rebuild_related_posts``
+recomputes everything, optionally on several forked processes.
+"""
+
+import heapq
+import math
+import multiprocessing
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils.html import strip_tags
+
+from st_mark.page_cache import purge_url_paths
+
+from .models import BlogPage, BlogPageTag, RelatedPost, SiteCounter, TagPostCount
+
+TOP_K = 5
+TAG_WEIGHT = 0.7
+TERM_WEIGHT = 0.1
+RECENCY_WEIGHT = 0.2
+RECENCY_HALF_LIFE_DAYS = 180
+
+WORD_RE = re.compile(r"[a-z]{4,}")
+STOP_WORDS = frozenset("""
+    about after also been before being from have into more most only other over
+    some such than that their them then there these they this those through very
+    were what when where which while will with your
+""".split())
+
+
+@dataclass(frozen=True)
+class PostData:
+    id: int
+    published: float
+    tags: frozenset
+    terms: frozenset
+
+
+def extract_terms(post):
+    text = [post.title, post.intro]
+    for block in post.body.raw_data:
+        if block['type'] == 'content':
+            text.append(block['value'].get('title', ''))
+            text.append(strip_tags(block['value'].get('content', '')))
+    words = WORD_RE.findall(' '.join(text).lower())
+    return frozenset(word for word in words if word not in STOP_WORDS)
+
+
+def load_corpus(post_ids=None):
+    """
+    PostData of live posts (all, or those in ``post_ids``), keyed by id
+    """
+    posts = BlogPage.objects.live().only('id', 'title', 'intro', 'body', 'first_published_at')
+    tagged = BlogPageTag.objects.filter(content_object__live=True)
+    if post_ids is not None:
+        posts = posts.filter(id__in=post_ids)
+        tagged = tagged.filter(content_object_id__in=post_ids)
+
+    tags = defaultdict(set)
+    for post_id, tag_id in tagged.values_list('content_object_id', 'tag_id'):
+        tags[post_id].add(tag_id)
+
+    return {
+        post.id: PostData(
+            id=post.id,
+            published=post.first_published_at.timestamp() if post.first_published_at else 0.0,
+            tags=frozenset(tags[post.id]),
+            terms=extract_terms(post),
+        )
+        for post in posts.iterator(chunk_size=500)
+    }
+
+
+def load_idf():
+    total = SiteCounter.objects.filter(name=SiteCounter.LIVE_POSTS).values_list('value', flat=True).first() or 1
+    return {
+        tag_id: math.log(1 + total / count)
+        for tag_id, count in TagPostCount.objects.values_list('tag_id', 'count')
+    }
+
+
+def build_tag_index(corpus):
+    index = defaultdict(set)
+    for post in corpus.values():
+        for tag_id in post.tags:
+            index[tag_id].add(post.id)
+    return index
+
+
+def score(post, other, idf):
+    union = post.tags | other.tags
+    union_weight = sum(idf.get(tag_id, 1.0) for tag_id in union)
+    tag_score = sum(idf.get(tag_id, 1.0) for tag_id in post.tags & other.tags) / union_weight if union_weight else 0.0
+
+    terms = post.terms | other.terms
+    term_score = len(post.terms & other.terms) / len(terms) if terms else 0.0
+
+    age_days = abs(post.published - other.published) / 86400
+    recency = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+    return TAG_WEIGHT * tag_score + TERM_WEIGHT * term_score + RECENCY_WEIGHT * recency
+
+
+def neighbours(post, corpus, tag_index, idf, k=TOP_K):
+    """
+    [(related_id, score)] of the k best candidates, best first
+    """
+    candidates = set()
+    for tag_id in post.tags:
+        candidates |= tag_index.get(tag_id, set())
+    candidates.discard(post.id)
+    scored = ((other_id, score(post, corpus[other_id], idf)) for other_id in candidates)
+    return heapq.nlargest(k, scored, key=lambda pair: (pair[1], pair[0]))
+
+
+def save_neighbours(results):
+    """
+    Replace the rows of the posts in ``results`` ({post_id: neighbours})
+    """
+    with transaction.atomic():
+        RelatedPost.objects.filter(post_id__in=list(results)).delete()
+        RelatedPost.objects.bulk_create(
+            RelatedPost(post_id=post_id, related_id=related_id, rank=rank, score=value)
+            for post_id, pairs in results.items()
+            for rank, (related_id, value) in enumerate(pairs, start=1)
+        )
+
+
+def refresh_posts(post_ids):
+    """
+    Recompute the neighbours of the given posts, loading only them and
+    the posts they share tags with
+    """
+    post_ids = set(post_ids)
+    if not post_ids:
+        return
+    tag_ids = BlogPageTag.objects.filter(content_object_id__in=post_ids).values_list('tag_id', flat=True)
+    candidate_ids = set(
+        BlogPageTag.objects.filter(tag_id__in=tag_ids, content_object__live=True)
+        .values_list('content_object_id', flat=True)
+    )
+    corpus = load_corpus(post_ids | candidate_ids)
+    tag_index = build_tag_index(corpus)
+    idf = load_idf()
+
+    save_neighbours({
+        post_id: neighbours(corpus[post_id], corpus, tag_index, idf) if post_id in corpus else []
+        for post_id in post_ids
+    })
+    purge_url_paths(*BlogPage.objects.filter(id__in=post_ids).values_list('url_path', flat=True))
+
+
+def listing_posts(post_id):
+    """
+    Posts currently listing ``post_id`` as related
+    """
+    return set(RelatedPost.objects.filter(related_id=post_id).values_list('post_id', flat=True))
+
+
+def splice(post_id):
+    """
+    Score a post against the posts sharing its tags, save its neighbours and
+    insert it into each candidate's list where it beats the K-th entry
+    """
+    tag_ids = BlogPageTag.objects.filter(content_object_id=post_id).values_list('tag_id', flat=True)
+    candidate_ids = set(
+        BlogPageTag.objects.filter(tag_id__in=tag_ids, content_object__live=True)
+        .values_list('content_object_id', flat=True)
+    )
+    corpus = load_corpus(candidate_ids | {post_id})
+    if post_id not in corpus:
+        return
+    post = corpus[post_id]
+    idf = load_idf()
+    results = {post_id: neighbours(post, corpus, build_tag_index(corpus), idf)}
+
+    # Listing posts hold a score for the old version of the post
+    listers = listing_posts(post_id) - {post_id}
+    others = candidate_ids - listers - {post_id}
+    current = defaultdict(list)
+    for other_id, related_id, value in (
+        RelatedPost.objects.filter(post_id__in=others).order_by('post', 'rank')
+        .values_list('post_id', 'related_id', 'score')
+    ):
+        current[other_id].append((related_id, value))
+    for other_id in others:
+        pairs = current[other_id]
+        value = score(corpus[other_id], post, idf)
+        if len(pairs) < TOP_K or value > pairs[-1][1]:
+            results[other_id] = heapq.nlargest(
+                TOP_K, pairs + [(post_id, value)], key=lambda pair: (pair[1], pair[0])
+            )
+
+    save_neighbours(results)
+    purge_url_paths(*BlogPage.objects.filter(id__in=list(results)).values_list('url_path', flat=True))
+    refresh_posts(listers)
+
+
+def splice_after_commit(post):
+    """
+    ``splice`` the post once the current transaction commits: the scoring
+    runs outside the publishing transaction, but still in the request
+    """
+    post_id = post.id
+    transaction.on_commit(lambda: splice(post_id))
+
+
+def remove_after_commit(post):
+    """
+    Drop an unpublished or deleted post once the current transaction
+    commits and recompute the posts that listed it.  Those are taken now,
+    while the post's rows still exist even if it is being deleted.
+    """
+    post_id = post.id
+    listers = listing_posts(post_id) - {post_id}
+
+    def remove():
+        RelatedPost.objects.filter(post_id=post_id).delete()
+        refresh_posts(listers)
+
+    transaction.on_commit(remove)
+
+
+# Shared with worker processes by rebuild()
+_corpus = _tag_index = _idf = None
+
+
+def _init_worker(corpus, tag_index, idf):
+    global _corpus, _tag_index, _idf
+    _corpus, _tag_index, _idf = corpus, tag_index, idf
+
+
+def _compute_chunk(post_ids):
+    return {post_id: neighbours(_corpus[post_id], _corpus, _tag_index, _idf) for post_id in post_ids}
+
+
+def _pool_context():
+    # Workers must inherit the configured Django apps: under spawn or
+    # forkserver they would import news.models before django.setup()
+    try:
+        return multiprocessing.get_context('fork')
+    except ValueError:
+        return None
+
+
+def rebuild(workers=1, chunk_size=200):
+    """
+    Recompute every post's neighbours; with ``workers`` > 1 the scoring is
+    spread over that many forked processes (serially where fork is not
+    available). Returns the number of posts.
+    """
+    corpus = load_corpus()
+    tag_index = build_tag_index(corpus)
+    idf = load_idf()
+    post_ids = sorted(corpus)
+    chunks = [post_ids[i:i + chunk_size] for i in range(0, len(post_ids), chunk_size)]
+
+    results = {}
+    context = _pool_context()
+    if workers > 1 and len(chunks) > 1 and context is not None:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(corpus, tag_index, idf)) as executor:
+            for chunk_result in executor.map(_compute_chunk, chunks):
+                results.update(chunk_result)
+    else:
+        _init_worker(corpus, tag_index, idf)
+        for chunk in chunks:
+            results.update(_compute_chunk(chunk))
+
+    with transaction.atomic():
+        RelatedPost.objects.all().delete()
+        save_neighbours(results)
+    return len(results)
@@ -0,0 +1,53 @@
+"""
+Resolve the URL of the news index for the /news/ and /blogs/ redirects.
+
+The URL is cached per request host under a generation that news.signals
+bumps when a blog index is published, unpublished or deleted, when any
+page moves, or when a site changes, so a redirect costs no queries once
+the cache is warm.
+"""
+
+from asgiref.sync import sync_to_async
+from wagtail.models import Site
+
+from st_mark.cache import get_cache
+
+from .models import BlogIndexPage
+
+GENERATION = 'news-index-url'
+FALLBACK_URL = '/'
+
+
+def find_news_index_url(request):
+    """
+    URL of the first live news index (in tree order) on the request's
+    site, or of any site if it has none; ``/`` if there is no index
+    """
+    indexes = BlogIndexPage.objects.live().order_by('path')
+    site = Site.find_for_request(request)
+    blog_index = None
+    if site is not None:
+        blog_index = indexes.descendant_of(site.root_page, inclusive=True).first()
+    if blog_index is None:
+        blog_index = indexes.first()
+    if blog_index is None:
+        return FALLBACK_URL
+    return blog_index.get_url(request) or FALLBACK_URL
+
+
+def _key(request, generation):
+    return f"news-index-url:{generation}:{request.get_host()}"
+
+
+async def news_index_url(request):
+    cache = get_cache('news')
+    key = _key(request, await cache.ageneration(GENERATION))
+    url = await cache.aget(key)
+    if url is None:
+        url = await sync_to_async(find_news_index_url)(request)
+        await cache.aset(key, url)
+    return url
+
+
+def invalidate():
+    get_cache('news').bump(GENERATION)
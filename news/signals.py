@@ -0,0 +1,187 @@
+"""
+Signal receivers keeping cached blog data in step with the page tree.
+
+Connected in ``NewsConfig.ready()``.
+"""
+
+from collections import Counter
+
+from django.db import connection
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from wagtail.models import Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from st_mark.cache import get_cache
+
+from . import feeds, related, resolver
+from .aggregates import adjust_counter, adjust_month_counts, refresh_post_tags, refresh_tag_counts
+from .models import BlogIndexPage, BlogPage, BlogPageTag, SiteCounter
+
+
+def bump_post_list(parent_path):
+    # Same generation name as BlogIndexPage.post_list_generation
+    get_cache('news').bump(f"blog-index:{parent_path}")
+
+
+def parent_path(page):
+    return page.path[:-page.steplen]
+
+
+@receiver(page_published, sender=BlogPage)
+@receiver(page_unpublished, sender=BlogPage)
+def invalidate_post_list(sender, instance, **kwargs):
+    bump_post_list(parent_path(instance))
+
+
+@receiver(post_page_move, sender=BlogPage)
+def invalidate_post_list_on_move(sender, instance, parent_page_before, parent_page_after, **kwargs):
+    bump_post_list(parent_page_before.path)
+    bump_post_list(parent_page_after.path)
+
+
+@receiver(post_delete, sender=BlogPage)
+def invalidate_post_list_on_delete(sender, instance, **kwargs):
+    bump_post_list(parent_path(instance))
+
+
+@receiver(page_published, sender=BlogIndexPage)
+def invalidate_own_post_list(sender, instance, **kwargs):
+    # posts_per_page may have changed
+    bump_post_list(instance.path)
+
+
+@receiver(post_save, sender=BlogPageTag)
+@receiver(post_delete, sender=BlogPageTag)
+def update_tag_count(sender, instance, **kwargs):
+    refresh_tag_counts([instance.tag_id])
+
+
+@receiver(page_published, sender=BlogPage)
+@receiver(page_unpublished, sender=BlogPage)
+def update_post_tag_counts(sender, instance, **kwargs):
+    refresh_post_tags(instance)
+
+
+# Counted state: (live, date) of a post, (live, None) of an index
+COUNTED_FIELDS = {BlogPage: ('live', 'date'), BlogIndexPage: ('live',)}
+
+
+def stored_state(model, pk):
+    """
+    The counted state currently in the database, locking the row when in a
+    transaction so concurrent saves are counted one after the other
+    """
+    rows = model.objects.filter(pk=pk)
+    if connection.in_atomic_block:
+        rows = rows.select_for_update()
+    state = rows.values_list(*COUNTED_FIELDS[model]).first()
+    if state is None:
+        return False, None
+    return state[0], state[1] if len(state) > 1 else None
+
+
+def count_state_change(model, old, new, exclude=None):
+    # exclude: a page being deleted, left out of any first full count
+    live_delta = int(new[0]) - int(old[0])
+    if model is BlogIndexPage:
+        adjust_counter(SiteCounter.LIVE_INDEXES, live_delta, exclude)
+        return
+    adjust_counter(SiteCounter.LIVE_POSTS, live_delta, exclude)
+    months = Counter()
+    if old[0] and old[1]:
+        months[(old[1].year, old[1].month)] -= 1
+    if new[0] and new[1]:
+        months[(new[1].year, new[1].month)] += 1
+    adjust_month_counts(months, exclude)
+
+
+@receiver(pre_save, sender=BlogPage)
+@receiver(pre_save, sender=BlogIndexPage)
+def remember_counted_state(sender, instance, update_fields=None, **kwargs):
+    if instance.pk and (update_fields is None or set(COUNTED_FIELDS[sender]) & set(update_fields)):
+        instance._counted_state = stored_state(sender, instance.pk)
+
+
+@receiver(post_save, sender=BlogPage)
+@receiver(post_save, sender=BlogIndexPage)
+def update_counters(sender, instance, created, **kwargs):
+    if created:
+        old = (False, None)
+    elif '_counted_state' in instance.__dict__:
+        old = instance.__dict__.pop('_counted_state')
+    else:
+        return
+    count_state_change(sender, old, (instance.live, getattr(instance, 'date', None)))
+
+
+@receiver(pre_delete, sender=BlogPage)
+@receiver(pre_delete, sender=BlogIndexPage)
+def update_counters_on_delete(sender, instance, **kwargs):
+    # Wagtail marks the instance unpublished before deleting, but not the row
+    count_state_change(sender, stored_state(sender, instance.pk), (False, None), exclude=instance.pk)
+
+
+@receiver(page_published, sender=BlogIndexPage)
+@receiver(page_unpublished, sender=BlogIndexPage)
+@receiver(post_delete, sender=BlogIndexPage)
+@receiver(post_page_move)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_news_index_url(sender, **kwargs):
+    resolver.invalidate()
+
+
+@receiver(page_published, sender=BlogIndexPage)
+@receiver(page_unpublished, sender=BlogIndexPage)
+@receiver(post_page_move, sender=BlogIndexPage)
+@receiver(post_delete, sender=BlogIndexPage)
+def invalidate_feeds(sender, **kwargs):
+    # Index titles and post URLs under the index may have changed
+    get_cache('news').bump(feeds.GENERATION)
+
+
+def related_state(post):
+    tag_ids = BlogPageTag.objects.filter(content_object_id=post.pk).values_list('tag_id', flat=True)
+    return frozenset(tag_ids)
+
+
+def parent_id(page):
+    return BlogIndexPage.objects.filter(path=parent_path(page)).values_list('id', flat=True).first()
+
+
+@receiver(page_published, sender=BlogPage)
+@receiver(page_unpublished, sender=BlogPage)
+@receiver(pre_delete, sender=BlogPage)
+def invalidate_post_feeds(sender, instance, **kwargs):
+    # Tags the post had when last live (see remember_related_state) drop out
+    # of their feeds on retagging
+    tag_ids = related_state(instance) | (getattr(instance, '_related_tags', None) or frozenset())
+    feeds.invalidate_post_feeds([parent_id(instance)], tag_ids)
+
+
+@receiver(post_page_move, sender=BlogPage)
+def invalidate_post_feeds_on_move(sender, instance, parent_page_before, parent_page_after, **kwargs):
+    feeds.invalidate_post_feeds([parent_page_before.id, parent_page_after.id], related_state(instance))
+
+
+@receiver(pre_save, sender=BlogPage)
+def remember_related_state(sender, instance, update_fields=None, **kwargs):
+    # Tags are saved with the page on publish; keep the ones scored so far
+    if instance.pk and update_fields is None:
+        was_live = BlogPage.objects.filter(pk=instance.pk, live=True).exists()
+        instance._related_tags = related_state(instance) if was_live else None
+
+
+@receiver(page_published, sender=BlogPage)
+def splice_related_posts(sender, instance, **kwargs):
+    # Republishing with the same tags leaves the related posts as they are
+    previous = getattr(instance, '_related_tags', None)
+    if previous is None or previous != related_state(instance):
+        related.splice_after_commit(instance)
+
+
+@receiver(page_unpublished, sender=BlogPage)
+@receiver(pre_delete, sender=BlogPage)
+def remove_related_posts(sender, instance, **kwargs):
+    related.remove_after_commit(instance)
@@ -16,24 +16,13 @@ class BlogManager {
     }
 
     handlePostClick(event) {
-        // Example of AJAX call for tracking blog post clicks
+        // Queue the click; the tracker batches it and sends it with sendBeacon
         const postUrl = $(event.target).attr('href');
         const postTitle = $(event.target).text();
         
-        $.ajax({
-            url: '/api/blog/click/',
-            method: 'POST',
-            data: JSON.stringify({
-                'post_url': postUrl,
-                'post_title': postTitle
-            }),
-            contentType: 'application/json',
-            success: (response) => {
-                console.log('Click tracked successfully:', response);
-            },
-            error: (xhr, status, error) => {
-                console.error('Error tracking click:', error);
-            }
+        window.stMarkTracker.track('blog_click', {
+            'post_url': postUrl,
+            'post_title': postTitle
         });
     }
 
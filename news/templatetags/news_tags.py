@@ -0,0 +1,17 @@
+from django import template
+
+from news.aggregates import archive_years
+
+register = template.Library()
+
+
+@register.inclusion_tag('components/archive_sidebar.html')
+def archive_sidebar(current_year=None, current_month=None):
+    """
+    Per-month post counts from BlogMonthCount, grouped by year
+    """
+    return {
+        'years': archive_years(),
+        'current_year': current_year,
+        'current_month': current_month,
+    }
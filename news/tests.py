@@ -1,3 +1,626 @@
-from django.test import TestCase
+import datetime
+import io
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Page
+
+from st_mark.cache import get_cache
+from home.templatetags.block_cache import block_cache_key
+from st_mark.page_cache import PageCacheMiddleware, path_generation_key
+
+from . import related
+from .aggregates import get_counters, month_counts, tag_cloud
+from .models import BlogIndexPage, BlogMonthCount, BlogPage, RelatedPost, SiteCounter, TagPostCount
+
+
+class BlogTestCase(TestCase):
+    """
+    Creates a news index with a few published posts under the site root page.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.root = Page.objects.get(depth=2)
+        self.index = self.root.add_child(instance=BlogIndexPage(title="News", slug="news-index"))
+
+    def add_post(self, index=None, **kwargs):
+        number = BlogPage.objects.count() + 1
+        kwargs.setdefault('title', f"Post {number}")
+        kwargs.setdefault('slug', f"post-{number}")
+        kwargs.setdefault('date', datetime.date(2025, 11, 1))
+        kwargs.setdefault('intro', f"Intro {number}")
+        tags = kwargs.pop('tags', ())
+        post = (index or self.index).add_child(instance=BlogPage(**kwargs))
+        if tags:
+            post.tags.add(*tags)
+        post.save_revision().publish()
+        return post
+
+
+class BlogAPITestCase(BlogTestCase):
+    def test_blog_stats(self):
+        self.add_post()
+        self.add_post()
+
+        response = self.client.get('/api/blog/stats/')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual(data['total_posts'], 2)
+        self.assertEqual(data['total_indexes'], 1)
+
+    def test_news_redirects_to_index(self):
+        response = self.client.get('/news/')
+
+        self.assertRedirects(response, self.index.url, fetch_redirect_response=False)
+
+    def test_news_redirect_is_resolved_from_cache(self):
+        self.client.get('/blogs/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/news/')
+
+        self.assertRedirects(response, self.index.url, fetch_redirect_response=False)
+
+    def test_news_redirect_follows_unpublishing(self):
+        self.client.get('/news/')
+
+        self.index.unpublish()
+
+        self.assertRedirects(self.client.get('/news/'), '/', fetch_redirect_response=False)
+
+
+class PageCacheTestCase(BlogTestCase):
+    def test_anonymous_repeat_request_is_served_from_cache(self):
+        post = self.add_post()
+
+        first = self.client.get(post.url)
+        second = self.client.get(post.url)
+
+        self.assertEqual(first['X-Page-Cache'], 'MISS')
+        self.assertEqual(second['X-Page-Cache'], 'HIT')
+        self.assertEqual(first.content, second.content)
+
+    def test_publish_purges_page_and_index(self):
+        post = self.add_post()
+        self.client.get(post.url)
+        self.client.get(self.index.url)
+
+        post.title = "Updated title"
+        post.save_revision().publish()
+
+        response = self.client.get(post.url)
+        self.assertEqual(response['X-Page-Cache'], 'MISS')
+        self.assertContains(response, "Updated title")
+        self.assertEqual(self.client.get(self.index.url)['X-Page-Cache'], 'MISS')
+
+    def test_hit_keeps_response_headers(self):
+        post = self.add_post()
+        serve = BlogPage.serve
+
+        def serve_with_header(page, request, *args, **kwargs):
+            response = serve(page, request, *args, **kwargs)
+            response['Cache-Control'] = 'max-age=60'
+            return response
+
+        with mock.patch.object(BlogPage, 'serve', serve_with_header):
+            self.client.get(post.url)
+        response = self.client.get(post.url)
+
+        self.assertEqual(response['X-Page-Cache'], 'HIT')
+        self.assertEqual(response['Cache-Control'], 'max-age=60')
+        self.assertEqual(response['Content-Type'], 'text/html; charset=utf-8')
+
+    def test_non_page_paths_are_not_looked_up(self):
+        self.add_post()
+        before = get_cache('pages').stats()
+
+        self.client.get('/api/navigation/')
+        self.client.get('/news/feeds/rss/')
+
+        self.assertEqual(get_cache('pages').stats(), before)
+
+    async def test_async_requests_are_served_from_cache(self):
+        post = await sync_to_async(self.add_post)()
+
+        first = await self.async_client.get(post.url)
+        second = await self.async_client.get(post.url)
+
+        self.assertEqual(first['X-Page-Cache'], 'MISS')
+        self.assertEqual(second['X-Page-Cache'], 'HIT')
+        self.assertEqual(first.content, second.content)
+
+    def test_middleware_stays_async_under_asgi(self):
+        async def get_response(request):
+            pass
+
+        self.assertTrue(iscoroutinefunction(PageCacheMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(PageCacheMiddleware(lambda request: None)))
+
+    def test_session_cookie_bypasses_cache(self):
+        post = self.add_post()
+        self.client.get(post.url)
+        self.client.cookies['sessionid'] = 'editor-session'
+
+        response = self.client.get(post.url)
+
+        self.assertNotIn('X-Page-Cache', response)
+
+
+class BlogIndexQueryTestCase(BlogTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        media_root = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(media_root.cleanup)
+        media_settings = override_settings(MEDIA_ROOT=media_root.name)
+        media_settings.enable()
+        cls.addClassCleanup(media_settings.disable)
+
+    def count_index_queries(self):
+        # The first request generates the renditions of new images
+        self.client.get(self.index.url)
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.index.url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def add_post_with_image(self, **kwargs):
+        image = get_image_model().objects.create(title="Photo", file=get_test_image_file())
+        return self.add_post(body=[('image', {'image': image, 'caption': "Photo"})], **kwargs)
+
+    def test_listing_query_count_does_not_grow_with_posts(self):
+        self.add_post_with_image(tags=['sports'])
+        self.add_post(tags=['sports', 'music'])
+        baseline = self.count_index_queries()
+
+        for _ in range(5):
+            self.add_post_with_image(tags=['music'])
+
+        self.assertEqual(self.count_index_queries(), baseline)
+        self.assertContains(self.client.get(self.index.url), 'class="card-img-top"', count=6)
+
+    def test_listing_shows_intro_and_tags(self):
+        self.add_post(intro="Sports day results", tags=['sports'])
+
+        response = self.client.get(self.index.url)
+
+        self.assertContains(response, "Sports day results")
+        self.assertContains(response, "sports")
+
+
+class BlogPostsAPITestCase(BlogTestCase):
+    def get_posts(self, **params):
+        response = self.client.get('/api/blog/posts/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_pages_through_posts_by_cursor(self):
+        posts = [self.add_post() for _ in range(5)]
+
+        first = self.get_posts(limit=2, fields='id')
+        second = self.get_posts(limit=2, fields='id', cursor=first['next'])
+        last = self.get_posts(limit=2, fields='id', cursor=second['next'])
+
+        ids = [item['id'] for item in first['data'] + second['data'] + last['data']]
+        self.assertEqual(ids, [post.id for post in reversed(posts)])
+        self.assertIsNone(last['next'])
+
+    def test_filters_by_tag_date_and_index(self):
+        other_index = self.root.add_child(instance=BlogIndexPage(title="Other", slug="other"))
+        tagged = self.add_post(tags=['sports'], date=datetime.date(2025, 3, 1))
+        self.add_post(tags=['music'], date=datetime.date(2025, 3, 1))
+        self.add_post(date=datetime.date(2024, 3, 1))
+        elsewhere = self.add_post(index=other_index)
+
+        self.assertEqual([p['id'] for p in self.get_posts(tag='sports')['data']], [tagged.id])
+        self.assertEqual(
+            len(self.get_posts(date_from='2025-01-01', date_to='2025-12-31', index=self.index.id)['data']),
+            2
+        )
+        self.assertEqual([p['id'] for p in self.get_posts(index=other_index.id)['data']], [elsewhere.id])
+
+    def test_sparse_fields(self):
+        post = self.add_post(tags=['sports'])
+
+        item = self.get_posts(fields='title,url,tags')['data'][0]
+
+        self.assertEqual(item, {'title': post.title, 'url': post.url, 'tags': ['sports']})
+
+    def test_rejects_invalid_parameters(self):
+        self.assertEqual(self.client.get('/api/blog/posts/', {'cursor': 'nope'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/blog/posts/', {'fields': 'secret'}).status_code, 400)
+
+
+class BlogIndexPaginationTestCase(BlogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.index.posts_per_page = 2
+        self.index.save_revision().publish()
+
+    def test_pages_through_posts(self):
+        for _ in range(3):
+            self.add_post()
+
+        first = self.client.get(self.index.url)
+        second = self.client.get(self.index.url, {'page': 2})
+        out_of_range = self.client.get(self.index.url, {'page': 9})
+
+        self.assertContains(first, "Post 3")
+        self.assertNotContains(first, "Post 1")
+        self.assertContains(first, "Page 1 of 2")
+        self.assertContains(second, "Post 1")
+        self.assertNotContains(second, "Post 3")
+        self.assertContains(out_of_range, "Page 2 of 2")
+
+    def test_publishing_a_post_refreshes_cached_pages(self):
+        self.add_post()
+        self.client.get(self.index.url)
+
+        self.add_post(title="Fresh news")
+
+        self.assertContains(self.client.get(self.index.url), "Fresh news")
+
+    def test_cached_slice_skips_post_queries(self):
+        self.add_post()
+        self.client.get(self.index.url, {'page': 1})
+        get_cache('pages').bump(path_generation_key(self.index.url))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.index.url, {'page': 1})
+
+        self.assertFalse(any('news_blogpage' in query['sql'] for query in queries))
+
+
+class TagTestCase(BlogTestCase):
+    def test_tag_page_lists_tagged_posts(self):
+        self.add_post(title="Football final", tags=['sports'])
+        self.add_post(title="Choir concert", tags=['music'])
+
+        response = self.client.get('/news/tag/sports/')
+
+        self.assertContains(response, "Football final")
+        self.assertNotContains(response, "Choir concert")
+        self.assertEqual(self.client.get('/news/tag/unknown/').status_code, 404)
+
+    def test_tag_counts_follow_publishing(self):
+        post = self.add_post(tags=['sports', 'music'])
+        self.add_post(tags=['sports'])
+
+        self.assertEqual(tag_cloud(), [
+            {'name': 'sports', 'slug': 'sports', 'count': 2},
+            {'name': 'music', 'slug': 'music', 'count': 1},
+        ])
+
+        post.unpublish()
+        self.assertEqual(tag_cloud(), [{'name': 'sports', 'slug': 'sports', 'count': 1}])
+
+        post.save_revision().publish()
+        self.assertEqual(len(tag_cloud()), 2)
+
+    def test_removing_a_tag_updates_counts(self):
+        post = self.add_post(tags=['sports', 'music'])
+
+        post.tags.remove('music')
+        post.save_revision().publish()
+
+        self.assertEqual([item['slug'] for item in tag_cloud()], ['sports'])
+
+    def test_tag_cloud_api(self):
+        self.add_post(tags=['sports'])
+
+        response = self.client.get('/api/blog/tags/')
+
+        self.assertEqual(response.json()['data'], [{'name': 'sports', 'slug': 'sports', 'count': 1}])
+
+
+class CounterTestCase(BlogTestCase):
+    def test_counters_follow_publishing(self):
+        post = self.add_post(date=datetime.date(2025, 3, 10))
+        self.add_post(date=datetime.date(2025, 3, 20))
+
+        self.assertEqual(get_counters(), {'live_posts': 2, 'live_indexes': 1})
+        self.assertEqual(month_counts(), [{'year': 2025, 'month': 3, 'count': 2}])
+
+        post.unpublish()
+        self.assertEqual(get_counters()['live_posts'], 1)
+        self.assertEqual(month_counts(), [{'year': 2025, 'month': 3, 'count': 1}])
+
+    def test_changing_the_date_moves_the_post_between_months(self):
+        post = self.add_post(date=datetime.date(2025, 3, 10))
+
+        post.date = datetime.date(2025, 4, 1)
+        post.save_revision().publish()
+
+        self.assertEqual(month_counts(), [{'year': 2025, 'month': 4, 'count': 1}])
+
+    def test_delete_updates_counters(self):
+        post = self.add_post()
+
+        post.delete()
+
+        self.assertEqual(get_counters()['live_posts'], 0)
+        self.assertEqual(month_counts(), [])
+
+    def test_counters_are_adjusted_not_recounted(self):
+        post = self.add_post(date=datetime.date(2025, 3, 10))
+        SiteCounter.objects.filter(name=SiteCounter.LIVE_POSTS).update(value=10)
+
+        # Republishing a live post leaves the (drifted) counter alone
+        post.save_revision().publish()
+        self.assertEqual(get_counters()['live_posts'], 10)
+
+        self.add_post(date=datetime.date(2025, 3, 20))
+        self.assertEqual(get_counters()['live_posts'], 11)
+        self.assertEqual(month_counts(), [{'year': 2025, 'month': 3, 'count': 2}])
+
+    def test_deleting_with_counters_missing_counts_the_rest(self):
+        post = self.add_post(date=datetime.date(2025, 3, 10))
+        self.add_post(date=datetime.date(2025, 3, 20))
+        SiteCounter.objects.all().delete()
+        BlogMonthCount.objects.all().delete()
+
+        post.delete()
+
+        self.assertEqual(get_counters()['live_posts'], 1)
+        self.assertEqual(month_counts(), [{'year': 2025, 'month': 3, 'count': 1}])
+
+    def test_reconcile_command_rebuilds_counters(self):
+        self.add_post(tags=['sports'], date=datetime.date(2025, 3, 10))
+        SiteCounter.objects.all().delete()
+        BlogMonthCount.objects.all().delete()
+        TagPostCount.objects.all().delete()
+
+        call_command('reconcile_blog_counters', stdout=io.StringIO())
+
+        self.assertEqual(get_counters(), {'live_posts': 1, 'live_indexes': 1})
+        self.assertEqual(month_counts(), [{'year': 2025, 'month': 3, 'count': 1}])
+        self.assertEqual(len(tag_cloud()), 1)
+
+
+class BlockCacheTestCase(BlogTestCase):
+    def test_blocks_render_from_cache_until_republished(self):
+        post = self.add_post(body=[('quote', {'quote': "Original quote", 'author': "Mark"})])
+        post = BlogPage.objects.get(pk=post.pk)
+
+        self.assertContains(self.client.get(post.url), "Original quote")
+        key = block_cache_key(post, post.body[0])
+        self.assertIn("Original quote", get_cache('blocks').get(key))
+
+        post.body[0].value['quote'] = "Revised quote"
+        post.save_revision().publish()
+
+        response = self.client.get(post.url)
+        self.assertContains(response, "Revised quote")
+        self.assertNotContains(response, "Original quote")
+
+
+    def test_blocks_render_without_request_context(self):
+        post = self.add_post(body=[('quote', {'quote': "Original quote", 'author': "Mark"})])
+        render = mock.Mock(return_value="<blockquote></blockquote>")
+
+        with mock.patch('wagtail.blocks.BoundBlock.render_as_block', render):
+            self.client.get(post.url)
+
+        self.assertEqual(set(render.call_args.kwargs['context']), {'page', 'site'})
+
+class ExplainCommandTestCase(BlogTestCase):
+    def test_prints_plans_and_timings(self):
+        self.add_post(tags=['sports'])
+        out = io.StringIO()
+
+        call_command('explain_blog_queries', repeat=1, year=2025, month=11, stdout=out)
+
+        self.assertIn("posts of index", out.getvalue())
+        self.assertIn("posts with tag", out.getvalue())
+        self.assertIn("posts in month", out.getvalue())
+        self.assertIn("ms per run", out.getvalue())
+
+
+class ArchiveTestCase(BlogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_post(title="Spring fair", date=datetime.date(2025, 3, 10))
+        self.add_post(title="Summer camp", date=datetime.date(2025, 7, 1))
+        self.add_post(title="Old news", date=datetime.date(2024, 7, 1))
+
+    def test_year_archive(self):
+        response = self.client.get('/news/archive/2025/')
+
+        self.assertContains(response, "Spring fair")
+        self.assertContains(response, "Summer camp")
+        self.assertNotContains(response, "Old news")
+
+    def test_month_archive_with_sidebar_counts(self):
+        response = self.client.get('/news/archive/2025/3/')
+
+        self.assertContains(response, "Spring fair")
+        self.assertNotContains(response, "Summer camp")
+        self.assertContains(response, 'href="/news/archive/2024/7/"')
+
+    def test_empty_period_is_not_found(self):
+        self.assertEqual(self.client.get('/news/archive/2023/').status_code, 404)
+        self.assertEqual(self.client.get('/news/archive/2025/13/').status_code, 404)
+
+
+class FeedTestCase(BlogTestCase):
+    def read(self, response):
+        if response.streaming:
+            return b''.join(response.streaming_content)
+        return response.content
+
+    def test_rss_feed_streams_posts_and_is_then_cached(self):
+        self.add_post(title="Science week", intro="Labs open", tags=['science'])
+
+        first = self.client.get('/news/feeds/rss/')
+        body = self.read(first)
+        second = self.client.get('/news/feeds/rss/')
+
+        self.assertTrue(first.streaming)
+        self.assertEqual(first['Content-Type'], 'application/rss+xml; charset=utf-8')
+        self.assertIn(b"<title>Science week</title>", body)
+        self.assertIn(b"<category>science</category>", body)
+        self.assertFalse(second.streaming)
+        self.assertEqual(second.content, body)
+
+    def test_atom_feeds_per_index_and_tag(self):
+        other_index = self.root.add_child(instance=BlogIndexPage(title="Other", slug="other"))
+        self.add_post(title="In news", tags=['sports'])
+        self.add_post(index=other_index, title="Elsewhere")
+
+        index_feed = self.read(self.client.get(f'/news/feeds/atom/index/{self.index.id}/'))
+        tag_feed = self.read(self.client.get('/news/feeds/atom/tag/sports/'))
+
+        self.assertIn(b"<entry>", index_feed)
+        self.assertIn(b"In news", index_feed)
+        self.assertNotIn(b"Elsewhere", index_feed)
+        self.assertIn(b"In news", tag_feed)
+        self.assertEqual(self.client.get('/news/feeds/json/').status_code, 404)
+        self.assertEqual(self.client.get('/news/feeds/rss/tag/unknown/').status_code, 404)
+
+    def test_cached_feed_is_per_host(self):
+        self.add_post(title="Science week")
+
+        self.read(self.client.get('/news/feeds/rss/', {'utm': 'x'}, HTTP_HOST='evil.example'))
+        body = self.read(self.client.get('/news/feeds/rss/'))
+
+        self.assertNotIn(b"evil.example", body)
+        self.assertIn(b"http://testserver/news/feeds/rss/", body)
+        self.assertNotIn(b"utm", body)
+
+    def test_conditional_requests_get_304_until_a_post_is_published(self):
+        self.add_post()
+        response = self.client.get('/news/feeds/rss/')
+        self.read(response)
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get('/news/feeds/rss/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+
+        self.add_post(title="Breaking")
+        refreshed = self.client.get('/news/feeds/rss/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertIn(b"Breaking", self.read(refreshed))
+
+
+    def test_publishing_expires_only_the_feeds_of_the_post(self):
+        other_index = self.root.add_child(instance=BlogIndexPage(title="Other", slug="other"))
+        post = self.add_post(title="In news", tags=['sports'])
+        self.read(self.client.get(f'/news/feeds/rss/index/{self.index.id}/'))
+        self.read(self.client.get('/news/feeds/rss/tag/sports/'))
+
+        self.add_post(index=other_index, title="Elsewhere")
+        self.assertFalse(self.client.get(f'/news/feeds/rss/index/{self.index.id}/').streaming)
+        self.assertFalse(self.client.get('/news/feeds/rss/tag/sports/').streaming)
+
+        # Retagging drops the post from the feed of its old tag
+        post.tags.set(['music'])
+        post.save_revision().publish()
+        self.assertNotIn(b"In news", self.read(self.client.get('/news/feeds/rss/tag/sports/')))
+
+class RelatedPostsTestCase(BlogTestCase):
+    # Related posts are recomputed once the publishing transaction commits
+    def add_post(self, index=None, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return super().add_post(index, **kwargs)
+
+    def related_ids(self, post):
+        return [related.id for related in BlogPage.objects.get(pk=post.pk).get_related_posts()]
+
+    def test_related_posts_ranked_by_shared_tags(self):
+        post = self.add_post(tags=['sports', 'football'])
+        close = self.add_post(tags=['sports', 'football'])
+        loose = self.add_post(tags=['sports', 'music'])
+        self.add_post(tags=['music'])
+
+        self.assertEqual(self.related_ids(post), [close.id, loose.id])
+        self.assertContains(self.client.get(post.url), "Related posts")
+
+    def test_unpublishing_removes_post_from_related(self):
+        post = self.add_post(tags=['sports'])
+        other = self.add_post(tags=['sports'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.unpublish()
+
+        self.assertEqual(self.related_ids(post), [])
+
+    def test_deleting_updates_related(self):
+        post = self.add_post(tags=['sports'])
+        other = self.add_post(tags=['sports'])
+        third = self.add_post(tags=['sports'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+
+        self.assertEqual(self.related_ids(post), [third.id])
+
+    def test_republishing_with_same_tags_skips_recompute(self):
+        post = self.add_post(tags=['sports'])
+        self.add_post(tags=['sports'])
+
+        with mock.patch.object(related, 'splice') as splice:
+            with self.captureOnCommitCallbacks(execute=True):
+                post.title = "Renamed"
+                post.save_revision().publish()
+
+        splice.assert_not_called()
+
+    def test_retagging_updates_lists(self):
+        post = self.add_post(tags=['sports'])
+        other = self.add_post(tags=['sports'])
+        music = self.add_post(tags=['music'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other = BlogPage.objects.get(pk=other.pk)
+            other.tags.set(['music'])
+            other.save_revision().publish()
+
+        self.assertEqual(self.related_ids(post), [])
+        self.assertEqual(self.related_ids(other), [music.id])
+        self.assertEqual(self.related_ids(music), [other.id])
+
+    def test_rebuild_command_matches_full_recompute(self):
+        posts = [self.add_post(tags=['sports'] + (['music'] if i % 2 else [])) for i in range(6)]
+        related.refresh_posts(post.id for post in posts)
+        expected = {post.id: self.related_ids(post) for post in posts}
+        RelatedPost.objects.all().delete()
+
+        call_command('rebuild_related_posts', workers=2, chunk_size=2, stdout=io.StringIO())
+
+        self.assertEqual({post.id: self.related_ids(post) for post in posts}, expected)
+
+
+@override_settings(SEARCH_INDEX_QUEUE_SYNC=True)
+class SearchTextTestCase(BlogTestCase):
+    def add_post(self, index=None, **kwargs):
+        # The search index is updated once the transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            return super().add_post(index, **kwargs)
+
+    def test_body_text_by_block(self):
+        post = BlogPage(title="Post", body=[
+            ('content', {'title': "Campus news", 'content': '<p>New <b>library</b> &amp; labs</p>'}),
+            ('quote', {'quote': "Knowledge is power", 'author': "Francis Bacon"}),
+        ])
+
+        self.assertEqual(post.body_headings(), "Campus news")
+        self.assertEqual(post.body_text(), "New library & labs\nKnowledge is power\nFrancis Bacon")
+
+    def test_search_matches_body_text_only(self):
+        post = self.add_post(body=[('quote', {'quote': "Knowledge is power", 'author': "Francis Bacon"})])
+
+        self.assertEqual(list(BlogPage.objects.live().search("Bacon")), [post])
+        # Block type names are not indexed
+        self.assertEqual(list(BlogPage.objects.live().search("quote")), [])
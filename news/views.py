@@ -1,40 +1,39 @@
-from django.shortcuts import render
-from django.http import HttpResponseRedirect, JsonResponse
+from asgiref.sync import sync_to_async
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.shortcuts import get_object_or_404, render
+from django.http import Http404, HttpResponse, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.views import View
+import datetime
 import json
-from .models import BlogIndexPage, BlogPage
 
+from analytics.ingest import InvalidEvent, arecord_event
+from analytics.models import TrackingEvent
+from st_mark.cache import cached_api, get_cache
+from taggit.models import Tag
 
-def redirect_to_news(request):
+from . import feeds
+from .aggregates import blog_stats, tag_cloud
+from .listing import InvalidQuery, list_posts
+from .models import BlogMonthCount, BlogPage
+from .resolver import news_index_url
+
+
+async def redirect_to_news(request):
     """
     Redirect to the news/blog index page
     """
-    # Try to find the blog index page
-    blog_index = BlogIndexPage.objects.first()
-    
-    if blog_index:
-        # If found, redirect to it
-        return HttpResponseRedirect(blog_index.url)
-    else:
-        # If not found, redirect to home page
-        return HttpResponseRedirect('/')
+    return HttpResponseRedirect(await news_index_url(request))
 
 
-def news_redirect_view(request):
+async def news_redirect_view(request):
     """
     Alternative redirect view for news
     """
-    # Find the first blog index page
-    try:
-        blog_index = BlogIndexPage.objects.live().first()
-        if blog_index:
-            return HttpResponseRedirect(blog_index.url)
-        else:
-            return HttpResponseRedirect('/')
-    except BlogIndexPage.DoesNotExist:
-        return HttpResponseRedirect('/')
+    return HttpResponseRedirect(await news_index_url(request))
 
 
 def news_landing_page(request):
@@ -44,41 +43,165 @@ def news_landing_page(request):
     return render(request, 'news/news_redirect.html')
 
 
+def paginate(request, posts, per_page=10):
+    paginator = Paginator(posts, per_page)
+    try:
+        return paginator.page(request.GET.get('page', 1))
+    except PageNotAnInteger:
+        return paginator.page(1)
+    except EmptyPage:
+        return paginator.page(paginator.num_pages)
+
+
+def tag_index(request, slug):
+    """
+    Published posts with a tag, newest first
+    """
+    tag = get_object_or_404(Tag, slug=slug)
+    page = paginate(request, BlogPage.listing_queryset().filter(tagged_items__tag=tag))
+
+    return render(request, 'news/tag_index_page.html', {
+        'tag': tag,
+        'posts': page,
+        'blogpages': BlogPage.attach_listing_images(list(page.object_list)),
+        'tag_cloud': tag_cloud(limit=30),
+    })
+
+
+def archive_index(request, year, month=None):
+    """
+    Published posts dated in a year or month, newest first
+    """
+    # The month counts say whether there is anything to list
+    months = BlogMonthCount.objects.filter(year=year)
+    if month is not None:
+        months = months.filter(month=month)
+    if not months.exists():
+        raise Http404("No posts in this period")
+
+    posts = BlogPage.listing_queryset().filter(date__year=year).order_by('-date', '-first_published_at')
+    if month is not None:
+        posts = posts.filter(date__month=month)
+    page = paginate(request, posts)
+
+    return render(request, 'news/archive_page.html', {
+        'year': year,
+        'month': datetime.date(year, month, 1) if month is not None else None,
+        'posts': page,
+        'blogpages': BlogPage.attach_listing_images(list(page.object_list)),
+    })
+
+
+def blog_feed(request, fmt, index_id=None, tag_slug=None):
+    """
+    RSS or Atom feed of all posts, of one index or of one tag
+    """
+    if fmt not in feeds.FEED_FORMATS:
+        raise Http404("Unknown feed format")
+
+    scope = feeds.feed_scope(request, index_id=index_id, tag_slug=tag_slug)
+    cache = get_cache('news')
+    generation = feeds.feed_generation(cache, index_id=index_id, tag_slug=tag_slug)
+
+    source = None
+    meta_key = f"feed-meta:{fmt}:{scope}:{generation}"
+    meta = cache.get(meta_key)
+    if meta is None:
+        source = feeds.get_source(request, index_id=index_id, tag_slug=tag_slug)
+        meta = feeds.feed_metadata(fmt, scope, generation, source)
+        cache.set(meta_key, meta)
+    etag, last_modified = meta
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        content_type = feeds.FEED_FORMATS[fmt].content_type
+        body_key = f"feed:{fmt}:{scope}:{generation}"
+        content = cache.get(body_key)
+        if content is not None:
+            response = HttpResponse(content, content_type=content_type)
+        else:
+            source = source or feeds.get_source(request, index_id=index_id, tag_slug=tag_slug)
+            chunks = feeds.build_feed(request, fmt, source, last_modified)
+            response = StreamingHttpResponse(
+                feeds.streaming_content(request, feeds.cache_chunks(chunks, body_key)),
+                content_type=content_type
+            )
+
+    response.headers['ETag'] = etag
+    if timestamp is not None:
+        response.headers['Last-Modified'] = http_date(timestamp)
+    patch_cache_control(response, public=True, max_age=300)
+    return response
+
+
+class BlogTagsView(View):
+    """
+    API endpoint for the tag cloud: tags with their live post counts
+    """
+    async def get(self, request):
+        tags = await sync_to_async(tag_cloud)()
+
+        return JsonResponse({
+            'status': 'success',
+            'data': tags,
+            'count': len(tags)
+        })
+
+
 class BlogStatsView(View):
     """
     API endpoint for blog statistics
     """
-    def get(self, request):
-        # Get total number of blog posts
-        total_posts = BlogPage.objects.live().count()
-        
-        # Get total number of blog index pages
-        total_indexes = BlogIndexPage.objects.live().count()
-        
+    @cached_api('news', timeout=60)
+    async def get(self, request):
+        # Counters are kept up to date by news.signals, so this is a few
+        # primary-key and indexed reads rather than COUNT queries
+        stats = await sync_to_async(blog_stats)()
+
         data = {
             'status': 'success',
-            'data': {
-                'total_posts': total_posts,
-                'total_indexes': total_indexes
-            },
-            'count': 2
+            'data': stats,
+            'count': len(stats)
         }
-        
+
         return JsonResponse(data)
 
 
+class BlogPostsView(View):
+    """
+    API endpoint listing published blog posts, paginated by cursor
+    """
+    async def get(self, request):
+        try:
+            page = await sync_to_async(list_posts)(request.GET, request)
+        except InvalidQuery as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=400)
+
+        return JsonResponse({
+            'status': 'success',
+            'data': page['results'],
+            'count': len(page['results']),
+            'next': page['next']
+        })
+
+
 @method_decorator(csrf_exempt, name='dispatch')
 class BlogClickView(View):
     """
     API endpoint for tracking blog post clicks
     """
-    def post(self, request):
+    async def post(self, request):
         try:
             # Parse JSON data from request body
             body_unicode = request.body.decode('utf-8')
             body_data = json.loads(body_unicode)
             
-            # Extract data (in a real implementation, you might save this to a database)
+            await arecord_event(TrackingEvent.BLOG_CLICK, body_data)
+            
             post_url = body_data.get('post_url', '')
             post_title = body_data.get('post_title', '')
             
@@ -98,6 +221,11 @@ class BlogClickView(View):
                 'status': 'error',
                 'message': 'Invalid JSON data'
             }, status=400)
+        except InvalidEvent as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=400)
         except Exception as e:
             return JsonResponse({
                 'status': 'error',
@@ -0,0 +1,169 @@
+"""
+Deferred, coalescing search index updates.
+
+The search backend runs with ``AUTO_UPDATE`` off, so Wagtail no longer
+reindexes objects on the publishing request.  Instead search.signals
+records every save or delete of an indexed model in ``SearchIndexQueue``
+(one row per object, however many times it changes) in the same
+transaction, and ``manage.py process_search_index`` applies the queue in
+batches: one ``add_bulk`` per model for objects that still exist, a
+delete for the others.
+
+A row changed again while its batch is applied is left for the next
+batch.  Rows whose update raised stay queued and are retried after a
+backoff that doubles with each attempt (up to ``MAX_RETRY_DELAY``), so a
+failing model does not hold up the rest of the queue.
+
+The Docker image runs ``process_search_index --loop`` next to the
+application server.  Set ``SEARCH_INDEX_QUEUE_SYNC = True`` to apply each
+change as soon as its transaction commits instead, as Wagtail does by
+default (development settings, tests).
+"""
+
+import datetime
+import logging
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+from wagtail.search.backends import get_search_backends
+
+from st_mark.cache import get_cache
+
+from . import results
+from .models import SearchIndexQueue
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+MAX_RETRY_DELAY = 3600
+
+
+def enqueue(instance):
+    content_type = ContentType.objects.get_for_model(instance)
+    object_id = str(instance.pk)
+    now = timezone.now()
+    SearchIndexQueue.objects.bulk_create(
+        [SearchIndexQueue(content_type=content_type, object_id=object_id, queued_at=now, dirty_at=now)],
+        update_conflicts=True,
+        unique_fields=['content_type', 'object_id'],
+        update_fields=['dirty_at'],
+    )
+    if getattr(settings, 'SEARCH_INDEX_QUEUE_SYNC', False):
+        transaction.on_commit(lambda: apply(
+            SearchIndexQueue.objects.filter(content_type=content_type, object_id=object_id)
+        ))
+
+
+def _update_index(model, object_ids):
+    """
+    Reindex the given objects of ``model``, removing those that no longer
+    exist; returns whether every backend succeeded
+    """
+    found = {str(obj.pk): obj for obj in model.get_indexed_objects().filter(pk__in=object_ids)}
+    by_model = defaultdict(list)
+    for obj in found.values():
+        # Page rows saved through the base class are indexed as their specific type
+        indexed = obj.get_indexed_instance()
+        if indexed is not None:
+            by_model[type(indexed)].append(indexed)
+    removed = [model(pk=object_id) for object_id in object_ids if object_id not in found]
+
+    ok = True
+    for backend in get_search_backends():
+        try:
+            for indexed_model, objs in by_model.items():
+                backend.add_bulk(indexed_model, objs)
+            for obj in removed:
+                backend.delete(obj)
+        except Exception:
+            logger.exception("Could not update %s objects in the %s search backend", model.__name__, backend)
+            ok = False
+    return ok
+
+
+def apply(rows):
+    """
+    Apply the given queue rows and remove them; returns how many were applied
+    """
+    rows = list(rows)
+    by_type = defaultdict(list)
+    for row in rows:
+        by_type[row.content_type_id].append(row)
+
+    done, failed = [], []
+    for content_type_id, type_rows in by_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None or _update_index(model, [row.object_id for row in type_rows]):
+            done.extend(type_rows)
+        else:
+            failed.extend(type_rows)
+
+    now = timezone.now()
+    for row in failed:
+        delay = min(2 ** row.attempts, MAX_RETRY_DELAY)
+        SearchIndexQueue.objects.filter(pk=row.pk).update(
+            attempts=F('attempts') + 1,
+            retry_at=now + datetime.timedelta(seconds=delay),
+        )
+
+    if done:
+        SearchIndexQueue.objects.filter(
+            reduce(or_, (Q(pk=row.pk, dirty_at=row.dirty_at) for row in done))
+        ).delete()
+        # Cached search results may predate the update
+        get_cache('search').bump(results.GENERATION)
+    return len(done)
+
+
+def due_rows(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    The oldest ``batch_size`` queued updates not waiting for a retry
+    """
+    return list(
+        SearchIndexQueue.objects
+        .filter(Q(retry_at__isnull=True) | Q(retry_at__lte=timezone.now()))
+        .order_by('queued_at', 'pk')[:batch_size]
+    )
+
+
+def process_batch(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Apply one batch of due updates; returns how many were applied
+    """
+    return apply(due_rows(batch_size))
+
+
+def process(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Apply batches until no update is due; returns how many were applied.
+    Failed updates are not due again within the same run.
+    """
+    total = 0
+    while rows := due_rows(batch_size):
+        total += apply(rows)
+    return total
+
+
+def queue_stats():
+    """
+    Queue depth, updates waiting for a retry after failing, and lag: the age
+    in seconds of the oldest pending update
+    """
+    stats = SearchIndexQueue.objects.aggregate(
+        depth=Count('pk'),
+        failing=Count('pk', filter=Q(attempts__gt=0)),
+        oldest=Min('queued_at'),
+    )
+    oldest = stats['oldest']
+    return {
+        'depth': stats['depth'],
+        'failing': stats['failing'],
+        'lag_seconds': round((timezone.now() - oldest).total_seconds(), 3) if oldest else 0.0,
+        'oldest': oldest.isoformat() if oldest else None,
+    }
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from search import index_queue
+
+
+class Command(BaseCommand):
+    help = "Apply queued search index updates in batches."
+
+    def add_arguments(self, parser):
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument('--once', action='store_true', help="Drain the queue, then exit (default)")
+        mode.add_argument('--loop', action='store_true', help="Keep polling the queue")
+        mode.add_argument('--stats', action='store_true', help="Print the queue depth and lag, then exit")
+        parser.add_argument(
+            '--batch-size', type=int, default=index_queue.DEFAULT_BATCH_SIZE,
+            help="Updates applied per batch"
+        )
+        parser.add_argument('--interval', type=float, default=2.0, help="Seconds between polls with --loop")
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            stats = index_queue.queue_stats()
+            self.stdout.write(
+                f"depth: {stats['depth']}\nfailing: {stats['failing']}\nlag: {stats['lag_seconds']}s"
+            )
+            return
+
+        while True:
+            applied = index_queue.process(options['batch_size'])
+            if applied or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f"Applied {applied} search index updates"))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchindexqueue',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='searchindexqueue',
+            name='retry_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils import timezone
+
+
+class SearchIndexQueue(models.Model):
+    """
+    An object whose search index entry is out of date.
+
+    Saving or deleting an indexed object upserts its row, so repeated edits
+    coalesce into one pending update.  Rows are applied in batches and
+    removed by ``search.index_queue``.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name='+')
+    object_id = models.CharField(max_length=255)
+    # First change not yet indexed, for the queue lag
+    queued_at = models.DateTimeField(default=timezone.now)
+    # Latest change; a row changed while it was being applied is kept
+    dirty_at = models.DateTimeField(default=timezone.now)
+    # Failed applications so far, and when to try again
+    attempts = models.PositiveIntegerField(default=0)
+    retry_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='search_indexqueue_unique_object'),
+        ]
+        indexes = [
+            models.Index(fields=['queued_at'], name='search_indexqueue_queued_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type_id}:{self.object_id}"
@@ -0,0 +1,72 @@
+"""
+Count-free pagination for search results.
+
+``Paginator`` counts every match to know the number of pages, which with
+the database search backend runs the search twice.  ``SeekPage`` fetches
+one result more than the page size instead: if it comes back there is a
+next page.  The total is only computed when asked for.
+"""
+
+
+class SeekPage:
+    """
+    One page of results, with the same navigation attributes as a
+    ``django.core.paginator.Page`` except for the page count
+    """
+
+    def __init__(self, object_list, number, page_size, has_next, count=None):
+        self.object_list = object_list
+        self.number = number
+        self.page_size = page_size
+        self._has_next = has_next
+        # Total number of matches, if it was requested
+        self.count = count
+
+    @classmethod
+    def fetch(cls, results, number, page_size, with_count=False):
+        offset = (number - 1) * page_size
+        rows = list(results[offset:offset + page_size + 1])
+        return cls(
+            rows[:page_size],
+            number,
+            page_size,
+            has_next=len(rows) > page_size,
+            count=results.count() if with_count else None,
+        )
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+    def start_index(self):
+        return (self.number - 1) * self.page_size + 1 if self.object_list else 0
+
+    def end_index(self):
+        return (self.number - 1) * self.page_size + len(self.object_list)
+
+
+def parse_page_number(value):
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return 1
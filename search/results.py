@@ -0,0 +1,112 @@
+"""
+Cached site search results.
+
+Each page of results is stored in the ``search`` cache namespace as the
+page ids and relevance scores only, keyed by site, page number and the
+normalized query: lowercased, with punctuation and repeated whitespace
+dropped, so "Admissions", " admissions " and "ADMISSIONS!" share one entry.
+The backend is searched with that same normalized text.  On PostgreSQL,
+whose full-text search stems both the index and the query, plural endings
+are folded into the key too; SQLite's tokenizer does not stem, so there
+"admission" and "admissions" are different searches.  A hit costs one cache
+read and one ``in_bulk`` fetch of the pages.
+
+Entries are keyed under a ``results`` generation that search.signals bumps
+whenever any page is published, unpublished or moved, and that
+search.index_queue bumps after applying index updates.
+"""
+
+import hashlib
+import re
+
+from django.db import connection
+from wagtail.models import Page
+
+from st_mark.cache import get_cache
+
+from .pagination import SeekPage
+
+GENERATION = 'results'
+
+WORD_RE = re.compile(r"\w+")
+
+
+def stem(word):
+    # Plural endings only (Porter step 1a), enough to fold the common variants
+    if word.endswith('sses'):
+        return word[:-2]
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith('s') and not word.endswith(('ss', 'us', 'is')) and len(word) > 3:
+        return word[:-1]
+    return word
+
+
+def normalize_query(query):
+    return ' '.join(WORD_RE.findall(query.lower()))
+
+
+def query_key(query):
+    """
+    The part of the cache key identifying a normalized query
+    """
+    if connection.vendor == 'postgresql':
+        query = ' '.join(stem(word) for word in query.split())
+    return hashlib.md5(query.encode('utf-8')).hexdigest()
+
+
+def base_queryset(site):
+    pages = Page.objects.live()
+    if site is not None:
+        pages = pages.in_site(site)
+    return pages
+
+
+def _key(kind, query, site, *parts):
+    cache = get_cache('search')
+    digest = query_key(query)
+    generation = cache.generation(GENERATION)
+    site_id = site.id if site is not None else 0
+    return ':'.join(str(part) for part in (kind, generation, site_id, digest, *parts))
+
+
+def search_page(query, number, page_size, site=None, with_count=False):
+    """
+    One SeekPage of live pages matching ``query``, in relevance order; each
+    has a ``search_score`` attribute where the backend provides scores
+    """
+    cache = get_cache('search')
+    query = normalize_query(query)
+    if not query:
+        return SeekPage([], number, page_size, has_next=False, count=0 if with_count else None)
+    key = _key('results', query, site, number, page_size)
+    entry = cache.get(key)
+
+    if entry is None:
+        results = base_queryset(site).search(query)
+        # Wagtail's SQLite full-text backend cannot annotate scores; its
+        # results are still in relevance order
+        if connection.vendor != 'sqlite':
+            results = results.annotate_score('search_score')
+        fetched = SeekPage.fetch(results, number, page_size)
+        pages, has_next = fetched.object_list, fetched.has_next()
+        for page in pages:
+            page.search_score = getattr(page, 'search_score', None)
+        cache.set(key, ([(page.id, page.search_score) for page in pages], has_next))
+    else:
+        hits, has_next = entry
+        found = base_queryset(site).in_bulk([page_id for page_id, _ in hits])
+        pages = []
+        for page_id, score in hits:
+            # Skip pages unpublished since, should the bump have been missed
+            if page_id in found:
+                found[page_id].search_score = score
+                pages.append(found[page_id])
+
+    count = None
+    if with_count:
+        count = cache.get_or_set(
+            _key('count', query, site),
+            lambda: base_queryset(site).search(query).count()
+        )
+    return SeekPage(pages, number, page_size, has_next, count=count)
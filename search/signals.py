@@ -0,0 +1,45 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.search import index
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from st_mark.cache import get_cache
+
+from . import index_queue, suggest
+from .results import GENERATION
+
+
+# Expire on commit, so other requests cannot cache the old state under the
+# new generation; search.index_queue expires results again once the index
+# itself is updated
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def expire_search_results(sender, instance, **kwargs):
+    transaction.on_commit(lambda: get_cache('search').bump(GENERATION))
+
+
+@receiver(page_published)
+def update_suggestions(sender, instance, **kwargs):
+    transaction.on_commit(lambda: suggest.page_published(instance))
+
+
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def expire_suggestions(sender, instance, **kwargs):
+    transaction.on_commit(suggest.expire)
+
+
+def queue_index_update(sender, instance, raw=False, **kwargs):
+    # Fixtures are loaded raw; update_index covers them
+    if not raw:
+        index_queue.enqueue(instance)
+
+
+# The search backend's AUTO_UPDATE is off; see search.index_queue
+for model in index.get_indexed_models():
+    if getattr(model, 'search_auto_update', True):
+        post_save.connect(queue_index_update, sender=model)
+        post_delete.connect(queue_index_update, sender=model)
@@ -0,0 +1,208 @@
+"""
+Typeahead suggestions for /api/search/suggest/.
+
+Live page titles and the tags of live blog posts are kept in a
+``PrefixIndex``: a sorted list of ``(term, kind, id)`` searched with
+``bisect``, so a lookup is a binary search plus a short scan and never
+touches the database.  Every word suffix of a title is a term, so "open d"
+finds "Admissions open day".  An index holds at most ``MAX_TERMS`` terms.
+
+Each worker process keeps one index per site, with that site's pages and
+every tag, built on first use.  The indexes are tied to the ``suggest``
+generation of the ``search`` cache namespace, which search.signals bumps
+when a page is published, unpublished or moved.  A worker seeing a newer
+generation rebuilds the site's index on that one request, outside the lock,
+while concurrent requests keep using the previous index.  The worker
+handling a publish updates its current indexes in place instead.
+"""
+
+import threading
+from bisect import bisect_left, insort
+
+from django.urls import reverse
+from taggit.models import Tag
+from wagtail.models import Page, Site
+
+from news.models import BlogPage
+from st_mark.cache import get_cache
+
+GENERATION = 'suggest'
+
+MAX_TERMS = 50000
+MAX_WORDS = 6
+MAX_TERM_LENGTH = 60
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+
+def normalize(text):
+    return ' '.join(text.lower().split())
+
+
+def index_terms(label):
+    words = normalize(label).split()
+    return {' '.join(words[i:])[:MAX_TERM_LENGTH] for i in range(min(len(words), MAX_WORDS))}
+
+
+class PrefixIndex:
+    def __init__(self, max_terms=MAX_TERMS):
+        self.max_terms = max_terms
+        # Sorted (term, kind, id)
+        self.terms = []
+        # (kind, id) -> (label, url)
+        self.items = {}
+
+    def __len__(self):
+        return len(self.terms)
+
+    @classmethod
+    def build(cls, items, max_terms=MAX_TERMS):
+        """
+        An index of ``(kind, id, label, url)`` items, sorted once; items
+        past ``max_terms`` are left out
+        """
+        index = cls(max_terms)
+        for kind, item_id, label, url in items:
+            terms = index_terms(label)
+            if len(index.terms) + len(terms) > max_terms:
+                break
+            index.items[(kind, item_id)] = (label, url)
+            index.terms.extend((term, kind, item_id) for term in terms)
+        index.terms.sort()
+        return index
+
+    def add(self, kind, item_id, label, url):
+        """
+        Add or replace an item; returns False if the index is full
+        """
+        self.remove(kind, item_id)
+        terms = index_terms(label)
+        if len(self.terms) + len(terms) > self.max_terms:
+            return False
+        self.items[(kind, item_id)] = (label, url)
+        for term in terms:
+            insort(self.terms, (term, kind, item_id))
+        return True
+
+    def remove(self, kind, item_id):
+        item = self.items.pop((kind, item_id), None)
+        if item is None:
+            return
+        for term in index_terms(item[0]):
+            entry = (term, kind, item_id)
+            i = bisect_left(self.terms, entry)
+            if i < len(self.terms) and self.terms[i] == entry:
+                del self.terms[i]
+
+    def lookup(self, prefix, limit=DEFAULT_LIMIT):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        found = []
+        i = bisect_left(self.terms, (prefix,))
+        while i < len(self.terms) and len(found) < limit:
+            term, kind, item_id = self.terms[i]
+            if not term.startswith(prefix):
+                break
+            if (kind, item_id) not in found:
+                found.append((kind, item_id))
+            i += 1
+        return [
+            {'type': kind, 'title': self.items[(kind, item_id)][0], 'url': self.items[(kind, item_id)][1]}
+            for kind, item_id in found
+        ]
+
+
+def page_url(page, root_path):
+    # Same as page.get_url() for a page served by the site at root_path
+    return page.url_path[len(root_path) - 1:]
+
+
+def tag_url(tag):
+    return reverse('news-tag', args=[tag.slug])
+
+
+def site_root_path(site_id):
+    for root in Site.get_site_root_paths():
+        if root.site_id == site_id:
+            return root.root_path
+    return None
+
+
+def index_items(site_id):
+    root_path = site_root_path(site_id)
+    if root_path is not None:
+        # Shallow pages first, so the most prominent ones fit if the index fills up
+        pages = (
+            Page.objects.live().filter(url_path__startswith=root_path)
+            .order_by('path').only('id', 'title', 'url_path')
+        )
+        for page in pages.iterator(chunk_size=500):
+            yield 'page', page.id, page.title, page_url(page, root_path)
+    for tag in Tag.objects.filter(post_count__count__gt=0).order_by('-post_count__count'):
+        yield 'tag', tag.id, tag.name, tag_url(tag)
+
+
+def build_index(site_id):
+    return PrefixIndex.build(index_items(site_id))
+
+
+# site id -> (generation, PrefixIndex)
+_indexes = {}
+_building = set()
+_lock = threading.Lock()
+
+
+def get_index(site_id):
+    generation = get_cache('search').generation(GENERATION)
+    with _lock:
+        current = _indexes.get(site_id)
+        if current is not None and (current[0] == generation or site_id in _building):
+            # Up to date, or another request is rebuilding it meanwhile
+            return current[1]
+        _building.add(site_id)
+    try:
+        index = build_index(site_id)
+        with _lock:
+            _indexes[site_id] = (generation, index)
+        return index
+    finally:
+        with _lock:
+            _building.discard(site_id)
+
+
+def suggest(prefix, site_id, limit=DEFAULT_LIMIT):
+    index = get_index(site_id)
+    # Publishing may be updating the index in place
+    with _lock:
+        return index.lookup(prefix, limit)
+
+
+def page_published(page):
+    """
+    Expire every worker's indexes, updating this worker's current ones in
+    place
+    """
+    generation = get_cache('search').bump(GENERATION)
+    tags = list(page.tags.all()) if isinstance(page, BlogPage) else []
+    roots = {root.site_id: root.root_path for root in Site.get_site_root_paths()}
+    with _lock:
+        for site_id, (built, index) in list(_indexes.items()):
+            if built != generation - 1:
+                continue
+            root_path = roots.get(site_id)
+            if root_path is not None and page.url_path.startswith(root_path):
+                index.add('page', page.id, page.title, page_url(page, root_path))
+            for tag in tags:
+                index.add('tag', tag.id, tag.name, tag_url(tag))
+            _indexes[site_id] = (generation, index)
+
+
+def expire():
+    # Unpublishing may leave tags without live posts, so rebuild instead
+    get_cache('search').bump(GENERATION)
+
+
+def reset():
+    with _lock:
+        _indexes.clear()
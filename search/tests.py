@@ -0,0 +1,295 @@
+import io
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from wagtail.models import Page, Site
+from wagtail.search.models import IndexEntry
+
+from news.models import BlogIndexPage, BlogPage
+from st_mark.cache import get_cache
+
+from . import index_queue, suggest
+from .models import SearchIndexQueue
+from .results import normalize_query
+
+
+@override_settings(SEARCH_INDEX_QUEUE_SYNC=True)
+class SearchTestCase(TestCase):
+    """
+    Publishes pages titled "Admissions N" under the site root page.
+    """
+
+    def setUp(self):
+        cache.clear()
+        suggest.reset()
+        self.root = Page.objects.get(depth=2)
+
+    def add_pages(self, count):
+        pages = []
+        # The search index is updated once the transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            for number in range(1, count + 1):
+                page = self.root.add_child(instance=Page(title=f"Admissions {number}", slug=f"admissions-{number}"))
+                page.save_revision().publish()
+                pages.append(page)
+        return pages
+
+
+class SeekPaginationTestCase(SearchTestCase):
+    def test_next_page_detected_without_count(self):
+        self.add_pages(11)
+
+        response = self.client.get('/search/', {'query': 'admissions'})
+
+        results = response.context['search_results']
+        self.assertEqual(len(results), 10)
+        self.assertTrue(results.has_next())
+        self.assertFalse(results.has_previous())
+        self.assertIsNone(results.count)
+        self.assertContains(response, "page=2")
+
+    def test_last_page(self):
+        self.add_pages(11)
+
+        response = self.client.get('/search/', {'query': 'admissions', 'page': 2})
+
+        results = response.context['search_results']
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results.has_next())
+        self.assertTrue(results.has_previous())
+
+    def test_exact_count_on_request(self):
+        self.add_pages(3)
+
+        response = self.client.get('/search/', {'query': 'admissions', 'count': 1})
+
+        self.assertEqual(response.context['search_results'].count, 3)
+        self.assertContains(response, "of 3")
+
+    def test_page_past_the_end(self):
+        self.add_pages(2)
+
+        response = self.client.get('/search/', {'query': 'admissions', 'page': 5})
+
+        self.assertEqual(len(response.context['search_results']), 0)
+        self.assertContains(response, "No more results")
+
+    def test_invalid_page_falls_back_to_first(self):
+        self.add_pages(2)
+
+        response = self.client.get('/search/', {'query': 'admissions', 'page': 'abc'})
+
+        self.assertEqual(response.context['search_results'].number, 1)
+        self.assertEqual(len(response.context['search_results']), 2)
+
+
+class SearchResultCacheTestCase(SearchTestCase):
+    def result_ids(self, response):
+        return [page.id for page in response.context['search_results']]
+
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query("  Admissions   CALENDAR! "), "admissions calendar")
+        self.assertEqual(normalize_query("Scholarship"), "scholarship")
+
+    def test_normalized_variant_served_from_cache(self):
+        pages = self.add_pages(3)
+        first = self.client.get('/search/', {'query': 'admissions'})
+        stats = get_cache('search').stats()
+
+        second = self.client.get('/search/', {'query': '  ADMISSIONS '})
+
+        self.assertEqual(self.result_ids(second), self.result_ids(first))
+        self.assertCountEqual(self.result_ids(second), [page.id for page in pages])
+        self.assertEqual(get_cache('search').stats()['hits'], stats['hits'] + 1)
+
+    def test_singular_and_plural_cached_apart(self):
+        # SQLite's full-text search does not stem, so neither may the key
+        with self.captureOnCommitCallbacks(execute=True):
+            page = self.root.add_child(instance=Page(title="Admissions office", slug="office"))
+            page.save_revision().publish()
+
+        self.assertEqual(self.result_ids(self.client.get('/search/', {'query': 'admission'})), [])
+        self.assertEqual(self.result_ids(self.client.get('/search/', {'query': 'admissions'})), [page.id])
+        self.assertEqual(self.result_ids(self.client.get('/search/', {'query': 'admission'})), [])
+
+    def test_punctuation_only_query(self):
+        response = self.client.get('/search/', {'query': '!!!'})
+        self.assertEqual(len(response.context['search_results']), 0)
+
+    def test_publishing_expires_results(self):
+        self.add_pages(1)
+        self.client.get('/search/', {'query': 'admissions'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page = self.root.add_child(instance=Page(title="Admissions open day", slug="open-day"))
+            page.save_revision().publish()
+
+        response = self.client.get('/search/', {'query': 'admissions'})
+        self.assertIn(page.id, self.result_ids(response))
+
+    def test_unpublished_page_dropped_from_cached_results(self):
+        pages = self.add_pages(2)
+        self.client.get('/search/', {'query': 'admissions'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pages[0].unpublish()
+
+        response = self.client.get('/search/', {'query': 'admissions'})
+        self.assertEqual(self.result_ids(response), [pages[1].id])
+
+
+class SuggestTestCase(SearchTestCase):
+    def suggestions(self, q):
+        response = self.client.get('/api/search/suggest/', {'q': q})
+        self.assertEqual(response.status_code, 200)
+        return [(item['type'], item['title']) for item in response.json()['data']]
+
+    def test_titles_and_tags_by_prefix(self):
+        self.add_pages(2)
+        with self.captureOnCommitCallbacks(execute=True):
+            index = self.root.add_child(instance=BlogIndexPage(title="News", slug="news-index"))
+            post = index.add_child(instance=BlogPage(title="Open day", slug="open-day", date="2025-11-01", intro="Visit us"))
+            post.tags.add('admissions-news')
+            post.save_revision().publish()
+
+        self.assertEqual(
+            self.suggestions('adm'),
+            [('page', "Admissions 1"), ('page', "Admissions 2"), ('tag', "admissions-news")]
+        )
+        self.assertEqual(self.suggestions('OPEN  d'), [('page', "Open day")])
+        self.assertEqual(self.suggestions('zzz'), [])
+        self.assertEqual(self.suggestions(''), [])
+
+    def test_publish_updates_index_in_place(self):
+        self.add_pages(1)
+        self.suggestions('adm')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page = self.root.add_child(instance=Page(title="Admissions fees", slug="fees"))
+            page.save_revision().publish()
+
+        site_id = Site.objects.get(is_default_site=True).id
+        with self.assertNumQueries(0):
+            self.assertEqual(len(suggest.suggest('admissions f', site_id)), 1)
+
+    def test_unpublished_page_removed(self):
+        pages = self.add_pages(2)
+        self.suggestions('adm')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pages[0].unpublish()
+
+        self.assertEqual(self.suggestions('adm'), [('page', "Admissions 2")])
+
+    def test_pages_of_requesting_site_only(self):
+        self.add_pages(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            other_root = Page.objects.get(depth=1).add_child(instance=Page(title="Other home", slug="other-home"))
+            abroad = other_root.add_child(instance=Page(title="Admissions abroad", slug="abroad"))
+            abroad.save_revision().publish()
+        Site.objects.create(hostname='other.example', root_page=other_root)
+
+        self.assertEqual(self.suggestions('adm'), [('page', "Admissions 1")])
+        response = self.client.get('/api/search/suggest/', {'q': 'adm'}, HTTP_HOST='other.example')
+        self.assertEqual(
+            response.json()['data'],
+            [{'type': 'page', 'title': "Admissions abroad", 'url': '/abroad/'}]
+        )
+
+    def test_build_matches_incremental_adds(self):
+        items = [('page', 1, "Open day", '/open-day/'), ('page', 2, "Sports day", '/sports/'), ('tag', 3, "open", '/t/')]
+        incremental = suggest.PrefixIndex()
+        for item in items:
+            incremental.add(*item)
+
+        built = suggest.PrefixIndex.build(items)
+
+        self.assertEqual(built.terms, incremental.terms)
+        self.assertEqual(built.items, incremental.items)
+        self.assertEqual(len(suggest.PrefixIndex.build(items, max_terms=3)), 2)
+
+    def test_index_size_is_bounded(self):
+        index = suggest.PrefixIndex(max_terms=3)
+
+        self.assertTrue(index.add('page', 1, "Open day", '/open-day/'))
+        self.assertFalse(index.add('page', 2, "Sports day", '/sports-day/'))
+        self.assertEqual(len(index), 2)
+        index.remove('page', 1)
+        self.assertEqual(len(index), 0)
+
+
+@override_settings(SEARCH_INDEX_QUEUE_SYNC=False)
+class IndexQueueTestCase(SearchTestCase):
+    def search_ids(self, query):
+        return [page.id for page in Page.objects.live().search(query)]
+
+    def test_updates_coalesce_until_processed(self):
+        page = self.add_pages(1)[0]
+        page.title = "Admissions guide"
+        page.save_revision().publish()
+
+        self.assertEqual(SearchIndexQueue.objects.count(), 1)
+        self.assertEqual(index_queue.queue_stats()['depth'], 1)
+        self.assertEqual(self.search_ids('admissions'), [])
+
+        self.assertEqual(index_queue.process(), 1)
+
+        self.assertEqual(self.search_ids('guide'), [page.id])
+        self.assertEqual(
+            index_queue.queue_stats(),
+            {'depth': 0, 'failing': 0, 'lag_seconds': 0.0, 'oldest': None}
+        )
+
+    def test_deleted_object_removed_from_index(self):
+        page = self.add_pages(1)[0]
+        index_queue.process()
+
+        self.assertTrue(IndexEntry.objects.filter(object_id=str(page.id)).exists())
+
+        page.delete()
+        index_queue.process()
+
+        self.assertFalse(IndexEntry.objects.filter(object_id=str(page.id)).exists())
+        self.assertFalse(SearchIndexQueue.objects.exists())
+
+    def test_change_during_apply_stays_queued(self):
+        page = self.add_pages(1)[0]
+        rows = list(SearchIndexQueue.objects.all())
+        page.save()
+
+        index_queue.apply(rows)
+
+        self.assertEqual(SearchIndexQueue.objects.count(), 1)
+
+    def test_failing_model_does_not_stall_queue(self):
+        self.add_pages(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            index = self.root.add_child(instance=BlogIndexPage(title="Admissions news", slug="admissions-news"))
+        update_index = index_queue._update_index
+
+        def fail_for_plain_pages(model, object_ids):
+            return model is not Page and update_index(model, object_ids)
+
+        with mock.patch.object(index_queue, '_update_index', fail_for_plain_pages):
+            self.assertEqual(index_queue.process(batch_size=1), 1)
+
+        self.assertEqual(self.search_ids('news'), [index.id])
+        row = SearchIndexQueue.objects.get()
+        self.assertEqual(row.attempts, 1)
+        self.assertIsNotNone(row.retry_at)
+        self.assertEqual(index_queue.queue_stats()['failing'], 1)
+        # Not due again until the backoff has passed
+        self.assertEqual(index_queue.process(), 0)
+
+    def test_command(self):
+        self.add_pages(3)
+        out = io.StringIO()
+
+        call_command('process_search_index', '--stats', stdout=out)
+        self.assertIn("depth: 3", out.getvalue())
+
+        call_command('process_search_index', '--batch-size', '2', stdout=out)
+        self.assertIn("Applied 3 search index updates", out.getvalue())
+        self.assertEqual(self.client.get('/api/search/index-queue/').json()['data']['depth'], 0)
@@ -1,7 +1,13 @@
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
 from django.template.response import TemplateResponse
+from django.views import View
 
-from wagtail.models import Page
+from wagtail.models import Site
+
+from . import index_queue, suggest
+from .pagination import SeekPage, parse_page_number
+from .results import search_page
 
 # To enable logging of search queries for use with the "Promoted search results" module
 # <https://docs.wagtail.org/en/stable/reference/contrib/searchpromotions.html>
@@ -10,14 +16,20 @@ from wagtail.models import Page
 
 # from wagtail.contrib.search_promotions.models import Query
 
+PAGE_SIZE = 10
+
 
 def search(request):
     search_query = request.GET.get("query", None)
-    page = request.GET.get("page", 1)
+    page = parse_page_number(request.GET.get("page", 1))
+    # Counting every match doubles the work, so only do it on request
+    with_count = request.GET.get("count") == "1"
 
     # Search
     if search_query:
-        search_results = Page.objects.live().search(search_query)
+        search_results = search_page(
+            search_query, page, PAGE_SIZE, site=Site.find_for_request(request), with_count=with_count
+        )
 
         # To log this query for use with the "Promoted search results" module:
 
@@ -25,16 +37,7 @@ def search(request):
         # query.add_hit()
 
     else:
-        search_results = Page.objects.none()
-
-    # Pagination
-    paginator = Paginator(search_results, 10)
-    try:
-        search_results = paginator.page(page)
-    except PageNotAnInteger:
-        search_results = paginator.page(1)
-    except EmptyPage:
-        search_results = paginator.page(paginator.num_pages)
+        search_results = SeekPage([], page, PAGE_SIZE, has_next=False)
 
     return TemplateResponse(
         request,
@@ -42,5 +45,41 @@ def search(request):
         {
             "search_query": search_query,
             "search_results": search_results,
+            "with_count": with_count,
         },
     )
+
+
+class SuggestView(View):
+    """
+    API endpoint for typeahead: titles of the site's pages and tags starting
+    with ``q``
+    """
+    def suggest(self, request, limit):
+        site = Site.find_for_request(request)
+        return suggest.suggest(request.GET.get('q', ''), site.id if site else None, limit)
+
+    async def get(self, request):
+        try:
+            limit = min(max(int(request.GET.get('limit', suggest.DEFAULT_LIMIT)), 1), suggest.MAX_LIMIT)
+        except ValueError:
+            limit = suggest.DEFAULT_LIMIT
+
+        suggestions = await sync_to_async(self.suggest)(request, limit)
+
+        return JsonResponse({
+            'status': 'success',
+            'data': suggestions,
+            'count': len(suggestions)
+        })
+
+
+class SearchIndexQueueView(View):
+    """
+    API endpoint exposing the depth and lag of the search index update queue
+    """
+    async def get(self, request):
+        return JsonResponse({
+            'status': 'success',
+            'data': await sync_to_async(index_queue.queue_stats)()
+        })
@@ -0,0 +1,57 @@
+"""
+Helpers shared by the JSON API views.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
+
+# Same escaping as Django's json_script filter, so the payload can be
+# embedded in a <script type="application/json"> element.
+JSON_SCRIPT_ESCAPES = {
+    ord('>'): '\\u003E',
+    ord('<'): '\\u003C',
+    ord('&'): '\\u0026',
+}
+
+
+class PreparedJSON:
+    """
+    A JSON payload serialized to bytes once, together with a strong ETag.
+
+    Use it for responses whose content only changes on deploy: build it at
+    import time and return ``prepared.response(request)`` from the view.
+    Repeat requests carrying a matching ``If-None-Match`` get a 304.
+    """
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.content = json.dumps(payload, cls=DjangoJSONEncoder).encode('utf-8')
+        self.etag = '"%s"' % hashlib.sha256(self.content).hexdigest()[:32]
+
+    @property
+    def data(self):
+        return self.payload.get('data')
+
+    @cached_property
+    def json_script(self):
+        """
+        The payload escaped for inline embedding, computed once
+        """
+        return mark_safe(self.content.decode('utf-8').translate(JSON_SCRIPT_ESCAPES))
+
+    def response(self, request, max_age=None):
+        if max_age is None:
+            max_age = getattr(settings, 'API_CACHE_MAX_AGE', 300)
+
+        response = HttpResponse(self.content, content_type='application/json')
+        response.headers['ETag'] = self.etag
+        patch_cache_control(response, public=True, max_age=max_age)
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return get_conditional_response(request, etag=self.etag, response=response)
@@ -0,0 +1,17 @@
+"""
+ASGI config for st_mark project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Run it with uvicorn workers under gunicorn, see gunicorn.conf.py.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "st_mark.settings.dev")
+
+application = get_asgi_application()
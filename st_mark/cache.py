@@ -0,0 +1,361 @@
+"""
+Project caching layer.
+
+``TieredCache`` is a cache backend that keeps a small per-process LRU in
+front of a shared backend (file-based by default, Redis or memcached in
+production, local memory as a stand-in; see ``CACHES`` in settings).  Reads
+served by the local tier cost no I/O; anything written by another process
+becomes visible once the local copy expires (``LOCAL_TIMEOUT``).  The
+local tier holds pickled values, so every caller gets its own copy, as it
+would from the shared tier.
+
+Application code should not use cache keys directly but go through a
+namespace, which prefixes keys and counts hits and misses::
+
+    from st_mark.cache import get_cache
+
+    cache = get_cache('news')
+    stats = cache.get_or_set('blog-stats', compute_stats)
+
+``cached_api`` caches the JSON body of an API view method in a namespace.
+"""
+
+import functools
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.http import HttpResponse
+
+MISSING = object()
+
+
+class LocalLRU:
+    """
+    Thread-safe, size-bounded LRU with per-entry expiry
+    """
+
+    def __init__(self, max_entries, timeout):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        if timeout is None or timeout > self.timeout:
+            timeout = self.timeout
+        if timeout <= 0:
+            self.delete(key)
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TieredCache(BaseCache):
+    """
+    Cache backend: per-process LRU in front of another configured cache.
+
+    OPTIONS:
+        SHARED            alias of the shared cache (default ``"shared"``)
+        LOCAL_MAX_ENTRIES entries kept per process (default 1000)
+        LOCAL_TIMEOUT     max seconds a value is served from the local tier
+                          without consulting the shared tier (default 5)
+    """
+
+    def __init__(self, location, params):
+        options = params.get('OPTIONS', {})
+        self._shared_alias = options.get('SHARED', 'shared')
+        self._local = LocalLRU(
+            max_entries=options.get('LOCAL_MAX_ENTRIES', 1000),
+            timeout=options.get('LOCAL_TIMEOUT', 5),
+        )
+        super().__init__(params)
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    def _local_key(self, key, version):
+        return self.shared.make_and_validate_key(key, version=version)
+
+    def _local_timeout(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            return self.shared.default_timeout
+        return timeout
+
+    def _get_local(self, local_key):
+        # Unpickled on every read so callers can't mutate the cached value
+        data = self._local.get(local_key)
+        if data is MISSING:
+            return MISSING
+        return pickle.loads(data)
+
+    def _set_local(self, local_key, value, timeout=None):
+        self._local.set(local_key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), timeout)
+
+    def get(self, key, default=None, version=None):
+        local_key = self._local_key(key, version)
+        value = self._get_local(local_key)
+        if value is not MISSING:
+            return value
+        value = self.shared.get(key, MISSING, version=version)
+        if value is MISSING:
+            return default
+        self._set_local(local_key, value)
+        return value
+
+    async def aget(self, key, default=None, version=None):
+        local_key = self._local_key(key, version)
+        value = self._get_local(local_key)
+        if value is not MISSING:
+            return value
+        value = await self.shared.aget(key, MISSING, version=version)
+        if value is MISSING:
+            return default
+        self._set_local(local_key, value)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self._set_local(self._local_key(key, version), value, self._local_timeout(timeout))
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        await self.shared.aset(key, value, timeout=timeout, version=version)
+        self._set_local(self._local_key(key, version), value, self._local_timeout(timeout))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout=timeout, version=version)
+        if added:
+            self._set_local(self._local_key(key, version), value, self._local_timeout(timeout))
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.delete(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.incr(key, delta, version=version)
+
+    def has_key(self, key, version=None):
+        return self._local.get(self._local_key(key, version)) is not MISSING or self.shared.has_key(key, version=version)
+
+    def clear(self):
+        self._local.clear()
+        self.shared.clear()
+
+    def clear_local(self):
+        self._local.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
+
+    def local_size(self):
+        return len(self._local)
+
+
+class NamespacedCache:
+    """
+    A view of the default cache whose keys are prefixed with an app
+    namespace (``home``, ``news``, ``search``, ...), with hit/miss counters.
+    """
+
+    def __init__(self, namespace, timeout=DEFAULT_TIMEOUT):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        return caches['default']
+
+    def make_key(self, key):
+        return f"{self.namespace}:{key}"
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _timeout(self, timeout):
+        return self.timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    def get(self, key, default=None):
+        value = self.backend.get(self.make_key(key), MISSING)
+        self._count(value is not MISSING)
+        return default if value is MISSING else value
+
+    async def aget(self, key, default=None):
+        value = await self.backend.aget(self.make_key(key), MISSING)
+        self._count(value is not MISSING)
+        return default if value is MISSING else value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.backend.set(self.make_key(key), value, self._timeout(timeout))
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT):
+        await self.backend.aset(self.make_key(key), value, self._timeout(timeout))
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT):
+        """
+        Return the cached value, computing and storing ``default()`` on a miss
+        """
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            value = default() if callable(default) else default
+            self.set(key, value, timeout)
+        return value
+
+    def delete(self, key):
+        return self.backend.delete(self.make_key(key))
+
+    def delete_many(self, keys):
+        self.backend.delete_many([self.make_key(key) for key in keys])
+
+    def generation(self, name, default=0):
+        """
+        Current value of a generation counter (``default`` if never bumped).
+
+        Embed it in the keys of entries that must all go stale together and
+        ``bump`` it to invalidate them.  Not counted as a hit or a miss.
+        """
+        return self.backend.get(self.make_key(f"gen:{name}"), default)
+
+    async def ageneration(self, name, default=0):
+        return await self.backend.aget(self.make_key(f"gen:{name}"), default)
+
+    def bump(self, name):
+        key = self.make_key(f"gen:{name}")
+        self.backend.add(key, 0, timeout=None)
+        try:
+            return self.backend.incr(key)
+        except ValueError:
+            # Evicted between add() and incr()
+            self.backend.set(key, 1, timeout=None)
+            return 1
+
+    async def abump(self, name):
+        key = self.make_key(f"gen:{name}")
+        await self.backend.aadd(key, 0, timeout=None)
+        try:
+            return await self.backend.aincr(key)
+        except ValueError:
+            await self.backend.aset(key, 1, timeout=None)
+            return 1
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / total, 4) if total else None,
+        }
+
+
+_namespaces = {}
+_namespaces_lock = threading.Lock()
+
+
+def get_cache(namespace):
+    """
+    Return the process-wide ``NamespacedCache`` for an app namespace.
+
+    The default timeout comes from ``CACHE_NAMESPACE_TIMEOUTS[namespace]``,
+    falling back to the default cache's own timeout.
+    """
+    cache = _namespaces.get(namespace)
+    if cache is None:
+        with _namespaces_lock:
+            cache = _namespaces.get(namespace)
+            if cache is None:
+                timeouts = getattr(settings, 'CACHE_NAMESPACE_TIMEOUTS', {})
+                cache = NamespacedCache(namespace, timeouts.get(namespace, DEFAULT_TIMEOUT))
+                _namespaces[namespace] = cache
+    return cache
+
+
+def cache_stats():
+    """
+    Hit/miss counters for every namespace used by this process
+    """
+    stats = {name: cache.stats() for name, cache in sorted(_namespaces.items())}
+    default = caches['default']
+    if isinstance(default, TieredCache):
+        stats['_local_entries'] = default.local_size()
+    return stats
+
+
+def api_cache_key(method, request, params=()):
+    """
+    Cache key for an API response: the view method, the request path and
+    the values of the ``params`` query parameters.  Any other parameter
+    (cache busters, tracking tags) shares the same entry.
+    """
+    query = urlencode(sorted((name, value) for name in params for value in request.GET.getlist(name)))
+    return f"api:{method.__module__}.{method.__qualname__}:{request.path}?{query}"
+
+
+def cached_api(namespace, timeout=DEFAULT_TIMEOUT, params=()):
+    """
+    Cache the body of successful JSON responses from an async API view
+    method, keyed by the method, the request path and the query parameters
+    named in ``params`` (the ones the view actually reads).
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, request, *args, **kwargs):
+            cache = get_cache(namespace)
+            key = api_cache_key(method, request, params)
+            content = await cache.aget(key)
+            if content is not None:
+                return HttpResponse(content, content_type='application/json')
+
+            response = await method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                await cache.aset(key, response.content, timeout)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,247 @@
+"""
+Anonymous full-page cache for Wagtail pages.
+
+Page models opt in with ``PageCacheMixin``::
+
+    class BlogPage(PageCacheMixin, Page):
+        page_cache_query_params = ('page',)
+
+``PageCacheMiddleware`` (last in ``MIDDLEWARE``, sync and async capable)
+answers anonymous GET/HEAD requests from the ``pages`` cache namespace
+before URL resolution, so a hit skips the page tree lookup, StreamField
+deserialization and template rendering.  On a miss the rendered response and its headers are stored
+only if an opted-in page served it.
+
+Entries are keyed by host, path, a per-path generation and the query
+parameters listed in ``PAGE_CACHE_QUERY_PARAMS`` (all others are ignored).
+Publishing, unpublishing, moving or deleting a page bumps the generation of
+the page, its parent and the site homepage.  The generation is created when
+a page is first stored, so it also marks paths worth looking up: other
+paths cost one read and are not counted as misses, and paths under
+``PAGE_CACHE_EXCLUDED_PATHS`` are not looked up at all.
+
+Requests carrying a session cookie (logged-in editors, who also get the
+Wagtail userbar) and previews are never cached.  Hit ratios are reported by
+``/api/cache/stats/`` under ``pages``.
+"""
+
+import hashlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.http import HttpResponse
+from wagtail.models import Page, Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .cache import get_cache
+
+CACHEABLE_METHODS = ('GET', 'HEAD')
+
+
+def _digest(value):
+    # Paths and query strings may not be valid memcached keys
+    return hashlib.md5(value.encode('utf-8')).hexdigest()
+
+
+def path_generation_key(path):
+    return f"page:{_digest(path)}"
+
+
+class PageCacheMixin:
+    """
+    Mark responses from ``serve`` as cacheable for anonymous visitors.
+
+    ``page_cache_timeout``      seconds to keep a rendered page (``None`` for
+                                the ``pages`` namespace default)
+    ``page_cache_query_params`` query parameters the page renders differently
+                                for; they must also be listed in
+                                ``PAGE_CACHE_QUERY_PARAMS``
+    """
+
+    page_cache_timeout = None
+    page_cache_query_params = ()
+
+    def serve(self, request, *args, **kwargs):
+        response = super().serve(request, *args, **kwargs)
+        if not getattr(request, 'is_preview', False):
+            request.page_cache_page = self
+        return response
+
+
+def served_paths(url_path):
+    """
+    Request paths a page with this ``url_path`` is served at, one per site
+    whose root contains it
+    """
+    paths = set()
+    for root in Site.get_site_root_paths():
+        if url_path.startswith(root.root_path):
+            paths.add(url_path[len(root.root_path) - 1:])
+    return paths
+
+
+def purge_url_paths(*url_paths):
+    """
+    Invalidate every cached variant of the given pages and of each site homepage
+    """
+    cache = get_cache('pages')
+    paths = {'/'}
+    for url_path in url_paths:
+        if url_path:
+            paths |= served_paths(url_path)
+    for path in paths:
+        cache.bump(path_generation_key(path))
+
+
+def purge_page(page):
+    parent = page.get_parent()
+    purge_url_paths(page.url_path, parent.url_path if parent else None)
+
+
+class PageCacheMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cache = get_cache('pages')
+        # Stay async under ASGI so the async API views further down the
+        # chain are not run through async_to_sync
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self.is_cacheable_request(request):
+            return self.get_response(request)
+
+        generation_key = path_generation_key(request.path)
+        # None until a page has been stored at this path
+        generation = self.cache.generation(generation_key, None)
+        if generation is not None:
+            entry = self.cache.get(self.make_key(request, generation))
+            if entry is not None:
+                return self.cached_response(entry)
+
+        response = self.get_response(request)
+        if self.is_cacheable_response(request, response) and not self.is_authenticated(request):
+            if generation is None:
+                generation = self.cache.bump(generation_key)
+            self.cache.set(self.make_key(request, generation), *self.make_entry(request, response))
+            response.headers['X-Page-Cache'] = 'MISS'
+        return response
+
+    async def __acall__(self, request):
+        if not self.is_cacheable_request(request):
+            return await self.get_response(request)
+
+        generation_key = path_generation_key(request.path)
+        generation = await self.cache.ageneration(generation_key, None)
+        if generation is not None:
+            entry = await self.cache.aget(self.make_key(request, generation))
+            if entry is not None:
+                return self.cached_response(entry)
+
+        response = await self.get_response(request)
+        if self.is_cacheable_response(request, response) and not await self.ais_authenticated(request):
+            if generation is None:
+                generation = await self.cache.abump(generation_key)
+            await self.cache.aset(self.make_key(request, generation), *self.make_entry(request, response))
+            response.headers['X-Page-Cache'] = 'MISS'
+        return response
+
+    def cached_response(self, entry):
+        content, headers = entry
+        response = HttpResponse(content, headers=headers)
+        response.headers['X-Page-Cache'] = 'HIT'
+        return response
+
+    def make_entry(self, request, response):
+        """
+        (value, timeout) to store for a cacheable response
+        """
+        timeout = request.page_cache_page.page_cache_timeout
+        return (
+            (response.content, dict(response.headers.items())),
+            DEFAULT_TIMEOUT if timeout is None else timeout
+        )
+
+    def is_cacheable_request(self, request):
+        return (
+            request.method in CACHEABLE_METHODS
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+            and not request.path.startswith(tuple(getattr(settings, 'PAGE_CACHE_EXCLUDED_PATHS', ())))
+        )
+
+    def is_cacheable_response(self, request, response):
+        page = getattr(request, 'page_cache_page', None)
+        if page is None or request.method != 'GET':
+            return False
+        if response.status_code != 200 or response.streaming or response.cookies:
+            return False
+        if 'private' in response.headers.get('Cache-Control', ''):
+            return False
+        # A CSRF token was rendered, so the page is specific to this visitor
+        if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+            return False
+        # The key only covers PAGE_CACHE_QUERY_PARAMS
+        keyed = set(getattr(settings, 'PAGE_CACHE_QUERY_PARAMS', ()))
+        return not any(
+            name in request.GET and name not in keyed
+            for name in page.page_cache_query_params
+        )
+
+    def is_authenticated(self, request):
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_authenticated
+
+    async def ais_authenticated(self, request):
+        # request.user would query the session synchronously
+        if not hasattr(request, 'auser'):
+            return False
+        user = await request.auser()
+        return user.is_authenticated
+
+    def make_key(self, request, generation):
+        keyed = getattr(settings, 'PAGE_CACHE_QUERY_PARAMS', ())
+        query = '&'.join(
+            f"{name}={value}"
+            for name in sorted(keyed)
+            for value in request.GET.getlist(name)
+        )
+        return f"response:{_digest(f'{request.get_host()}{request.path}?{query}')}:{generation}"
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def purge_on_publish(sender, instance, **kwargs):
+    purge_page(instance)
+
+
+@receiver(post_page_move)
+def purge_on_move(sender, instance, parent_page_before, parent_page_after,
+                  url_path_before, url_path_after, **kwargs):
+    # Descendants are served at new paths too; purge their old ones
+    descendants = [
+        url_path_before + url_path[len(url_path_after):]
+        for url_path in instance.get_descendants().values_list('url_path', flat=True)
+    ]
+    purge_url_paths(
+        url_path_before,
+        url_path_after,
+        parent_page_before.url_path,
+        parent_page_after.url_path,
+        *descendants
+    )
+
+
+@receiver(post_delete)
+def purge_on_delete(sender, instance, **kwargs):
+    if isinstance(instance, Page):
+        purge_url_paths(instance.url_path, instance.url_path.rsplit('/', 2)[0] + '/')
@@ -0,0 +1,94 @@
+"""
+Search text extraction for StreamFields.
+
+Indexing a StreamField with ``index.SearchField('body')`` indexes every
+block value as one blob, so headings can't be boosted above the rest.
+Instead, a model exposes the text of its StreamField through two methods,
+split into headings and other text::
+
+    search_fields = Page.search_fields + [
+        index.SearchField('body_headings', boost=2),
+        index.SearchField('body_text'),
+    ]
+
+    def body_headings(self):
+        return stream_text(self.body, HEADING)
+
+    def body_text(self):
+        return stream_text(self.body, TEXT)
+
+What is searchable is read from the block definitions: text, char and rich
+text blocks are, other blocks (images, choosers, ...) and blocks declared
+with ``search_index=False`` are not.  A struct block names the children
+that count as headings in its Meta::
+
+    class Meta:
+        search_headings = ('heading',)
+
+The raw JSON is read, so blocks are never deserialized.
+"""
+
+import html
+
+from django.utils.html import strip_tags
+from wagtail.blocks import CharBlock, ListBlock, RichTextBlock, StreamBlock, StructBlock, TextBlock
+
+HEADING = 'heading'
+TEXT = 'text'
+
+
+def _clean(value, block):
+    if not isinstance(value, str):
+        return ''
+    if isinstance(block, RichTextBlock):
+        value = html.unescape(strip_tags(value))
+    return ' '.join(value.split())
+
+
+def _list_items(value):
+    # List blocks are stored as [{'type': 'item', 'value': ...}] since
+    # Wagtail 2.16 and as plain values before
+    for item in value or ():
+        if isinstance(item, dict) and item.get('type') == 'item' and 'value' in item:
+            yield item['value']
+        else:
+            yield item
+
+
+def _extract(block, value, kind, found):
+    if not getattr(block, 'search_index', True):
+        return
+    if isinstance(block, StructBlock):
+        if isinstance(value, dict):
+            headings = getattr(block.meta, 'search_headings', ())
+            for name, child in block.child_blocks.items():
+                _extract(child, value.get(name), HEADING if name in headings else kind, found)
+    elif isinstance(block, ListBlock):
+        for item in _list_items(value):
+            _extract(block.child_block, item, kind, found)
+    elif isinstance(block, StreamBlock):
+        for item in value or ():
+            child = block.child_blocks.get(item.get('type'))
+            if child is not None:
+                _extract(child, item.get('value'), kind, found)
+    elif isinstance(block, (CharBlock, TextBlock, RichTextBlock)):
+        text = _clean(value, block)
+        if text:
+            found[kind].append(text)
+
+
+def extract(stream):
+    """
+    {HEADING: [...], TEXT: [...]} of the searchable text of a StreamField
+    value, in block order
+    """
+    found = {HEADING: [], TEXT: []}
+    _extract(stream.stream_block, stream.raw_data, TEXT, found)
+    return found
+
+
+def stream_text(stream, kind):
+    """
+    The ``HEADING`` or ``TEXT`` parts of a StreamField joined into one string
+    """
+    return '\n'.join(extract(stream)[HEADING if kind == HEADING else TEXT])
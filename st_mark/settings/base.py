@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     "home",
     "search",
     "news",
+    "analytics",
     "wagtail.contrib.forms",
     "wagtail.contrib.redirects",
     "wagtail.embeds",
@@ -58,6 +59,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
+    "st_mark.page_cache.PageCacheMiddleware",
 ]
 
 ROOT_URLCONF = "st_mark.urls"
@@ -159,6 +161,91 @@ STORAGES = {
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 10_000
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The default cache is a small per-process LRU (st_mark.cache.TieredCache) in
+# front of a shared cache chosen with CACHE_BACKEND:
+#   file      - file-based cache in CACHE_LOCATION (default: cache/ in the
+#               project, so two checkouts never share entries)
+#   redis     - Redis at CACHE_LOCATION (requires the redis package)
+#   memcached - memcached at CACHE_LOCATION (requires pymemcache)
+#   locmem    - per-process memory, a stand-in for the above (the test
+#               settings use it)
+# Bump CACHE_VERSION to invalidate every cached value on deploy.
+SHARED_CACHE_BACKENDS = {
+    "file": ("django.core.cache.backends.filebased.FileBasedCache", os.path.join(BASE_DIR, "cache")),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://127.0.0.1:6379/1"),
+    "memcached": ("django.core.cache.backends.memcached.PyMemcacheCache", "127.0.0.1:11211"),
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "st_mark"),
+}
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "file")
+_shared_cache_backend, _shared_cache_location = SHARED_CACHE_BACKENDS[CACHE_BACKEND]
+
+CACHES = {
+    "default": {
+        "BACKEND": "st_mark.cache.TieredCache",
+        "OPTIONS": {
+            "SHARED": "shared",
+            "LOCAL_MAX_ENTRIES": int(os.environ.get("CACHE_LOCAL_MAX_ENTRIES", "1000")),
+            "LOCAL_TIMEOUT": int(os.environ.get("CACHE_LOCAL_TIMEOUT", "5")),
+        },
+    },
+    "shared": {
+        "BACKEND": _shared_cache_backend,
+        "LOCATION": os.environ.get("CACHE_LOCATION", _shared_cache_location),
+        "KEY_PREFIX": "st_mark",
+        "VERSION": int(os.environ.get("CACHE_VERSION", "1")),
+        "TIMEOUT": int(os.environ.get("CACHE_TIMEOUT", "300")),
+    },
+}
+
+# Default timeouts (seconds) for the per-app namespaces of st_mark.cache.get_cache.
+CACHE_NAMESPACE_TIMEOUTS = {
+    "home": 300,
+    "news": 300,
+    "search": 120,
+    "analytics": 60,
+    "pages": 600,
+    "blocks": 86400,
+}
+
+# Query parameters that select a different rendering of a cached page (see
+# st_mark/page_cache.py); any other parameter is ignored by the page cache.
+PAGE_CACHE_QUERY_PARAMS = ["page"]
+# Path prefixes never served by Wagtail pages, which the page cache skips
+# without a cache lookup.
+PAGE_CACHE_EXCLUDED_PATHS = [
+    "/api/",
+    "/admin/",
+    "/django-admin/",
+    "/documents/",
+    "/search/",
+    STATIC_URL,
+    MEDIA_URL,
+]
+
+
+# Static JSON API responses (see st_mark/api.py) may be cached by browsers and
+# proxies for this many seconds, then revalidated with If-None-Match.
+API_CACHE_MAX_AGE = 300
+
+
+# Analytics ingestion
+# Tracking beacons are buffered in-process and bulk-inserted by a background
+# flusher thread, see analytics/ingest.py. Events arriving while the buffer is
+# full are dropped (and counted) so web workers never block on analytics writes.
+ANALYTICS_BUFFER_CAPACITY = 10_000
+ANALYTICS_FLUSH_BATCH_SIZE = 500
+ANALYTICS_FLUSH_INTERVAL_MS = 2000
+ANALYTICS_INGEST_SYNC = False
+# Upper bound on the number of events accepted by /api/track/batch/ per request.
+ANALYTICS_BATCH_MAX_EVENTS = 100
+# Click counters are kept per minute, then folded into hour and day buckets by
+# the compact_rollups management command (run it from cron every few minutes).
+ANALYTICS_ROLLUP_MINUTE_RETENTION_HOURS = 2
+ANALYTICS_ROLLUP_HOUR_RETENTION_DAYS = 2
+
+
 # Wagtail settings
 
 WAGTAIL_SITE_NAME = "st_mark"
@@ -168,8 +255,14 @@ WAGTAIL_SITE_NAME = "st_mark"
 WAGTAILSEARCH_BACKENDS = {
     "default": {
         "BACKEND": "wagtail.search.backends.database",
+        # Index updates are queued and applied by the process_search_index
+        # management command, which the Docker image runs with --loop next
+        # to the application server (or run it from cron with --once); see
+        # search/index_queue.py. Without a worker, indexes stop updating.
+        "AUTO_UPDATE": False,
     }
 }
+SEARCH_INDEX_QUEUE_SYNC = False
 
 # Base URL to use when referring to full URLs within the Wagtail admin backend -
 # e.g. in notification emails. Don't include '/admin' or a trailing slash
@@ -11,6 +11,10 @@ ALLOWED_HOSTS = ["*"]
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
+# runserver has no search index worker, so apply index updates as each
+# change commits
+SEARCH_INDEX_QUEUE_SYNC = True
+
 
 try:
     from .local import *
@@ -0,0 +1,9 @@
+from .dev import *
+
+# Keep test runs off the shared file cache a dev server uses; each test
+# process gets its own in-memory shared tier
+CACHES["shared"] = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "st_mark-tests",
+    "KEY_PREFIX": "st_mark",
+}
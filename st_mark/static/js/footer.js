@@ -32,7 +32,7 @@ class FooterManager {
             baseUrl: config.baseUrl || '/api',
             endpoints: config.endpoints || {
                 contact: '/contact/submit',
-                socialStats: '/social/stats'
+                socialStats: '/social/stats/'
             },
             selectors: config.selectors || {
                 contactForm: '#contact-form',
@@ -146,20 +146,14 @@ class FooterManager {
      * Load social media statistics
      */
     loadSocialStats() {
-        // Create AJAX handler instance
-        const ajaxHandler = new window.AjaxHandler({
-            baseUrl: this.config.baseUrl
-        });
-
-        // Fetch social stats
-        ajaxHandler.get(this.config.endpoints.socialStats, {
-            onSuccess: (response) => {
+        // Fetch social stats (bootstrapped with the other page sections)
+        window.siteData.get('social', `${this.config.baseUrl}${this.config.endpoints.socialStats}`)
+            .then((response) => {
                 this.updateSocialStats(response);
-            },
-            onError: (error) => {
+            })
+            .catch((error) => {
                 console.warn('[FooterManager] Failed to load social stats:', error);
-            }
-        });
+            });
     }
 
     /**
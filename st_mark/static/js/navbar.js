@@ -9,7 +9,7 @@
 
 class NavbarHandler {
     constructor(options = {}) {
-        this.apiUrl = options.apiUrl || '/api/navigation';
+        this.apiUrl = options.apiUrl || '/api/navigation/';
         this.desktopNavSelector = options.desktopNavSelector || '#desktop-nav';
         this.retryAttempts = options.retryAttempts || 3;
         this.currentAttempt = 0;
@@ -37,7 +37,7 @@ class NavbarHandler {
 
     async fetchNavigationData() {
         try {
-            const response = await $.ajax({ url: this.apiUrl, dataType: 'json' });
+            const response = await window.siteData.get('navigation', this.apiUrl);
             console.log('Navigation data fetched:', response);
             // Extract the data array from the response
             if (response && response.data && Array.isArray(response.data)) {
@@ -109,7 +109,7 @@ class NavbarHandler {
 $(document).ready(() => {
     new NavbarHandler(
         { 
-            apiUrl: '/api/navigation',        // endpoint returning JSON array of links
+            apiUrl: '/api/navigation/',       // endpoint returning JSON array of links
             desktopNavSelector: '#desktop-nav',
             mobileNavSelector: '#mobile-nav',
             mobileToggleSelector: '#mobile-toggle',
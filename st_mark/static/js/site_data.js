@@ -0,0 +1,93 @@
+/**
+ * site_data.js
+ * Loads the data for every page section with a single request.
+ *
+ * Description:
+ * Section scripts (navbar, footer, hero, news, events, ...) used to call
+ * their own JSON endpoint. They now ask window.siteData for a section by
+ * name. If the page embedded its section data in a
+ * <script id="bootstrap-data" type="application/json"> element, that is used
+ * without any request; otherwise the first call fetches all sections listed
+ * in the body's data-bootstrap-sections attribute from /api/home/bootstrap/
+ * and later calls reuse that response. A section missing from either falls
+ * back to its own endpoint.
+ */
+
+class SiteData {
+    /**
+     * @param {Object} [options={}]
+     * @param {string} [options.endpoint='/api/home/bootstrap/'] - Bootstrap endpoint URL.
+     * @param {string} [options.sections=''] - Comma-separated section names to request.
+     * @param {string} [options.inlineId='bootstrap-data'] - Id of the inline JSON element.
+     */
+    constructor(options = {}) {
+        this.endpoint = options.endpoint || '/api/home/bootstrap/';
+        this.sections = options.sections || '';
+        this.inlineId = options.inlineId || 'bootstrap-data';
+        this.request = null;
+    }
+
+    /**
+     * Read section data rendered into the page by the server.
+     * @returns {Object|null} - {sectionName: data} map, or null if absent/invalid.
+     */
+    readInline() {
+        const element = document.getElementById(this.inlineId);
+        if (!element) {
+            return null;
+        }
+        try {
+            const response = JSON.parse(element.textContent);
+            return response && response.status === 'success' ? response.data : null;
+        } catch (error) {
+            console.warn('Ignoring invalid inline bootstrap data:', error);
+            return null;
+        }
+    }
+
+    /**
+     * Fetch the bootstrap payload once.
+     * @returns {Promise<Object>} - Resolves with a {sectionName: data} map (empty on failure).
+     */
+    load() {
+        if (!this.request) {
+            const inline = this.readInline();
+            if (inline) {
+                this.request = Promise.resolve(inline);
+                return this.request;
+            }
+
+            const url = this.sections
+                ? `${this.endpoint}?sections=${encodeURIComponent(this.sections)}`
+                : this.endpoint;
+
+            this.request = Promise.resolve($.ajax({ url: url, method: 'GET', dataType: 'json' }))
+                .then(response => (response && response.status === 'success' ? response.data : {}))
+                .catch(error => {
+                    console.warn('Bootstrap data unavailable, falling back to section endpoints:', error);
+                    return {};
+                });
+        }
+        return this.request;
+    }
+
+    /**
+     * Get one section in the same {status, data} shape its own endpoint returns.
+     * @param {string} name - Section name, e.g. 'news' or 'navigation'.
+     * @param {string} fallbackUrl - Section endpoint used if the section is not bootstrapped.
+     * @returns {Promise<Object>}
+     */
+    get(name, fallbackUrl) {
+        return this.load().then(data => {
+            if (data && Object.prototype.hasOwnProperty.call(data, name)) {
+                return { status: 'success', data: data[name] };
+            }
+            return $.ajax({ url: fallbackUrl, method: 'GET', dataType: 'json' });
+        });
+    }
+}
+
+window.SiteData = SiteData;
+window.siteData = new SiteData({
+    sections: document.body ? document.body.dataset.bootstrapSections : ''
+});
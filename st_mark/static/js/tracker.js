@@ -0,0 +1,92 @@
+/**
+ * tracker.js
+ * Queues click/navigation tracking events and sends them in batches.
+ *
+ * Description:
+ * Instead of one AJAX POST per interaction, events are queued in memory and
+ * flushed to /api/track/batch/ with navigator.sendBeacon when the queue is
+ * full, after a short delay, or when the page is hidden/unloaded. Beacons
+ * survive navigation, so callers can track a click and navigate immediately.
+ */
+
+class BeaconTracker {
+    /**
+     * @param {Object} [options={}]
+     * @param {string} [options.endpoint='/api/track/batch/'] - Batch endpoint URL.
+     * @param {number} [options.maxQueue=20] - Flush as soon as this many events are queued.
+     * @param {number} [options.flushDelay=5000] - Flush queued events after this many milliseconds.
+     */
+    constructor(options = {}) {
+        this.endpoint = options.endpoint || '/api/track/batch/';
+        this.maxQueue = options.maxQueue || 20;
+        this.flushDelay = options.flushDelay || 5000;
+        this.queue = [];
+        this.timer = null;
+
+        this.bindLifecycleEvents();
+    }
+
+    bindLifecycleEvents() {
+        // Flush whatever is queued before the page goes away
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'hidden') {
+                this.flush();
+            }
+        });
+        window.addEventListener('pagehide', () => this.flush());
+    }
+
+    /**
+     * Queue a tracking event.
+     * @param {string} type - Event type, e.g. 'blog_click' or 'quick_link_click'.
+     * @param {Object} [data={}] - Event fields.
+     */
+    track(type, data = {}) {
+        this.queue.push({
+            type: type,
+            timestamp: new Date().toISOString(),
+            ...data
+        });
+
+        if (this.queue.length >= this.maxQueue) {
+            this.flush();
+        } else if (!this.timer) {
+            this.timer = setTimeout(() => this.flush(), this.flushDelay);
+        }
+    }
+
+    /**
+     * Send all queued events in a single request.
+     */
+    flush() {
+        if (this.timer) {
+            clearTimeout(this.timer);
+            this.timer = null;
+        }
+        if (this.queue.length === 0) {
+            return;
+        }
+
+        const payload = JSON.stringify({ events: this.queue.splice(0, this.queue.length) });
+
+        if (navigator.sendBeacon) {
+            const blob = new Blob([payload], { type: 'application/json' });
+            if (navigator.sendBeacon(this.endpoint, blob)) {
+                return;
+            }
+        }
+
+        // Fallback for browsers without sendBeacon (or when the beacon was refused)
+        fetch(this.endpoint, {
+            method: 'POST',
+            body: payload,
+            headers: { 'Content-Type': 'application/json' },
+            keepalive: true
+        }).catch((error) => {
+            console.error('Error sending tracking events:', error);
+        });
+    }
+}
+
+window.BeaconTracker = BeaconTracker;
+window.stMarkTracker = new BeaconTracker();
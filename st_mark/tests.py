@@ -0,0 +1,61 @@
+from django.core.cache import cache, caches
+from django.test import RequestFactory, TestCase
+
+from .cache import MISSING, LocalLRU, api_cache_key, get_cache
+
+
+class CacheLayerTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_local_lru_evicts_least_recently_used(self):
+        lru = LocalLRU(max_entries=2, timeout=60)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')
+        lru.set('c', 3)
+
+        self.assertEqual(lru.get('a'), 1)
+        self.assertIs(lru.get('b'), MISSING)
+        self.assertEqual(lru.get('c'), 3)
+
+    def test_tiered_cache_reads_through_to_shared_tier(self):
+        cache.set('greeting', 'hello')
+        caches['shared'].set('greeting', 'changed elsewhere')
+        # Served from the per-process tier until it expires
+        self.assertEqual(cache.get('greeting'), 'hello')
+
+        cache.clear_local()
+        self.assertEqual(cache.get('greeting'), 'changed elsewhere')
+
+    def test_tiered_cache_returns_copies_from_local_tier(self):
+        cache.set('stats', {'posts': 1})
+        cache.get('stats')['posts'] = 99
+
+        self.assertEqual(cache.get('stats'), {'posts': 1})
+        self.assertIsNot(cache.get('stats'), cache.get('stats'))
+
+    def test_api_cache_key_uses_only_listed_params(self):
+        factory = RequestFactory()
+
+        def get(self, request):
+            pass
+
+        key = api_cache_key(get, factory.get('/api/analytics/top/?window=1h&kind=x'), params=('kind', 'window'))
+        self.assertEqual(
+            key,
+            api_cache_key(get, factory.get('/api/analytics/top/?kind=x&window=1h&_=123&utm_source=mail'), params=('kind', 'window')),
+        )
+        self.assertNotEqual(key, api_cache_key(get, factory.get('/api/analytics/top/?window=2h&kind=x'), params=('kind', 'window')))
+
+    def test_namespaces_are_isolated_and_counted(self):
+        home_cache = get_cache('home')
+        news_cache = get_cache('news')
+        hits, misses = home_cache.hits, home_cache.misses
+
+        home_cache.set('key', 'home value')
+        self.assertIsNone(news_cache.get('key'))
+        self.assertEqual(home_cache.get('key'), 'home value')
+        self.assertIsNone(home_cache.get('other'))
+
+        self.assertEqual((home_cache.hits - hits, home_cache.misses - misses), (1, 1))
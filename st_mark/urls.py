@@ -10,14 +10,19 @@ from search import views as search_views
 from . import views
 from home import views as home_views
 from news import views as news_views
+from analytics import views as analytics_views
 
 urlpatterns = [
     path("django-admin/", admin.site.urls),
     path("admin/", include(wagtailadmin_urls)),
     path("documents/", include(wagtaildocs_urls)),
     path("search/", search_views.search, name="search"),
+    path("api/search/suggest/", search_views.SuggestView.as_view(), name="search-suggest-api"),
+    path("api/search/index-queue/", search_views.SearchIndexQueueView.as_view(), name="search-index-queue-api"),
     path("api/navigation/", views.NavigationLinksView.as_view(), name="navigation-api"),
     path("api/social/stats/", views.SocialStatsView.as_view(), name="social-stats-api"),
+    path("api/cache/stats/", views.CacheStatsView.as_view(), name="cache-stats-api"),
+    path("api/home/bootstrap/", home_views.HomeBootstrapAPIView.as_view(), name="home-bootstrap-api"),
     path("api/hero-content/", home_views.HeroAPIView.as_view(), name="hero-content-api"),
     path("api/hero-navigation/", home_views.HeroAPIView.as_view(), name="hero-navigation-api"),
     path("api/site-info/", home_views.SiteInfoAPIView.as_view(), name="site-info-api"),
@@ -28,9 +33,20 @@ urlpatterns = [
     path("api/events/", home_views.EventsAPIView.as_view(), name="events-api"),
     path("api/gallery/", home_views.GalleryAPIView.as_view(), name="gallery-api"),
     path("api/testimonials/", home_views.TestimonialsAPIView.as_view(), name="testimonials-api"),
+    path("api/blog/posts/", news_views.BlogPostsView.as_view(), name="blog-posts-api"),
+    path("api/blog/tags/", news_views.BlogTagsView.as_view(), name="blog-tags-api"),
     path("api/blog/stats/", news_views.BlogStatsView.as_view(), name="blog-stats-api"),
     path("api/blog/click/", news_views.BlogClickView.as_view(), name="blog-click-api"),
+    path("api/track/batch/", analytics_views.TrackBatchView.as_view(), name="track-batch-api"),
+    path("api/analytics/top/", analytics_views.TopLinksView.as_view(), name="analytics-top-api"),
+    path("api/analytics/ingest/", analytics_views.IngestStatsView.as_view(), name="analytics-ingest-api"),
     path("news/", news_views.redirect_to_news, name="news-redirect"),
+    path("news/tag/<slug:slug>/", news_views.tag_index, name="news-tag"),
+    path("news/archive/<int:year>/", news_views.archive_index, name="news-archive-year"),
+    path("news/archive/<int:year>/<int:month>/", news_views.archive_index, name="news-archive-month"),
+    path("news/feeds/<str:fmt>/", news_views.blog_feed, name="news-feed"),
+    path("news/feeds/<str:fmt>/index/<int:index_id>/", news_views.blog_feed, name="news-index-feed"),
+    path("news/feeds/<str:fmt>/tag/<slug:tag_slug>/", news_views.blog_feed, name="news-tag-feed"),
     path("blogs/", news_views.news_redirect_view, name="blogs-redirect"),
     path("news-redirect/", news_views.news_landing_page, name="news-landing"),
 ]